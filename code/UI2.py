@@ -13,14 +13,25 @@ from collections import deque
 import subprocess
 import sys
 
+# Samples kept for each monitoring graph (one per second)
+GRAPH_WINDOW = 50
+# Fixed x positions of the graph samples; the newest sample is always on the right
+GRAPH_X = np.arange(GRAPH_WINDOW)
+PROGRESS_STEP = 0.5  # Smallest progress bar change worth a Tk redraw
+# Sleep requested by the --gil-monitor probe; any overshoot is time spent waiting for the GIL
+GIL_PROBE_INTERVAL = 0.005
+
 class SystemPerformanceAnalyzer:
-    def __init__(self, root):
+    def __init__(self, root, gil_monitor=False):
         self.root = root
+        self.gil_monitor = gil_monitor
         self.setup_window()
         self.setup_variables()
         self.create_styles()
         self.create_main_interface()
         self.start_monitoring()
+        if self.gil_monitor:
+            threading.Thread(target=self.gil_probe_loop, daemon=True).start()
         
     def setup_window(self):
         """Configure the main window for 13-inch Mac"""
@@ -43,11 +54,18 @@ class SystemPerformanceAnalyzer:
     def setup_variables(self):
         """Initialize monitoring variables"""
         self.monitoring = False
-        self.cpu_data = deque(maxlen=50)
-        self.memory_data = deque(maxlen=50)
-        self.disk_data = deque(maxlen=50)
-        self.network_data = deque(maxlen=50)
-        self.time_data = deque(maxlen=50)
+        self.cpu_data = deque(maxlen=GRAPH_WINDOW)
+        self.memory_data = deque(maxlen=GRAPH_WINDOW)
+        self.disk_data = deque(maxlen=GRAPH_WINDOW)
+        self.network_data = deque(maxlen=GRAPH_WINDOW)
+        self.time_data = deque(maxlen=GRAPH_WINDOW)
+        # Incremented per process list refresh, see update_process_list
+        self.process_list_request = 0
+        # Rows currently shown in the process tree: PID -> (name, values)
+        self.process_rows = {}
+        # Newest monitor sample and whether a UI update for it is queued
+        self.latest_sample = None
+        self.ui_update_pending = False
         
     def create_styles(self):
         """Create modern styling for the application"""
@@ -80,6 +98,19 @@ class SystemPerformanceAnalyzer:
                        relief='flat',
                        borderwidth=1)
         
+        # Metric card styles; fonts resolved once here instead of per label
+        style.configure('CardValue.TLabel',
+                       font=('SF Pro Display', 32, 'bold'),
+                       foreground='#007AFF')
+        
+        style.configure('CardDetails.TLabel',
+                       font=('SF Pro Text', 10),
+                       foreground='#666666')
+        
+        # Team member name style
+        style.configure('Member.TLabel',
+                       font=('SF Pro Text', 11, 'bold'))
+        
         # Button style
         style.configure('Modern.TButton',
                        font=('SF Pro Text', 11),
@@ -124,6 +155,13 @@ class SystemPerformanceAnalyzer:
                               style='Info.TLabel')
         info_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
         
+        # GIL contention readout, only with --gil-monitor
+        if self.gil_monitor:
+            self.gil_label = ttk.Label(header_frame,
+                                      text="GIL wait: measuring...",
+                                      style='Info.TLabel')
+            self.gil_label.grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+        
         # Control buttons
         button_frame = ttk.Frame(header_frame)
         button_frame.grid(row=0, column=1, rowspan=2, sticky=tk.E)
@@ -164,6 +202,9 @@ class SystemPerformanceAnalyzer:
         # Process tab
         self.create_process_tab()
         
+        # Graphs on hidden tabs are not drawn; catch up when one is shown
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+        
     def create_overview_tab(self):
         """Create the overview tab"""
         overview_frame = ttk.Frame(self.notebook, padding="20")
@@ -192,9 +233,7 @@ class SystemPerformanceAnalyzer:
                        padx=10, pady=10)
         
         # Value label
-        value_label = ttk.Label(card_frame, text="0%", 
-                               font=('SF Pro Display', 32, 'bold'),
-                               foreground='#007AFF')
+        value_label = ttk.Label(card_frame, text="0%", style='CardValue.TLabel')
         value_label.grid(row=0, column=0, pady=(0, 10))
         
         # Progress bar
@@ -202,22 +241,28 @@ class SystemPerformanceAnalyzer:
         progress.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
         # Details label
-        details_label = ttk.Label(card_frame, text="", 
-                                 font=('SF Pro Text', 10),
-                                 foreground='#666666')
+        details_label = ttk.Label(card_frame, text="", style='CardDetails.TLabel')
         details_label.grid(row=2, column=0, pady=(10, 0))
         
         return {
             'frame': card_frame,
             'value': value_label,
             'progress': progress,
+            'progress_value': 0,
             'details': details_label
         }
         
+    def set_card_progress(self, card, value):
+        """Move a card's progress bar only when it shifts by a visible amount"""
+        if abs(value - card['progress_value']) >= PROGRESS_STEP:
+            card['progress']['value'] = value
+            card['progress_value'] = value
+        
     def create_cpu_tab(self):
         """Create the CPU monitoring tab"""
         cpu_frame = ttk.Frame(self.notebook, padding="20")
         self.notebook.add(cpu_frame, text="CPU")
+        self.cpu_tab = cpu_frame
         
         # Configure grid
         cpu_frame.columnconfigure(0, weight=1)
@@ -235,6 +280,10 @@ class SystemPerformanceAnalyzer:
             label = ttk.Label(info_frame, text="Loading...")
             label.grid(row=i//2, column=(i%2)*2+1, sticky=tk.W, padx=(0, 30))
             self.cpu_info_labels[item] = label
+            
+        # Core counts never change, so they are read once rather than every tick
+        self.cpu_info_labels['Physical cores'].config(text=str(psutil.cpu_count(logical=False)))
+        self.cpu_info_labels['Logical cores'].config(text=str(psutil.cpu_count(logical=True)))
         
         # CPU graph frame
         graph_frame = ttk.LabelFrame(cpu_frame, text="CPU Usage Over Time", padding="10")
@@ -252,6 +301,7 @@ class SystemPerformanceAnalyzer:
         """Create the memory monitoring tab"""
         memory_frame = ttk.Frame(self.notebook, padding="20")
         self.notebook.add(memory_frame, text="Memory")
+        self.memory_tab = memory_frame
         
         # Configure grid
         memory_frame.columnconfigure(0, weight=1)
@@ -286,6 +336,7 @@ class SystemPerformanceAnalyzer:
         """Create the disk monitoring tab"""
         disk_frame = ttk.Frame(self.notebook, padding="20")
         self.notebook.add(disk_frame, text="Disk")
+        self.disk_tab = disk_frame
         
         # Configure grid
         disk_frame.columnconfigure(0, weight=1)
@@ -328,6 +379,7 @@ class SystemPerformanceAnalyzer:
         """Create the network monitoring tab"""
         network_frame = ttk.Frame(self.notebook, padding="20")
         self.notebook.add(network_frame, text="Network")
+        self.network_tab = network_frame
         
         # Configure grid
         network_frame.columnconfigure(0, weight=1)
@@ -435,7 +487,7 @@ class SystemPerformanceAnalyzer:
             member_frame.grid(row=i+1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
             
             ttk.Label(member_frame, text=f"{role}: {name}", 
-                     font=('SF Pro Text', 11, 'bold')).grid(row=0, column=0, sticky=tk.W)
+                     style='Member.TLabel').grid(row=0, column=0, sticky=tk.W)
             ttk.Label(member_frame, text=f"ID: {student_id} | Email: {email}",
                      style='Info.TLabel').grid(row=1, column=0, sticky=tk.W)
     
@@ -445,8 +497,10 @@ class SystemPerformanceAnalyzer:
         self.cpu_ax.set_ylabel('Usage (%)')
         self.cpu_ax.set_ylim(0, 100)
         self.cpu_ax.grid(True, alpha=0.3)
-        self.cpu_line, = self.cpu_ax.plot([], [], 'b-', linewidth=2, label='CPU Usage')
+        self.setup_time_axis(self.cpu_ax)
+        self.cpu_line, = self.cpu_ax.plot(GRAPH_X, self.graph_values(()), 'b-', linewidth=2, label='CPU Usage')
         self.cpu_ax.legend()
+        self.cpu_blit = BlitManager(self.cpu_canvas, [self.cpu_line])
         
     def setup_memory_graph(self):
         """Setup the memory usage graph"""
@@ -454,8 +508,10 @@ class SystemPerformanceAnalyzer:
         self.memory_ax.set_ylabel('Usage (%)')
         self.memory_ax.set_ylim(0, 100)
         self.memory_ax.grid(True, alpha=0.3)
-        self.memory_line, = self.memory_ax.plot([], [], 'g-', linewidth=2, label='Memory Usage')
+        self.setup_time_axis(self.memory_ax)
+        self.memory_line, = self.memory_ax.plot(GRAPH_X, self.graph_values(()), 'g-', linewidth=2, label='Memory Usage')
         self.memory_ax.legend()
+        self.memory_blit = BlitManager(self.memory_canvas, [self.memory_line])
         
     def setup_disk_graph(self):
         """Setup the disk I/O graph"""
@@ -463,17 +519,36 @@ class SystemPerformanceAnalyzer:
         self.disk_ax.set_ylabel('Usage (%)')
         self.disk_ax.set_ylim(0, 100)
         self.disk_ax.grid(True, alpha=0.3)
-        self.disk_line, = self.disk_ax.plot([], [], 'r-', linewidth=2, label='Disk Usage')
+        self.setup_time_axis(self.disk_ax)
+        self.disk_line, = self.disk_ax.plot(GRAPH_X, self.graph_values(()), 'r-', linewidth=2, label='Disk Usage')
         self.disk_ax.legend()
+        self.disk_blit = BlitManager(self.disk_canvas, [self.disk_line])
         
     def setup_network_graph(self):
         """Setup the network activity graph"""
         self.network_ax.set_title('Network Activity (MB/s)', fontsize=12, fontweight='bold')
         self.network_ax.set_ylabel('Speed (MB/s)')
         self.network_ax.grid(True, alpha=0.3)
-        self.network_sent_line, = self.network_ax.plot([], [], 'b-', linewidth=2, label='Sent')
-        self.network_recv_line, = self.network_ax.plot([], [], 'r-', linewidth=2, label='Received')
+        self.setup_time_axis(self.network_ax)
+        self.network_sent_line, = self.network_ax.plot(GRAPH_X, self.graph_values(()), 'b-', linewidth=2, label='Sent')
+        self.network_recv_line, = self.network_ax.plot(GRAPH_X, self.graph_values(()), 'r-', linewidth=2, label='Received')
         self.network_ax.legend()
+        self.network_blit = BlitManager(self.network_canvas, [self.network_sent_line, self.network_recv_line])
+        
+    def setup_time_axis(self, ax):
+        """Fix a graph's x axis to the sample window, labelled in seconds ago"""
+        ticks = np.arange(GRAPH_WINDOW - 1, -1, -10)
+        ax.set_xlim(0, GRAPH_WINDOW - 1)
+        ax.set_xticks(ticks)
+        ax.set_xticklabels([f"{GRAPH_WINDOW - 1 - tick}s" for tick in ticks])
+        ax.set_xlabel('Seconds ago')
+        
+    def graph_values(self, data):
+        """Right-align a history deque in a window-sized array, NaN (not drawn) where no sample exists yet"""
+        rows = np.array(data, dtype=float)
+        values = np.full((GRAPH_WINDOW,) + rows.shape[1:], np.nan)
+        values[GRAPH_WINDOW - len(rows):] = rows
+        return values
         
     def toggle_monitoring(self):
         """Toggle the monitoring state"""
@@ -537,8 +612,17 @@ class SystemPerformanceAnalyzer:
                 last_net_io = current_net_io
                 last_time = current_time_stamp
                 
-                # Update UI in main thread
-                self.root.after(0, self.update_ui)
+                # Detail tab data, sampled here so the main thread never waits on psutil
+                cpu_freq = psutil.cpu_freq()
+                disk_rows = self.read_disk_partitions()
+                
+                # Update UI in main thread. Only one update is queued at a time; if the
+                # main loop falls behind, it draws the newest sample once instead of
+                # replaying every missed one.
+                self.latest_sample = (memory, disk, current_net_io, cpu_freq, disk_rows)
+                if not self.ui_update_pending:
+                    self.ui_update_pending = True
+                    self.root.after(0, self.flush_ui_update)
                 
                 time.sleep(1)  # Update every 1 second
                 
@@ -546,8 +630,33 @@ class SystemPerformanceAnalyzer:
                 print(f"Monitoring error: {e}")
                 time.sleep(1)
                 
-    def update_ui(self):
-        """Update the user interface with current data"""
+    def gil_probe_loop(self):
+        """Measure how late short sleeps wake up, which grows with GIL contention"""
+        while self.gil_monitor:
+            try:
+                lag = 0.0
+                probes = 0
+                window_end = time.perf_counter() + 1
+                while time.perf_counter() < window_end:
+                    start = time.perf_counter()
+                    time.sleep(GIL_PROBE_INTERVAL)
+                    lag += time.perf_counter() - start - GIL_PROBE_INTERVAL
+                    probes += 1
+                
+                text = f"GIL wait: {lag / probes * 1000:.2f} ms per wakeup ({lag * 100:.1f}% of the last second)"
+                self.root.after(0, lambda text=text: self.gil_label.config(text=text))
+            
+            except Exception as e:
+                print(f"GIL monitor error: {e}")
+                time.sleep(1)
+        
+    def flush_ui_update(self):
+        """Apply the newest sample posted by the monitor thread"""
+        self.ui_update_pending = False
+        self.update_ui(*self.latest_sample)
+        
+    def update_ui(self, memory, disk, net_io, cpu_freq, disk_rows):
+        """Update the user interface with data sampled by the monitor thread"""
         if not self.cpu_data or not self.memory_data or not self.disk_data:
             return
             
@@ -559,19 +668,17 @@ class SystemPerformanceAnalyzer:
             
             # CPU card
             self.cpu_card['value'].config(text=f"{cpu_current:.1f}%")
-            self.cpu_card['progress']['value'] = cpu_current
+            self.set_card_progress(self.cpu_card, cpu_current)
             self.cpu_card['details'].config(text=f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
             
             # Memory card
-            memory = psutil.virtual_memory()
             self.memory_card['value'].config(text=f"{memory.percent:.1f}%")
-            self.memory_card['progress']['value'] = memory.percent
+            self.set_card_progress(self.memory_card, memory.percent)
             self.memory_card['details'].config(text=f"Used: {self.format_bytes(memory.used)} / {self.format_bytes(memory.total)}")
             
             # Disk card
-            disk = psutil.disk_usage('/')
             self.disk_card['value'].config(text=f"{disk_current:.1f}%")
-            self.disk_card['progress']['value'] = disk_current
+            self.set_card_progress(self.disk_card, disk_current)
             self.disk_card['details'].config(text=f"Used: {self.format_bytes(disk.used)} / {self.format_bytes(disk.total)}")
             
             # Network card
@@ -579,14 +686,14 @@ class SystemPerformanceAnalyzer:
                 sent, recv = self.network_data[-1]
                 total_speed = sent + recv
                 self.network_card['value'].config(text=f"{total_speed:.2f} MB/s")
-                self.network_card['progress']['value'] = min(total_speed * 10, 100)  # Scale for visualization
+                self.set_card_progress(self.network_card, min(total_speed * 10, 100))  # Scale for visualization
                 self.network_card['details'].config(text=f"↑ {sent:.2f} MB/s | ↓ {recv:.2f} MB/s")
             
             # Update graphs
             self.update_graphs()
             
             # Update detailed info
-            self.update_detailed_info()
+            self.update_detailed_info(memory, net_io, cpu_freq, disk_rows)
             
         except Exception as e:
             print(f"UI update error: {e}")
@@ -594,66 +701,78 @@ class SystemPerformanceAnalyzer:
     def update_graphs(self):
         """Update all graphs with current data"""
         try:
+            # Only the graph on the selected tab is drawn
+            current_tab = self.notebook.select()
+            
             # CPU graph
-            if len(self.cpu_data) > 1:
-                self.cpu_line.set_data(range(len(self.cpu_data)), list(self.cpu_data))
-                self.cpu_ax.set_xlim(0, max(len(self.cpu_data)-1, 10))
-                self.cpu_canvas.draw_idle()
+            if len(self.cpu_data) > 1 and current_tab == str(self.cpu_tab):
+                self.cpu_line.set_ydata(self.graph_values(self.cpu_data))
+                self.redraw_graph(self.cpu_ax, self.cpu_blit)
             
             # Memory graph
-            if len(self.memory_data) > 1:
-                self.memory_line.set_data(range(len(self.memory_data)), list(self.memory_data))
-                self.memory_ax.set_xlim(0, max(len(self.memory_data)-1, 10))
-                self.memory_canvas.draw_idle()
+            if len(self.memory_data) > 1 and current_tab == str(self.memory_tab):
+                self.memory_line.set_ydata(self.graph_values(self.memory_data))
+                self.redraw_graph(self.memory_ax, self.memory_blit)
             
             # Disk graph
-            if len(self.disk_data) > 1:
-                self.disk_line.set_data(range(len(self.disk_data)), list(self.disk_data))
-                self.disk_ax.set_xlim(0, max(len(self.disk_data)-1, 10))
-                self.disk_canvas.draw_idle()
+            if len(self.disk_data) > 1 and current_tab == str(self.disk_tab):
+                self.disk_line.set_ydata(self.graph_values(self.disk_data))
+                self.redraw_graph(self.disk_ax, self.disk_blit)
             
             # Network graph
-            if len(self.network_data) > 1:
-                sent_data = [item[0] for item in self.network_data]
-                recv_data = [item[1] for item in self.network_data]
+            if len(self.network_data) > 1 and current_tab == str(self.network_tab):
+                # One row per sample: (sent, received)
+                rates = self.graph_values(self.network_data)
                 
-                self.network_sent_line.set_data(range(len(sent_data)), sent_data)
-                self.network_recv_line.set_data(range(len(recv_data)), recv_data)
-                self.network_ax.set_xlim(0, max(len(self.network_data)-1, 10))
+                self.network_sent_line.set_ydata(rates[:, 0])
+                self.network_recv_line.set_ydata(rates[:, 1])
                 
                 # Auto-scale y-axis for network
-                max_val = max(max(sent_data), max(recv_data)) if sent_data and recv_data else 1
-                self.network_ax.set_ylim(0, max(max_val * 1.1, 1))
-                self.network_canvas.draw_idle()
+                max_val = np.nanmax(rates)
+                self.redraw_graph(self.network_ax, self.network_blit, (0, max(max_val * 1.1, 1)))
                 
         except Exception as e:
             print(f"Graph update error: {e}")
+        
+    def on_tab_changed(self, event):
+        """Bring the newly selected tab's graph and details up to date"""
+        self.update_graphs()
+        if self.latest_sample:
+            memory, disk, net_io, cpu_freq, disk_rows = self.latest_sample
+            self.update_detailed_info(memory, net_io, cpu_freq, disk_rows)
+        
+    def redraw_graph(self, ax, blit, ylim=None):
+        """Blit a graph's lines, falling back to a full redraw when its y limits change"""
+        if ylim is not None and tuple(ax.get_ylim()) != ylim:
+            ax.set_ylim(*ylim)
+            blit.invalidate()
+        else:
+            blit.update()
             
-    def update_detailed_info(self):
-        """Update detailed information in tabs"""
+    def update_detailed_info(self, memory, net_io, cpu_freq, disk_rows):
+        """Update detailed information on the selected tab"""
         try:
+            # Hidden tabs are brought up to date by on_tab_changed when shown
+            current_tab = self.notebook.select()
+            
             # CPU info
-            cpu_freq = psutil.cpu_freq()
-            if hasattr(self, 'cpu_info_labels'):
-                self.cpu_info_labels['Physical cores'].config(text=str(psutil.cpu_count(logical=False)))
-                self.cpu_info_labels['Logical cores'].config(text=str(psutil.cpu_count(logical=True)))
+            if current_tab == str(self.cpu_tab):
                 self.cpu_info_labels['Current frequency'].config(text=f"{cpu_freq.current:.2f} MHz" if cpu_freq else "N/A")
                 self.cpu_info_labels['Max frequency'].config(text=f"{cpu_freq.max:.2f} MHz" if cpu_freq else "N/A")
             
             # Memory info
-            memory = psutil.virtual_memory()
-            if hasattr(self, 'memory_info_labels'):
+            if current_tab == str(self.memory_tab):
                 self.memory_info_labels['Total'].config(text=self.format_bytes(memory.total))
                 self.memory_info_labels['Available'].config(text=self.format_bytes(memory.available))
                 self.memory_info_labels['Used'].config(text=self.format_bytes(memory.used))
                 self.memory_info_labels['Percentage'].config(text=f"{memory.percent:.1f}%")
             
             # Disk info
-            self.update_disk_info()
+            if current_tab == str(self.disk_tab):
+                self.update_disk_info(disk_rows)
             
             # Network info
-            net_io = psutil.net_io_counters()
-            if hasattr(self, 'network_info_labels'):
+            if current_tab == str(self.network_tab):
                 self.network_info_labels['Bytes sent'].config(text=self.format_bytes(net_io.bytes_sent))
                 self.network_info_labels['Bytes received'].config(text=self.format_bytes(net_io.bytes_recv))
                 self.network_info_labels['Packets sent'].config(text=f"{net_io.packets_sent:,}")
@@ -662,71 +781,109 @@ class SystemPerformanceAnalyzer:
         except Exception as e:
             print(f"Detailed info update error: {e}")
             
-    def update_disk_info(self):
+    def read_disk_partitions(self):
+        """Read usage rows (device text, column values) for every disk partition"""
+        rows = []
+        
+        for partition in psutil.disk_partitions():
+            try:
+                disk_usage = psutil.disk_usage(partition.mountpoint)
+                
+                total = self.format_bytes(disk_usage.total)
+                used = self.format_bytes(disk_usage.used)
+                free = self.format_bytes(disk_usage.free)
+                percent = f"{(disk_usage.used / disk_usage.total) * 100:.1f}%"
+                
+                rows.append((f"{partition.device} ({partition.fstype})", (total, used, free, percent)))
+            
+            except PermissionError:
+                # Some partitions may not be accessible
+                rows.append((f"{partition.device} (Access Denied)", ("N/A", "N/A", "N/A", "N/A")))
+        
+        return rows
+        
+    def update_disk_info(self, disk_rows):
         """Update disk information"""
         try:
             # Clear existing items
             for item in self.disk_tree.get_children():
                 self.disk_tree.delete(item)
             
-            # Get disk partitions
-            partitions = psutil.disk_partitions()
-            
-            for partition in partitions:
-                try:
-                    disk_usage = psutil.disk_usage(partition.mountpoint)
-                    
-                    total = self.format_bytes(disk_usage.total)
-                    used = self.format_bytes(disk_usage.used)
-                    free = self.format_bytes(disk_usage.free)
-                    percent = f"{(disk_usage.used / disk_usage.total) * 100:.1f}%"
-                    
-                    # Insert into treeview
-                    self.disk_tree.insert('', 'end', 
-                                         text=f"{partition.device} ({partition.fstype})",
-                                         values=(total, used, free, percent))
-                                         
-                except PermissionError:
-                    # Some partitions may not be accessible
-                    self.disk_tree.insert('', 'end',
-                                         text=f"{partition.device} (Access Denied)",
-                                         values=("N/A", "N/A", "N/A", "N/A"))
+            # Insert into treeview
+            for text, values in disk_rows:
+                self.disk_tree.insert('', 'end', text=text, values=values)
                                          
         except Exception as e:
             print(f"Disk info update error: {e}")
             
     def update_process_list(self, event=None):
-        """Update the process list"""
+        """Update the process list, enumerating processes on a worker thread"""
+        # Only the newest request is shown if several loads overlap
+        self.process_list_request += 1
+        threading.Thread(target=self.load_process_list,
+                         args=(self.process_list_request, self.sort_var.get()),
+                         daemon=True).start()
+        
+    def load_process_list(self, request, sort_key):
+        """Collect and sort the top 50 processes off the main thread"""
         try:
-            # Clear existing items
-            for item in self.process_tree.get_children():
-                self.process_tree.delete(item)
-            
-            # Get all processes
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
-                try:
-                    processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    pass
+            # process_iter reuses its cached Process objects, so cpu_percent is
+            # measured since the previous refresh without blocking; exited
+            # processes are skipped and denied fields come back as None
+            processes = [
+                proc.info for proc in psutil.process_iter(
+                    ['pid', 'name', 'cpu_percent', 'memory_percent', 'status'], ad_value=None)
+            ]
             
             # Sort processes
-            sort_key = self.sort_var.get()
             if sort_key in ['cpu_percent', 'memory_percent']:
                 processes.sort(key=lambda x: x[sort_key] or 0, reverse=True)
             else:
                 processes.sort(key=lambda x: x[sort_key] or "")
             
-            # Insert top 50 processes
-            for proc in processes[:50]:
-                self.process_tree.insert('', 'end',
-                                        text=proc['name'] or "Unknown",
-                                        values=(
-                                            proc['pid'],
-                                            f"{proc['cpu_percent'] or 0:.1f}%",
-                                            f"{proc['memory_percent'] or 0:.1f}%",
-                                            proc['status'] or "Unknown"
-                                        ))
+            self.root.after(0, self.show_process_list, request, processes[:50])
+                                        
+        except Exception as e:
+            print(f"Process list update error: {e}")
+            
+    def show_process_list(self, request, processes):
+        """Replace the process tree rows with a loaded snapshot"""
+        if request != self.process_list_request:
+            return
+            
+        try:
+            # Rows keyed by PID in display order
+            rows = {
+                str(proc['pid']): (proc['name'] or "Unknown", (
+                    proc['pid'],
+                    f"{proc['cpu_percent'] or 0:.1f}%",
+                    f"{proc['memory_percent'] or 0:.1f}%",
+                    proc['status'] or "Unknown"
+                ))
+                for proc in processes
+            }
+            
+            # Apply only the difference: drop exited processes, then update,
+            # move or insert the rest so unchanged rows cost no Tk calls
+            stale = [iid for iid in self.process_tree.get_children() if iid not in rows]
+            if stale:
+                self.process_tree.delete(*stale)
+            
+            order = list(self.process_tree.get_children())
+            for index, (iid, row) in enumerate(rows.items()):
+                text, values = row
+                if iid in self.process_rows:
+                    if self.process_rows[iid] != row:
+                        self.process_tree.item(iid, text=text, values=values)
+                    if order[index] != iid:
+                        self.process_tree.move(iid, '', index)
+                        order.remove(iid)
+                        order.insert(index, iid)
+                else:
+                    self.process_tree.insert('', index, iid=iid, text=text, values=values)
+                    order.insert(index, iid)
+            
+            self.process_rows = rows
                                         
         except Exception as e:
             print(f"Process list update error: {e}")
@@ -740,17 +897,17 @@ class SystemPerformanceAnalyzer:
             disk = psutil.disk_usage('/')
             
             self.cpu_card['value'].config(text=f"{cpu_percent:.1f}%")
-            self.cpu_card['progress']['value'] = cpu_percent
+            self.set_card_progress(self.cpu_card, cpu_percent)
             
             self.memory_card['value'].config(text=f"{memory.percent:.1f}%")
-            self.memory_card['progress']['value'] = memory.percent
+            self.set_card_progress(self.memory_card, memory.percent)
             
             disk_percent = (disk.used / disk.total) * 100
             self.disk_card['value'].config(text=f"{disk_percent:.1f}%")
-            self.disk_card['progress']['value'] = disk_percent
+            self.set_card_progress(self.disk_card, disk_percent)
             
             # Update detailed info
-            self.update_detailed_info()
+            self.update_detailed_info(memory, psutil.net_io_counters(), psutil.cpu_freq(), self.read_disk_partitions())
             
             # Update process list
             self.update_process_list()
@@ -783,11 +940,51 @@ class SystemPerformanceAnalyzer:
     def on_closing(self):
         """Handle application closing"""
         self.monitoring = False
+        self.gil_monitor = False
         if hasattr(self, 'monitor_thread') and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=1.0)
         self.root.destroy()
 
 
+class BlitManager:
+    """Redraw animated artists over a cached copy of a canvas's static background"""
+    def __init__(self, canvas, artists):
+        self.canvas = canvas
+        self.artists = artists
+        self.background = None
+        
+        for artist in artists:
+            artist.set_animated(True)
+        
+        # Every full draw (first show, resize, limit change) refreshes the background
+        canvas.mpl_connect('draw_event', self.on_draw)
+        
+    def on_draw(self, event):
+        """Cache the freshly drawn background and put the artists back on top"""
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.draw_artists()
+        
+    def draw_artists(self):
+        """Render the animated artists onto the canvas buffer"""
+        for artist in self.artists:
+            self.canvas.figure.draw_artist(artist)
+        
+    def invalidate(self):
+        """Schedule a full redraw after the static background changed"""
+        self.background = None
+        self.canvas.draw_idle()
+        
+    def update(self):
+        """Show the artists' current state, blitting only the changed pixels"""
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+        
+        self.canvas.restore_region(self.background)
+        self.draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+
 class ModernButton(tk.Canvas):
     """Custom modern button widget"""
     def __init__(self, parent, text="", command=None, bg_color="#007AFF", 
@@ -865,7 +1062,7 @@ def main():
             pass
     
     # Create application
-    app = SystemPerformanceAnalyzer(root)
+    app = SystemPerformanceAnalyzer(root, gil_monitor='--gil-monitor' in sys.argv)
     
     # Handle window closing
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
@@ -1,24 +1,35 @@
 import tkinter as tk
+import tkinter.messagebox as messagebox
+import tkinter.filedialog as filedialog
 import customtkinter as ctk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.animation import FuncAnimation
 import psutil
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 import time
+import math
 import json
 import os
 from datetime import datetime, timedelta
 import numpy as np
-from collections import deque
+from collections import deque, Counter
+from functools import partial, lru_cache
 import webbrowser
 import csv
 import sqlite3
 import platform
 import subprocess
 import sys
+import importlib.util
 import gc
+import heapq
 import socket
+import mmap
+import re
 
 # Try to import additional libraries
 try:
@@ -37,10 +48,152 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Set appearance mode and color theme
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
+# Theory tab documentation, kept out of the module so it is only read on demand
+THEORY_CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "theory_content.txt")
+
+@lru_cache(maxsize=1)
+def load_theory_content():
+    """Read the Theory tab documentation through a read-only memory map"""
+    with open(THEORY_CONTENT_PATH, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode('utf-8')
+
+@lru_cache(maxsize=32)
+def _font(size, weight="normal"):
+    """Return a shared CTkFont so identical fonts are only built once"""
+    return ctk.CTkFont(size=size, weight=weight)
+
+def cpu_integer_kernel(n):
+    """Sum-of-squares loop timed by the CPU integer benchmark"""
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+def cpu_float_kernel(n):
+    """Square root times sine loop timed by the CPU floating point benchmark"""
+    total = 0.0
+    for i in range(n):
+        total += math.sqrt(i) * math.sin(i)
+    return total
+
+def cpu_integer_kernel_numpy(n):
+    """Vectorised sum of squares"""
+    values = np.arange(n, dtype=np.int64)
+    return int((values * values).sum())
+
+def cpu_float_kernel_numpy(n):
+    """Vectorised square root times sine sum"""
+    values = np.arange(n, dtype=np.float64)
+    return float((np.sqrt(values) * np.sin(values)).sum())
+
+# Interpreter the Python kernels run on; PyPy and the CPython JIT (3.13+)
+# speed these plain loops up, so it is reported next to the results
+PYTHON_RUNTIME = f"{platform.python_implementation()} {platform.python_version()}"
+if getattr(sys, '_jit', None) is not None and sys._jit.is_enabled():
+    PYTHON_RUNTIME += " (JIT)"
+
+# CPU benchmark kernels by name: (integer kernel, floating point kernel).
+# "Python" times the interpreter itself; "NumPy" and "Numba" time the same
+# arithmetic as vectorised and compiled code.
+BENCHMARK_KERNELS = {
+    "Python": (cpu_integer_kernel, cpu_float_kernel),
+    "NumPy": (cpu_integer_kernel_numpy, cpu_float_kernel_numpy)
+}
+# Kernels that release the GIL, so threads already run them in parallel
+GIL_RELEASING_KERNELS = {"NumPy"}
+if NUMBA_AVAILABLE:
+    BENCHMARK_KERNELS["Numba"] = (njit(cache=True)(cpu_integer_kernel), njit(cache=True)(cpu_float_kernel))
+
+# Shared pack() options for the settings tab builders. Controls are packed
+# straight into their section frame, so the item padding includes the 15px
+# the old per-setting wrapper frames used to add.
+_ITEM_PADX = 35
+_PACK_SECTION = {'fill': 'x', 'pady': 10}
+_PACK_TITLE = {'pady': (15, 10)}
+_PACK_LABEL = {'anchor': 'w', 'padx': _ITEM_PADX, 'pady': 5}
+
+# Section headers for the settings tab
+_SETTINGS_TITLE = "⚙️ Advanced Settings & Configuration"
+_APPEARANCE_TITLE = "🎨 Appearance Settings"
+_PERFORMANCE_TITLE = "📊 Performance Monitoring Settings"
+_ALERTS_TITLE = "🚨 Alert Thresholds"
+_NOTIFICATIONS_TITLE = "🔔 Notification Settings"
+
+# Analytics time ranges in seconds; anything else falls back to the last month
+ANALYTICS_RANGES = {
+    "Last Hour": 3600,
+    "Last 24 Hours": 86400,
+    "Last Week": 604800
+}
+LAST_MONTH_SECONDS = 2592000
+
+# Pattern analysis rules: (value, threshold, suggestion), checked in order
+PATTERN_SUGGESTION_RULES = (
+    ("cpu", 70, "🔥 High average CPU usage ({:.1f}%). Consider closing unnecessary applications or upgrading hardware."),
+    ("cpu_trend", 10, "📈 CPU usage trending upward. Monitor for runaway processes or consider system restart."),
+    ("memory", 80, "💾 High memory usage ({:.1f}%). Consider closing memory-intensive applications."),
+    ("memory_trend", 15, "📊 Memory usage increasing rapidly. Possible memory leak detected."),
+    ("disk", 85, "💽 Disk space critical ({:.1f}%). Run disk cleanup or free up space."),
+    ("network", 50, "🌐 High network activity ({:.1f} MB/s). Monitor for bandwidth-intensive applications."),
+    ("temperature", 75, "🌡️ High system temperature ({:.1f}°C). Check cooling system.")
+)
+
+# Byte size units
+MB = 1 << 20
+GB = 1 << 30
+
+# Disk benchmark scratch file and the size written in a single call
+DISK_BENCHMARK_FILE = "benchmark_test.tmp"
+DISK_BENCHMARK_BYTES = 10 * MB
+
+# Performance history ring buffer: one float64 row per sample, newest rows
+# overwrite the oldest. Columns follow the performance_logs insert order.
+HISTORY_SIZE = 1000
+H_TIME, H_CPU, H_MEMORY, H_DISK, H_NETWORK, H_TEMP = range(6)
+# Minimum seconds between manual refreshes of the System Info text
+SYSTEM_INFO_REFRESH_SECONDS = 2
+# Newest history rows drawn on the dashboard charts, and their x positions
+CHART_POINTS = 100
+CHART_X = np.arange(CHART_POINTS)
+
+PERFORMANCE_LOG_INSERT = '''
+    INSERT INTO performance_logs 
+    (timestamp, cpu_usage, memory_usage, disk_usage, network_usage, temperature)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+@lru_cache(maxsize=HISTORY_SIZE)
+def format_timestamp(timestamp):
+    """Format a sample timestamp, caching it because history rows are redrawn and exported repeatedly"""
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
+# Label factories for the help tab's repeated rows. Fonts are passed per call
+# because CTkFont needs a Tk root, which does not exist at import time.
+_FAQ_QUESTION_LABEL = partial(ctk.CTkLabel, anchor='w')
+_FAQ_ANSWER_LABEL = partial(ctk.CTkLabel, anchor='w', wraplength=700, justify='left')
+_TROUBLESHOOTING_LABEL = partial(ctk.CTkLabel, anchor='w', wraplength=800)
+
+# Tabs whose static content is only built the first time they are opened
+_DASHBOARD_TAB = "📊 Dashboard"
+_TEAM_TAB = "👥 Team Info"
+_HELP_TAB = "❓ Help"
+
+# Sensor labels that identify a CPU temperature reading
+CPU_SENSOR_PATTERN = re.compile(r'cpu|core|processor', re.IGNORECASE)
+# Monitoring ticks between full temperature sensor rediscovery passes
+TEMP_SENSOR_REPROBE_TICKS = 600
+
 class SystemPerformanceAnalyzer:
     def __init__(self, root):
         self.root = root
@@ -79,13 +232,15 @@ class SystemPerformanceAnalyzer:
         self.current_theme = 'light'
         self.colors = self.themes[self.current_theme]
         
-        # Enhanced performance data storage
-        self.cpu_data = deque(maxlen=100)
-        self.memory_data = deque(maxlen=100)
-        self.disk_data = deque(maxlen=100)
-        self.network_data = deque(maxlen=100)
-        self.temperature_data = deque(maxlen=100)
-        self.time_data = deque(maxlen=100)
+        # Enhanced performance data storage; samples live in performance_history
+        # (sensor group, index) of the CPU temperature sensor, found on first probe
+        self.temp_sensor_key = None
+        self.temp_probe_ticks = 0
+        # Last text shown on each metric card label, see set_card_text
+        self.card_texts = {}
+        self.last_alert_text = None
+        # Alert kinds already shown as a popup during the current alert episode
+        self.recent_alert_kinds = deque(maxlen=8)
         
         # Advanced settings
         self.refresh_rate = 1000
@@ -99,9 +254,14 @@ class SystemPerformanceAnalyzer:
             'disk': 90,
             'temperature': 80
         }
+        # settings.json contents as last read or written, see save_settings
+        self.saved_settings_text = None
+        # Monotonic time of the last manual system info refresh
+        self.system_info_refreshed = float('-inf')
         
         # AI and analytics data
-        self.performance_history = []
+        self.performance_history = np.zeros((HISTORY_SIZE, 6), dtype=np.float64)
+        self.history_count = 0  # Samples written so far, including overwritten ones
         self.optimization_suggestions = []
         self.system_health_score = 100
         self.benchmark_results = {}
@@ -115,8 +275,14 @@ class SystemPerformanceAnalyzer:
         # Monitoring flags
         self.monitoring = True
         self.benchmark_running = False
+        self.benchmark_pool = None
+        self.benchmark_threads = None
         
         self.setup_ui()
+        # Keep the long-lived widget tree out of later garbage collection sweeps;
+        # collect first so setup garbage held only by cycles is freed, not frozen
+        gc.collect()
+        gc.freeze()
         self.start_monitoring()
         self.load_settings()
         
@@ -125,13 +291,16 @@ class SystemPerformanceAnalyzer:
         try:
             self.db_path = "performance_data.db"
             self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # WAL with NORMAL sync keeps batched inserts from waiting on a full fsync each commit
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
             cursor = self.conn.cursor()
             
             # Create tables
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS performance_logs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp DATETIME,
+                    timestamp REAL,
                     cpu_usage REAL,
                     memory_usage REAL,
                     disk_usage REAL,
@@ -161,6 +330,9 @@ class SystemPerformanceAnalyzer:
             ''')
             
             self.conn.commit()
+            
+            # Reused by the batched performance log writer
+            self.log_cursor = self.conn.cursor()
         except Exception as e:
             print(f"Database initialization error: {e}")
             
@@ -198,14 +370,14 @@ class SystemPerformanceAnalyzer:
         title_label = ctk.CTkLabel(
             title_frame,
             text="🚀 System Performance Analyzer & Optimizer v2.0",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=_font(22, "bold")
         )
         title_label.pack(pady=10)
         
         subtitle_label = ctk.CTkLabel(
             title_frame,
             text=f"Developed by Architechs Team - SE(OS)-VI-T250 | {self.system_info['hostname']}",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         subtitle_label.pack(pady=(0, 10))
         
@@ -216,24 +388,26 @@ class SystemPerformanceAnalyzer:
         self.health_label = ctk.CTkLabel(
             self.health_frame,
             text=f"🎯 System Health Score: {self.system_health_score}%",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         self.health_label.pack(pady=5)
         
         # Create enhanced tabview
-        self.notebook = ctk.CTkTabview(self.root)
+        self.notebook = ctk.CTkTabview(self.root, command=self.on_tab_changed)
         self.notebook.pack(fill='both', expand=True, padx=20, pady=10)
+        # Charts are not drawn while minimised; catch up when the window is restored
+        self.root.bind('<Map>', self.on_window_mapped, add='+')
         
         # Create tabs
-        self.dashboard_tab = self.notebook.add("📊 Dashboard")
+        self.dashboard_tab = self.notebook.add(_DASHBOARD_TAB)
         self.ai_tab = self.notebook.add("🤖 AI Optimizer")
         self.analytics_tab = self.notebook.add("📈 Analytics")
         self.benchmark_tab = self.notebook.add("⚡ Benchmark")
         self.system_tab = self.notebook.add("💻 System Info")
         self.settings_tab = self.notebook.add("⚙️ Settings")
         self.theory_tab = self.notebook.add("📚 Theory")
-        self.team_tab = self.notebook.add("👥 Team Info")
-        self.help_tab = self.notebook.add("❓ Help")
+        self.team_tab = self.notebook.add(_TEAM_TAB)
+        self.help_tab = self.notebook.add(_HELP_TAB)
         
         # Create content for each tab
         self.create_dashboard_content()
@@ -243,8 +417,26 @@ class SystemPerformanceAnalyzer:
         self.create_system_info_content()
         self.create_settings_content()
         self.create_theory_content()
-        self.create_team_info_content()
-        self.create_help_content()
+        self.lazy_tab_builders = {
+            _TEAM_TAB: self.create_team_info_content,
+            _HELP_TAB: self.create_help_content
+        }
+        
+    def on_tab_changed(self):
+        """Build a static tab's widgets the first time it is selected and bring the charts up to date"""
+        builder = self.lazy_tab_builders.pop(self.notebook.get(), None)
+        if builder:
+            builder()
+        
+        # The charts are not drawn while another tab is shown
+        if self.notebook.get() == _DASHBOARD_TAB:
+            self.update_enhanced_charts()
+        
+    def on_window_mapped(self, event):
+        """Redraw the charts skipped while the window was minimised"""
+        # <Map> on the root also fires for every child widget that is mapped
+        if event.widget is self.root:
+            self.update_enhanced_charts()
         
     def create_dashboard_content(self):
         """Create enhanced performance dashboard"""
@@ -264,14 +456,14 @@ class SystemPerformanceAnalyzer:
         alerts_title = ctk.CTkLabel(
             alerts_frame,
             text="🚨 Real-time Alerts",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         alerts_title.pack(pady=(15, 10))
         
         self.alerts_textbox = ctk.CTkTextbox(
             alerts_frame,
             height=80,
-            font=ctk.CTkFont(size=11)
+            font=_font(11)
         )
         self.alerts_textbox.pack(fill='x', padx=15, pady=(0, 15))
         
@@ -296,12 +488,12 @@ class SystemPerformanceAnalyzer:
         cpu_frame.grid(row=0, column=0, padx=8, pady=10, sticky='ew')
         
         ctk.CTkLabel(cpu_frame, text="🔥 CPU Usage", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(10, 5))
+                    font=_font(14, "bold")).pack(pady=(10, 5))
         self.cpu_value_label = ctk.CTkLabel(cpu_frame, text="0%", 
-                                          font=ctk.CTkFont(size=18, weight="bold"))
+                                          font=_font(18, "bold"))
         self.cpu_value_label.pack()
         self.cpu_temp_label = ctk.CTkLabel(cpu_frame, text="Temp: N/A", 
-                                         font=ctk.CTkFont(size=10))
+                                         font=_font(10))
         self.cpu_temp_label.pack(pady=(0, 10))
         
         # Memory Card with available memory
@@ -309,12 +501,12 @@ class SystemPerformanceAnalyzer:
         memory_frame.grid(row=0, column=1, padx=8, pady=10, sticky='ew')
         
         ctk.CTkLabel(memory_frame, text="💾 Memory", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(10, 5))
+                    font=_font(14, "bold")).pack(pady=(10, 5))
         self.memory_value_label = ctk.CTkLabel(memory_frame, text="0%", 
-                                             font=ctk.CTkFont(size=18, weight="bold"))
+                                             font=_font(18, "bold"))
         self.memory_value_label.pack()
         self.memory_available_label = ctk.CTkLabel(memory_frame, text="Available: 0 GB", 
-                                                 font=ctk.CTkFont(size=10))
+                                                 font=_font(10))
         self.memory_available_label.pack(pady=(0, 10))
         
         # Disk Card with read/write speeds
@@ -322,12 +514,12 @@ class SystemPerformanceAnalyzer:
         disk_frame.grid(row=0, column=2, padx=8, pady=10, sticky='ew')
         
         ctk.CTkLabel(disk_frame, text="💽 Disk", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(10, 5))
+                    font=_font(14, "bold")).pack(pady=(10, 5))
         self.disk_value_label = ctk.CTkLabel(disk_frame, text="0%", 
-                                           font=ctk.CTkFont(size=18, weight="bold"))
+                                           font=_font(18, "bold"))
         self.disk_value_label.pack()
         self.disk_io_label = ctk.CTkLabel(disk_frame, text="I/O: 0 MB/s", 
-                                        font=ctk.CTkFont(size=10))
+                                        font=_font(10))
         self.disk_io_label.pack(pady=(0, 10))
         
         # Network Card with upload/download
@@ -335,12 +527,12 @@ class SystemPerformanceAnalyzer:
         network_frame.grid(row=0, column=3, padx=8, pady=10, sticky='ew')
         
         ctk.CTkLabel(network_frame, text="🌐 Network", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(10, 5))
+                    font=_font(14, "bold")).pack(pady=(10, 5))
         self.network_value_label = ctk.CTkLabel(network_frame, text="0 MB/s", 
-                                              font=ctk.CTkFont(size=18, weight="bold"))
+                                              font=_font(18, "bold"))
         self.network_value_label.pack()
         self.network_detail_label = ctk.CTkLabel(network_frame, text="↑0 ↓0 MB/s", 
-                                                font=ctk.CTkFont(size=10))
+                                                font=_font(10))
         self.network_detail_label.pack(pady=(0, 10))
         
         # System Health Card
@@ -348,19 +540,18 @@ class SystemPerformanceAnalyzer:
         health_frame.grid(row=0, column=4, padx=8, pady=10, sticky='ew')
         
         ctk.CTkLabel(health_frame, text="🎯 Health", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(10, 5))
+                    font=_font(14, "bold")).pack(pady=(10, 5))
         self.health_value_label = ctk.CTkLabel(health_frame, text="100%", 
-                                             font=ctk.CTkFont(size=18, weight="bold"))
+                                             font=_font(18, "bold"))
         self.health_value_label.pack()
         self.uptime_label = ctk.CTkLabel(health_frame, text="Uptime: 0h", 
-                                       font=ctk.CTkFont(size=10))
+                                       font=_font(10))
         self.uptime_label.pack(pady=(0, 10))
         
     def create_enhanced_charts(self, parent):
         """Create enhanced performance charts with much smaller size for clarity"""
         # Much smaller figure size for 13-inch screen clarity
         self.fig, axes = plt.subplots(2, 3, figsize=(8, 4.5))  # Significantly reduced from (10, 6)
-        self.fig.patch.set_facecolor('#f0f0f0')
         
         # Tighter spacing for compact display
         self.fig.subplots_adjust(
@@ -383,17 +574,39 @@ class SystemPerformanceAnalyzer:
             ax.set_title(title, fontsize=9, fontweight='bold', pad=5)  # Smaller fonts
             ax.set_ylabel(ylabel, fontsize=8)
             ax.tick_params(labelsize=7)  # Very small tick labels
-            ax.set_facecolor('#ffffff')
             ax.grid(True, alpha=0.3, linewidth=0.5)
+        for ax in (self.ax1, self.ax2, self.ax3, self.ax6):
+            ax.set_ylim(0, 100)
+        
+        # Line artists are created once; update_enhanced_charts only replaces their data
+        self.temp_line, = self.ax5.plot([], [], linewidth=2)
+        self.chart_lines = [
+            (self.ax1.plot([], [], linewidth=2)[0], H_CPU, 'accent'),
+            (self.ax2.plot([], [], linewidth=2)[0], H_MEMORY, 'secondary'),
+            (self.ax3.plot([], [], linewidth=2)[0], H_DISK, 'warning'),
+            (self.ax4.plot([], [], linewidth=2)[0], H_NETWORK, 'danger'),
+            (self.temp_line, H_TEMP, 'info')
+        ]
+        self.health_line, = self.ax6.plot([], [], linewidth=3)
+        self.temp_unavailable_text = self.ax5.text(
+            0.5, 0.5, 'Temperature\nNot Available',
+            horizontalalignment='center', verticalalignment='center',
+            transform=self.ax5.transAxes, fontsize=9
+        )
+        self.style_enhanced_charts()
         
         self.canvas = FigureCanvasTkAgg(self.fig, parent)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
         
-        self.animation = FuncAnimation(
-            self.fig, self.update_enhanced_charts, interval=self.refresh_rate, blit=False
-        )
-
+    def style_enhanced_charts(self):
+        """Apply the current theme colours to the dashboard charts"""
+        for line, _, color_key in self.chart_lines:
+            line.set_color(self.colors[color_key])
+        self.health_line.set_color(self.colors['success'])
+        for ax in self.fig.axes:
+            ax.set_facecolor(self.colors['card_bg'])
+        self.fig.patch.set_facecolor(self.colors['bg'])
         
     def create_enhanced_controls(self, parent):
         """Create enhanced dashboard controls"""
@@ -404,7 +617,7 @@ class SystemPerformanceAnalyzer:
             parent,
             text="📄 Export Report",
             command=self.export_enhanced_report,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         export_btn.grid(row=0, column=0, padx=10, pady=10)
         
@@ -413,7 +626,7 @@ class SystemPerformanceAnalyzer:
             parent,
             text="🔄 Refresh",
             command=self.manual_refresh,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         refresh_btn.grid(row=0, column=1, padx=10, pady=10)
         
@@ -422,7 +635,7 @@ class SystemPerformanceAnalyzer:
             parent,
             text="⚙️ Process Manager",
             command=self.open_enhanced_process_manager,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         process_btn.grid(row=0, column=2, padx=10, pady=10)
         
@@ -431,7 +644,7 @@ class SystemPerformanceAnalyzer:
             parent,
             text="🧹 System Cleanup",
             command=self.run_system_cleanup,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         cleanup_btn.grid(row=0, column=3, padx=10, pady=10)
         
@@ -440,7 +653,7 @@ class SystemPerformanceAnalyzer:
             parent,
             text="🚨 Emergency Optimize",
             command=self.emergency_optimization,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=_font(12, "bold"),
             fg_color="red"
         )
         emergency_btn.grid(row=0, column=4, padx=10, pady=10)
@@ -454,7 +667,7 @@ class SystemPerformanceAnalyzer:
         title_label = ctk.CTkLabel(
             main_container,
             text="📈 Performance Analytics & Historical Data",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -463,7 +676,7 @@ class SystemPerformanceAnalyzer:
         range_frame.pack(fill='x', pady=10)
         
         ctk.CTkLabel(range_frame, text="📅 Time Range:", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(side='left', padx=15, pady=10)
+                    font=_font(14, "bold")).pack(side='left', padx=15, pady=10)
         
         self.time_range_var = ctk.StringVar(value="Last 24 Hours")
         time_range_menu = ctk.CTkOptionMenu(
@@ -483,26 +696,26 @@ class SystemPerformanceAnalyzer:
         # Average metrics
         avg_cpu_frame = ctk.CTkFrame(summary_frame)
         avg_cpu_frame.grid(row=0, column=0, padx=10, pady=10, sticky='ew')
-        ctk.CTkLabel(avg_cpu_frame, text="📊 Avg CPU", font=ctk.CTkFont(size=12, weight="bold")).pack(pady=5)
-        self.avg_cpu_label = ctk.CTkLabel(avg_cpu_frame, text="0%", font=ctk.CTkFont(size=16))
+        ctk.CTkLabel(avg_cpu_frame, text="📊 Avg CPU", font=_font(12, "bold")).pack(pady=5)
+        self.avg_cpu_label = ctk.CTkLabel(avg_cpu_frame, text="0%", font=_font(16))
         self.avg_cpu_label.pack(pady=5)
         
         avg_memory_frame = ctk.CTkFrame(summary_frame)
         avg_memory_frame.grid(row=0, column=1, padx=10, pady=10, sticky='ew')
-        ctk.CTkLabel(avg_memory_frame, text="📊 Avg Memory", font=ctk.CTkFont(size=12, weight="bold")).pack(pady=5)
-        self.avg_memory_label = ctk.CTkLabel(avg_memory_frame, text="0%", font=ctk.CTkFont(size=16))
+        ctk.CTkLabel(avg_memory_frame, text="📊 Avg Memory", font=_font(12, "bold")).pack(pady=5)
+        self.avg_memory_label = ctk.CTkLabel(avg_memory_frame, text="0%", font=_font(16))
         self.avg_memory_label.pack(pady=5)
         
         peak_cpu_frame = ctk.CTkFrame(summary_frame)
         peak_cpu_frame.grid(row=0, column=2, padx=10, pady=10, sticky='ew')
-        ctk.CTkLabel(peak_cpu_frame, text="🔝 Peak CPU", font=ctk.CTkFont(size=12, weight="bold")).pack(pady=5)
-        self.peak_cpu_label = ctk.CTkLabel(peak_cpu_frame, text="0%", font=ctk.CTkFont(size=16))
+        ctk.CTkLabel(peak_cpu_frame, text="🔝 Peak CPU", font=_font(12, "bold")).pack(pady=5)
+        self.peak_cpu_label = ctk.CTkLabel(peak_cpu_frame, text="0%", font=_font(16))
         self.peak_cpu_label.pack(pady=5)
         
         events_frame = ctk.CTkFrame(summary_frame)
         events_frame.grid(row=0, column=3, padx=10, pady=10, sticky='ew')
-        ctk.CTkLabel(events_frame, text="📋 Events", font=ctk.CTkFont(size=12, weight="bold")).pack(pady=5)
-        self.events_count_label = ctk.CTkLabel(events_frame, text="0", font=ctk.CTkFont(size=16))
+        ctk.CTkLabel(events_frame, text="📋 Events", font=_font(12, "bold")).pack(pady=5)
+        self.events_count_label = ctk.CTkLabel(events_frame, text="0", font=_font(16))
         self.events_count_label.pack(pady=5)
         
         # Historical data table
@@ -510,11 +723,11 @@ class SystemPerformanceAnalyzer:
         history_frame.pack(fill='both', expand=True, pady=10)
         
         ctk.CTkLabel(history_frame, text="📋 Performance History", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(15, 10))
+                    font=_font(16, "bold")).pack(pady=(15, 10))
         
         self.history_textbox = ctk.CTkTextbox(
             history_frame,
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             height=300
         )
         self.history_textbox.pack(fill='both', expand=True, padx=15, pady=(0, 15))
@@ -528,7 +741,7 @@ class SystemPerformanceAnalyzer:
         title_label = ctk.CTkLabel(
             main_container,
             text="⚡ System Benchmark & Performance Testing",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -542,7 +755,7 @@ class SystemPerformanceAnalyzer:
             controls_frame,
             text="🔥 CPU Benchmark",
             command=lambda: self.run_benchmark('cpu'),
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         cpu_benchmark_btn.grid(row=0, column=0, padx=10, pady=10)
         
@@ -550,7 +763,7 @@ class SystemPerformanceAnalyzer:
             controls_frame,
             text="💾 Memory Benchmark",
             command=lambda: self.run_benchmark('memory'),
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         memory_benchmark_btn.grid(row=0, column=1, padx=10, pady=10)
         
@@ -558,15 +771,28 @@ class SystemPerformanceAnalyzer:
             controls_frame,
             text="🚀 Full System Benchmark",
             command=lambda: self.run_benchmark('full'),
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         full_benchmark_btn.grid(row=0, column=2, padx=10, pady=10)
         
+        kernel_frame = ctk.CTkFrame(controls_frame, fg_color="transparent")
+        kernel_frame.grid(row=1, column=0, columnspan=3, pady=(0, 10))
+        
+        ctk.CTkLabel(kernel_frame, text="🧮 CPU Kernels:", 
+                    font=_font(12, "bold")).pack(side='left', padx=10)
+        
+        self.benchmark_kernel_var = ctk.StringVar(value="Python")
+        ctk.CTkOptionMenu(
+            kernel_frame,
+            variable=self.benchmark_kernel_var,
+            values=list(BENCHMARK_KERNELS)
+        ).pack(side='left', padx=10)
+        
         # Benchmark status
         self.benchmark_status_label = ctk.CTkLabel(
             main_container,
             text="⏳ Ready to run benchmarks",
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         self.benchmark_status_label.pack(pady=10)
         
@@ -580,11 +806,11 @@ class SystemPerformanceAnalyzer:
         results_frame.pack(fill='both', expand=True, pady=10)
         
         ctk.CTkLabel(results_frame, text="📊 Benchmark Results", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(15, 10))
+                    font=_font(16, "bold")).pack(pady=(15, 10))
         
         self.benchmark_results_textbox = ctk.CTkTextbox(
             results_frame,
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             height=400
         )
         self.benchmark_results_textbox.pack(fill='both', expand=True, padx=15, pady=(0, 15))
@@ -598,7 +824,7 @@ class SystemPerformanceAnalyzer:
         title_label = ctk.CTkLabel(
             main_container,
             text="💻 Comprehensive System Information",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -613,7 +839,7 @@ class SystemPerformanceAnalyzer:
         basic_frame.grid(row=0, column=0, padx=10, pady=10, sticky='nsew')
         
         ctk.CTkLabel(basic_frame, text="🖥️ Basic Information", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
+                    font=_font(14, "bold")).pack(pady=(15, 10))
         
         basic_info = [
             f"Hostname: {self.system_info['hostname']}",
@@ -624,36 +850,36 @@ class SystemPerformanceAnalyzer:
         ]
         
         for info in basic_info:
-            ctk.CTkLabel(basic_frame, text=info, font=ctk.CTkFont(size=11)).pack(anchor='w', padx=15, pady=2)
+            ctk.CTkLabel(basic_frame, text=info, font=_font(11)).pack(anchor='w', padx=15, pady=2)
         
         # Hardware info
         hardware_frame = ctk.CTkFrame(overview_frame)
         hardware_frame.grid(row=0, column=1, padx=10, pady=10, sticky='nsew')
         
         ctk.CTkLabel(hardware_frame, text="⚙️ Hardware Information", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
+                    font=_font(14, "bold")).pack(pady=(15, 10))
         
         hardware_info = [
             f"CPU Cores: {self.system_info['cpu_count']}",
             f"CPU Frequency: {self.system_info['cpu_freq'].current:.2f} MHz" if self.system_info['cpu_freq'] else "CPU Frequency: N/A",
-            f"Total Memory: {self.system_info['memory_total'] / (1024**3):.2f} GB",
-            f"Total Disk: {self.system_info['disk_total'] / (1024**3):.2f} GB",
+            f"Total Memory: {self.system_info['memory_total'] / GB:.2f} GB",
+            f"Total Disk: {self.system_info['disk_total'] / GB:.2f} GB",
             f"Boot Time: {datetime.fromtimestamp(self.system_info['boot_time']).strftime('%Y-%m-%d %H:%M:%S')}"
         ]
         
         for info in hardware_info:
-            ctk.CTkLabel(hardware_frame, text=info, font=ctk.CTkFont(size=11)).pack(anchor='w', padx=15, pady=2)
+            ctk.CTkLabel(hardware_frame, text=info, font=_font(11)).pack(anchor='w', padx=15, pady=2)
         
         # Detailed system information
         detailed_frame = ctk.CTkFrame(main_container)
         detailed_frame.pack(fill='both', expand=True, pady=10)
         
         ctk.CTkLabel(detailed_frame, text="📋 Detailed System Report", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(15, 10))
+                    font=_font(16, "bold")).pack(pady=(15, 10))
         
         self.system_info_textbox = ctk.CTkTextbox(
             detailed_frame,
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             height=400
         )
         self.system_info_textbox.pack(fill='both', expand=True, padx=15, pady=(0, 15))
@@ -670,7 +896,7 @@ class SystemPerformanceAnalyzer:
         title_label = ctk.CTkLabel(
             main_container,
             text="🧠 Advanced AI-Powered System Optimization",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -685,12 +911,12 @@ class SystemPerformanceAnalyzer:
         ai_status_frame.grid(row=0, column=0, padx=10, pady=10, sticky='ew')
         
         ctk.CTkLabel(ai_status_frame, text="🤖 AI Status", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 5))
+                    font=_font(14, "bold")).pack(pady=(15, 5))
         
         self.ai_status_label = ctk.CTkLabel(
             ai_status_frame,
             text="🔍 Analyzing system performance...",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.ai_status_label.pack(pady=(0, 15))
         
@@ -699,12 +925,12 @@ class SystemPerformanceAnalyzer:
         health_status_frame.grid(row=0, column=1, padx=10, pady=10, sticky='ew')
         
         ctk.CTkLabel(health_status_frame, text="🎯 System Health", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 5))
+                    font=_font(14, "bold")).pack(pady=(15, 5))
         
         self.health_status_label = ctk.CTkLabel(
             health_status_frame,
             text="Excellent",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.health_status_label.pack(pady=(0, 15))
         
@@ -715,14 +941,14 @@ class SystemPerformanceAnalyzer:
         suggestions_title = ctk.CTkLabel(
             suggestions_frame,
             text="💡 AI Optimization Suggestions",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         suggestions_title.pack(pady=(15, 10))
         
         self.suggestions_textbox = ctk.CTkTextbox(
             suggestions_frame,
             height=200,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.suggestions_textbox.pack(fill='both', expand=True, padx=15, pady=(0, 15))
         
@@ -736,7 +962,7 @@ class SystemPerformanceAnalyzer:
             ai_controls_frame,
             text="🔍 Deep Analysis",
             command=self.run_ai_analysis,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         analyze_btn.grid(row=0, column=0, padx=10, pady=10)
         
@@ -744,7 +970,7 @@ class SystemPerformanceAnalyzer:
             ai_controls_frame,
             text="⚡ Apply Optimizations",
             command=self.apply_optimizations,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         optimize_btn.grid(row=0, column=1, padx=10, pady=10)
         
@@ -752,7 +978,7 @@ class SystemPerformanceAnalyzer:
             ai_controls_frame,
             text="🤖 Auto Optimize",
             command=self.toggle_auto_optimize,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         auto_optimize_btn.grid(row=0, column=2, padx=10, pady=10)
         
@@ -767,181 +993,166 @@ class SystemPerformanceAnalyzer:
         # Settings title
         title_label = ctk.CTkLabel(
             main_container,
-            text="⚙️ Advanced Settings & Configuration",
-            font=ctk.CTkFont(size=18, weight="bold")
+            text=_SETTINGS_TITLE,
+            font=_font(18, "bold")
         )
         title_label.pack(pady=(0, 20))
         
         # Theme settings
         theme_frame = ctk.CTkFrame(main_container)
-        theme_frame.pack(fill='x', pady=10)
+        theme_frame.pack(**_PACK_SECTION)
         
         theme_title = ctk.CTkLabel(
             theme_frame,
-            text="🎨 Appearance Settings",
-            font=ctk.CTkFont(size=16, weight="bold")
+            text=_APPEARANCE_TITLE,
+            font=_font(16, "bold")
         )
-        theme_title.pack(pady=(15, 10))
+        theme_title.pack(**_PACK_TITLE)
         
-        self.theme_var = ctk.StringVar(value=self.current_theme)
-        
-        theme_options_frame = ctk.CTkFrame(theme_frame)
-        theme_options_frame.pack(fill='x', padx=15, pady=(0, 15))
+        # One dict of Tk variables backs every settings control
+        self.settings_vars = {
+            'theme': ctk.StringVar(value=self.current_theme),
+            'logging': ctk.BooleanVar(value=self.data_logging),
+            'notifications': ctk.BooleanVar(value=self.notifications_enabled),
+            'auto_optimize': ctk.BooleanVar(value=self.auto_optimize)
+        }
+        for var in self.settings_vars.values():
+            var.trace_add('write', self.schedule_settings_save)
         
         light_radio = ctk.CTkRadioButton(
-            theme_options_frame,
+            theme_frame,
             text="☀️ Light Mode",
-            variable=self.theme_var,
+            variable=self.settings_vars['theme'],
             value='light',
             command=lambda: self.change_theme('light')
         )
-        light_radio.pack(anchor='w', padx=20, pady=5)
+        light_radio.pack(**_PACK_LABEL)
         
         dark_radio = ctk.CTkRadioButton(
-            theme_options_frame,
+            theme_frame,
             text="🌙 Dark Mode",
-            variable=self.theme_var,
+            variable=self.settings_vars['theme'],
             value='dark',
             command=lambda: self.change_theme('dark')
         )
-        dark_radio.pack(anchor='w', padx=20, pady=5)
+        dark_radio.pack(anchor='w', padx=_ITEM_PADX, pady=(5, 15))
         
         # Performance settings
         perf_frame = ctk.CTkFrame(main_container)
-        perf_frame.pack(fill='x', pady=10)
+        perf_frame.pack(**_PACK_SECTION)
         
         perf_title = ctk.CTkLabel(
             perf_frame,
-            text="📊 Performance Monitoring Settings",
-            font=ctk.CTkFont(size=16, weight="bold")
+            text=_PERFORMANCE_TITLE,
+            font=_font(16, "bold")
         )
-        perf_title.pack(pady=(15, 10))
+        perf_title.pack(**_PACK_TITLE)
         
         # Refresh rate
-        refresh_frame = ctk.CTkFrame(perf_frame)
-        refresh_frame.pack(fill='x', padx=15, pady=5)
-        
-        ctk.CTkLabel(refresh_frame, text="Refresh Rate (seconds):", 
-                    font=ctk.CTkFont(size=12)).pack(anchor='w', padx=20, pady=5)
+        ctk.CTkLabel(perf_frame, text="Refresh Rate (seconds):", 
+                    font=_font(12)).pack(**_PACK_LABEL)
         
         self.refresh_slider = ctk.CTkSlider(
-            refresh_frame,
+            perf_frame,
             from_=1,
             to=10,
             number_of_steps=9,
             command=self.update_refresh_rate
         )
         self.refresh_slider.set(self.refresh_rate // 1000)
-        self.refresh_slider.pack(fill='x', padx=20, pady=5)
+        self.refresh_slider.pack(fill='x', padx=_ITEM_PADX, pady=5)
         
         # Data logging
-        logging_frame = ctk.CTkFrame(perf_frame)
-        logging_frame.pack(fill='x', padx=15, pady=5)
-        
-        self.logging_var = ctk.BooleanVar(value=self.data_logging)
         logging_check = ctk.CTkCheckBox(
-            logging_frame,
+            perf_frame,
             text="Enable data logging to database",
-            variable=self.logging_var,
+            variable=self.settings_vars['logging'],
             command=self.toggle_data_logging
         )
-        logging_check.pack(anchor='w', padx=20, pady=10)
+        logging_check.pack(anchor='w', padx=_ITEM_PADX, pady=(10, 15))
         
         # Alert thresholds
         alerts_frame = ctk.CTkFrame(main_container)
-        alerts_frame.pack(fill='x', pady=10)
+        alerts_frame.pack(**_PACK_SECTION)
         
         alerts_title = ctk.CTkLabel(
             alerts_frame,
-            text="🚨 Alert Thresholds",
-            font=ctk.CTkFont(size=16, weight="bold")
+            text=_ALERTS_TITLE,
+            font=_font(16, "bold")
         )
-        alerts_title.pack(pady=(15, 10))
-        
-        # CPU threshold
-        cpu_threshold_frame = ctk.CTkFrame(alerts_frame)
-        cpu_threshold_frame.pack(fill='x', padx=15, pady=5)
+        alerts_title.pack(**_PACK_TITLE)
         
-        ctk.CTkLabel(cpu_threshold_frame, text="CPU Alert Threshold (%):", 
-                    font=ctk.CTkFont(size=12)).pack(anchor='w', padx=20, pady=5)
-        
-        self.cpu_threshold_slider = ctk.CTkSlider(
-            cpu_threshold_frame,
-            from_=50,
-            to=95,
-            number_of_steps=9,
-            command=lambda x: self.update_threshold('cpu', x)
+        # CPU and memory thresholds
+        self.cpu_threshold_slider = self._make_threshold_slider(
+            alerts_frame, 'CPU', 'cpu', 50, 95, 9
         )
-        self.cpu_threshold_slider.set(self.alert_thresholds['cpu'])
-        self.cpu_threshold_slider.pack(fill='x', padx=20, pady=5)
-        
-        # Memory threshold
-        memory_threshold_frame = ctk.CTkFrame(alerts_frame)
-        memory_threshold_frame.pack(fill='x', padx=15, pady=5)
-        
-        ctk.CTkLabel(memory_threshold_frame, text="Memory Alert Threshold (%):", 
-                    font=ctk.CTkFont(size=12)).pack(anchor='w', padx=20, pady=5)
-        
-        self.memory_threshold_slider = ctk.CTkSlider(
-            memory_threshold_frame,
-            from_=60,
-            to=95,
-            number_of_steps=7,
-            command=lambda x: self.update_threshold('memory', x)
+        self.memory_threshold_slider = self._make_threshold_slider(
+            alerts_frame, 'Memory', 'memory', 60, 95, 7, slider_pady=(5, 15)
         )
-        self.memory_threshold_slider.set(self.alert_thresholds['memory'])
-        self.memory_threshold_slider.pack(fill='x', padx=20, pady=(5, 15))
         
         # Notifications
         notifications_frame = ctk.CTkFrame(main_container)
-        notifications_frame.pack(fill='x', pady=10)
+        notifications_frame.pack(**_PACK_SECTION)
         
         notifications_title = ctk.CTkLabel(
             notifications_frame,
-            text="🔔 Notification Settings",
-            font=ctk.CTkFont(size=16, weight="bold")
+            text=_NOTIFICATIONS_TITLE,
+            font=_font(16, "bold")
         )
-        notifications_title.pack(pady=(15, 10))
-        
-        notif_options_frame = ctk.CTkFrame(notifications_frame)
-        notif_options_frame.pack(fill='x', padx=15, pady=(0, 15))
+        notifications_title.pack(**_PACK_TITLE)
         
-        self.notifications_var = ctk.BooleanVar(value=self.notifications_enabled)
         notifications_check = ctk.CTkCheckBox(
-            notif_options_frame,
+            notifications_frame,
             text="Enable performance alerts",
-            variable=self.notifications_var,
+            variable=self.settings_vars['notifications'],
             command=self.toggle_notifications
         )
-        notifications_check.pack(anchor='w', padx=20, pady=5)
+        notifications_check.pack(**_PACK_LABEL)
         
-        self.auto_optimize_var = ctk.BooleanVar(value=self.auto_optimize)
         auto_optimize_check = ctk.CTkCheckBox(
-            notif_options_frame,
+            notifications_frame,
             text="Enable automatic optimization",
-            variable=self.auto_optimize_var,
+            variable=self.settings_vars['auto_optimize'],
             command=self.toggle_auto_optimize
         )
-        auto_optimize_check.pack(anchor='w', padx=20, pady=5)
+        auto_optimize_check.pack(anchor='w', padx=_ITEM_PADX, pady=(5, 15))
+        
+    def _make_threshold_slider(self, parent, label, key, lo, hi, steps, slider_pady=5):
+        """Create a labelled alert-threshold slider bound to alert_thresholds[key]"""
+        ctk.CTkLabel(parent, text=f"{label} Alert Threshold (%):",
+                    font=_font(12)).pack(**_PACK_LABEL)
+        
+        slider = ctk.CTkSlider(
+            parent,
+            from_=lo,
+            to=hi,
+            number_of_steps=steps,
+            command=partial(self.update_threshold, key)
+        )
+        slider.set(self.alert_thresholds[key])
+        slider.pack(fill='x', padx=_ITEM_PADX, pady=slider_pady)
+        return slider
         
     def create_theory_content(self):
         """Create comprehensive theory and documentation"""
-        main_container = ctk.CTkScrollableFrame(self.theory_tab)
+        # Plain frame: the textbox below already provides its own scrollbar
+        main_container = ctk.CTkFrame(self.theory_tab)
         main_container.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Title
         title_label = ctk.CTkLabel(
             main_container,
             text="📚 Comprehensive Theory & Technical Documentation",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=(0, 20))
         
         # Theory textbox
         self.theory_textbox = ctk.CTkTextbox(
             main_container,
-            font=ctk.CTkFont(size=11),
-            height=600
+            font=_font(11),
+            wrap='word',
+            undo=False
         )
         self.theory_textbox.pack(fill='both', expand=True)
         
@@ -950,646 +1161,82 @@ class SystemPerformanceAnalyzer:
         
     def insert_enhanced_theory_content(self):
         """Insert comprehensive enhanced documentation"""
-        content = """📖 SYSTEM PERFORMANCE ANALYZER & OPTIMIZER v2.0
-Comprehensive Technical Documentation & Theory
-
-🎯 PROJECT OVERVIEW & EVOLUTION
-═══════════════════════════════════════════════════════════════
-
-This System Performance Analyzer & Optimizer v2.0 represents a significant evolution in system monitoring and optimization technology. Built using cutting-edge Python frameworks and advanced algorithms, it provides comprehensive real-time monitoring, intelligent analysis, and automated optimization capabilities for modern computing systems.
-
-The application serves as both a practical tool for system administrators and an educational platform demonstrating advanced software engineering principles, artificial intelligence integration, and modern GUI development techniques.
-
-🚀 PROJECT MOTIVATION & REAL-WORLD APPLICATIONS
-═══════════════════════════════════════════════════════════════
-
-In today's digital ecosystem, system performance directly correlates with productivity, user satisfaction, and operational efficiency. The motivation for this project stems from several critical industry needs:
-
-1. ENTERPRISE SYSTEM MANAGEMENT
-   • Large-scale server monitoring and optimization
-   • Predictive maintenance and failure prevention
-   • Resource allocation and capacity planning
-   • Cost optimization through efficient resource utilization
-
-2. PERSONAL COMPUTING OPTIMIZATION
-   • Gaming performance enhancement
-   • Content creation workflow optimization
-   • Battery life extension for mobile devices
-   • Thermal management and noise reduction
-
-3. EDUCATIONAL AND RESEARCH APPLICATIONS
-   • Computer science education tool
-   • Performance analysis research platform
-   • Algorithm testing and validation
-   • System behavior modeling and simulation
-
-4. INDUSTRIAL IoT AND EDGE COMPUTING
-   • Real-time monitoring of industrial systems
-   • Edge device performance optimization
-   • Predictive maintenance in manufacturing
-   • Quality assurance in production environments
-
-🎯 COMPREHENSIVE OBJECTIVES & GOALS
-═══════════════════════════════════════════════════════════════
-
-PRIMARY OBJECTIVES:
-
-1. Real-time Performance Monitoring
-   • Multi-metric system monitoring (CPU, Memory, Disk, Network, Temperature)
-   • High-frequency data collection with minimal system overhead
-   • Historical data analysis and trend identification
-   • Cross-platform compatibility and consistency
-
-2. Intelligent AI-based Optimization
-   • Machine learning-driven performance analysis
-   • Predictive bottleneck detection and prevention
-   • Automated optimization recommendation system
-   • Adaptive learning from user behavior and system patterns
-
-3. Advanced User Interface Design
-   • Modern, responsive GUI using CustomTkinter
-   • Real-time data visualization with interactive charts
-   • Intuitive navigation and user experience
-   • Accessibility features and customization options
-
-4. Comprehensive Reporting and Analytics
-   • Detailed performance reports in multiple formats
-   • Historical trend analysis and pattern recognition
-   • Benchmark testing and performance comparison
-   • Export capabilities for further analysis
-
-5. System Integration and Automation
-   • Seamless integration with operating system APIs
-   • Automated optimization execution with user consent
-   • Scheduled monitoring and maintenance tasks
-   • Integration with external monitoring systems
-
-SECONDARY OBJECTIVES:
-
-• Educational Value: Demonstrate advanced programming concepts and best practices
-• Research Platform: Provide foundation for performance analysis research
-• Extensibility: Modular architecture for easy feature additions
-• Security: Secure handling of system information and user data
-• Scalability: Support for monitoring multiple systems simultaneously
-
-🏗️ ADVANCED SYSTEM ARCHITECTURE & DESIGN PATTERNS
-═══════════════════════════════════════════════════════════════
-
-The application employs a sophisticated multi-layered architecture incorporating modern software design patterns:
-
-1. PRESENTATION LAYER (CustomTkinter GUI)
-   Architecture Pattern: Model-View-Controller (MVC)
-   
-   Components:
-   • Main Application Window (Controller)
-   • Tabbed Interface System (View Manager)
-   • Custom Widget Library (Reusable Components)
-   • Theme Management System (Strategy Pattern)
-   • Event Handling Framework (Observer Pattern)
-   
-   Design Principles:
-   • Separation of Concerns
-   • Single Responsibility Principle
-   • Open/Closed Principle for extensibility
-
-2. BUSINESS LOGIC LAYER (Core Processing)
-   Architecture Pattern: Service-Oriented Architecture (SOA)
-   
-   Services:
-   • Performance Monitoring Service
-   • AI Analysis Engine
-   • Optimization Recommendation Service
-   • Alert Management System
-   • Data Persistence Service
-   
-   Design Patterns:
-   • Factory Pattern for service creation
-   • Singleton Pattern for configuration management
-   • Command Pattern for optimization actions
-
-3. DATA ACCESS LAYER (System Integration)
-   Architecture Pattern: Repository Pattern
-   
-   Components:
-   • System Metrics Repository (psutil integration)
-   • Database Repository (SQLite integration)
-   • File System Repository (log files, exports)
-   • Configuration Repository (settings management)
-   
-   Features:
-   • Data abstraction and encapsulation
-   • Transaction management
-   • Error handling and recovery
-   • Data validation and sanitization
-
-4. ARTIFICIAL INTELLIGENCE LAYER
-   Architecture Pattern: Pipeline Architecture
-   
-   Pipeline Stages:
-   • Data Collection and Preprocessing
-   • Feature Extraction and Engineering
-   • Pattern Recognition and Analysis
-   • Prediction and Recommendation Generation
-   • Feedback Loop and Learning
-   
-   AI Techniques:
-   • Statistical Analysis and Trend Detection
-   • Anomaly Detection Algorithms
-   • Rule-based Expert Systems
-   • Machine Learning Integration (future enhancement)
-
-🔧 COMPREHENSIVE TECHNOLOGY STACK
-═══════════════════════════════════════════════════════════════
-
-CORE TECHNOLOGIES:
-
-1. Programming Language: Python 3.8+
-   Advantages:
-   • Cross-platform compatibility
-   • Rich ecosystem of libraries
-   • Rapid development capabilities
-   • Strong community support
-   • Excellent for data analysis and AI
-
-2. GUI Framework: CustomTkinter
-   Features:
-   • Modern, native-looking interface
-   • Built-in theming support
-   • High DPI display compatibility
-   • Smooth animations and transitions
-   • Extensive widget library
-
-3. Data Visualization: Matplotlib
-   Capabilities:
-   • Real-time chart updates
-   • Multiple chart types and styles
-   • Interactive data exploration
-   • High-quality output for reports
-   • Customizable appearance
-
-4. System Monitoring: psutil
-   Functionality:
-   • Cross-platform system information
-   • Real-time performance metrics
-   • Process and service management
-   • Hardware information access
-   • Network statistics
-
-5. Database: SQLite
-   Benefits:
-   • Embedded database solution
-   • Zero-configuration setup
-   • ACID compliance
-   • Lightweight and efficient
-   • SQL standard compliance
-
-SUPPORTING LIBRARIES:
-
-• NumPy: Numerical computations and array operations
-• Threading: Concurrent operations and background tasks
-• JSON: Configuration and data serialization
-• CSV: Data export and import functionality
-• DateTime: Time-based operations and scheduling
-• Collections: Advanced data structures (deque, defaultdict)
-• Socket: Network operations and system identification
-• Platform: System information and compatibility detection
-
-OPTIONAL ENHANCEMENTS:
-
-• ReportLab: Advanced PDF generation with charts and tables
-• Requests: HTTP client for cloud integration
-• Pandas: Advanced data analysis and manipulation
-• Scikit-learn: Machine learning algorithms
-• TensorFlow/PyTorch: Deep learning capabilities
-
-🤖 ADVANCED AI MODEL ARCHITECTURE & ALGORITHMS
-═══════════════════════════════════════════════════════════════
-
-The AI optimization engine employs a hybrid approach combining multiple techniques:
-
-1. STATISTICAL ANALYSIS ENGINE
-   
-   Moving Average Analysis:
-   • Simple Moving Average (SMA) for trend detection
-   • Exponential Moving Average (EMA) for recent trend emphasis
-   • Weighted Moving Average (WMA) for priority-based analysis
-   
-   Statistical Measures:
-   • Mean, Median, Mode for central tendency
-   • Standard Deviation for variability assessment
-   • Percentiles for threshold determination
-   • Correlation analysis for metric relationships
-
-2. ANOMALY DETECTION SYSTEM
-   
-   Threshold-based Detection:
-   • Static thresholds for critical metrics
-   • Dynamic thresholds based on historical data
-   • Adaptive thresholds using machine learning
-   
-   Pattern-based Detection:
-   • Seasonal pattern recognition
-   • Cyclical behavior identification
-   • Outlier detection using statistical methods
-   • Change point detection for system state changes
-
-3. RULE-BASED EXPERT SYSTEM
-   
-   Knowledge Base:
-   • Performance optimization rules
-   • System-specific recommendations
-   • Hardware-dependent optimizations
-   • Software-specific tuning guidelines
-   
-   Inference Engine:
-   • Forward chaining for recommendation generation
-   • Backward chaining for root cause analysis
-   • Conflict resolution strategies
-   • Certainty factor calculations
-
-4. PREDICTIVE MODELING FRAMEWORK
-   
-   Time Series Forecasting:
-   • ARIMA models for trend prediction
-   • Linear regression for simple predictions
-   • Polynomial regression for complex patterns
-   • Seasonal decomposition for cyclical data
-   
-   Performance Prediction:
-   • Resource utilization forecasting
-   • Bottleneck prediction algorithms
-   • Failure probability estimation
-   • Maintenance scheduling optimization
-
-5. LEARNING AND ADAPTATION MECHANISMS
-   
-   Feedback Integration:
-   • User feedback incorporation
-   • Optimization success tracking
-   • Performance improvement measurement
-   • Recommendation effectiveness analysis
-   
-   Adaptive Algorithms:
-   • Dynamic threshold adjustment
-   • Pattern refinement over time
-   • User behavior learning
-   • System-specific optimization
-
-📊 COMPREHENSIVE PERFORMANCE METRICS & KPIs
-═══════════════════════════════════════════════════════════════
-
-SYSTEM PERFORMANCE METRICS:
-
-1. CPU Metrics:
-   • Overall CPU utilization percentage
-   • Per-core usage distribution
-   • CPU frequency scaling
-   • Process-specific CPU consumption
-   • CPU temperature monitoring
-   • Thermal throttling detection
-   • Context switching rates
-   • Interrupt handling statistics
-
-2. Memory Metrics:
-   • Physical memory usage and availability
-   • Virtual memory statistics
-   • Memory allocation patterns
-   • Page fault rates
-   • Memory-intensive process identification
-   • Cache hit/miss ratios
-   • Memory fragmentation analysis
-   • Swap usage monitoring
-
-3. Storage Metrics:
-   • Disk space utilization
-   • Read/write operations per second (IOPS)
-   • Disk throughput (MB/s)
-   • Average response times
-   • Queue depth monitoring
-   • Disk health indicators (SMART data)
-   • File system performance
-   • Storage device temperature
-
-4. Network Metrics:
-   • Bytes sent/received per second
-   • Packet transmission statistics
-   • Network interface utilization
-   • Connection establishment rates
-   • Bandwidth utilization patterns
-   • Network latency measurements
-   • Error and drop rates
-   • Protocol-specific statistics
-
-5. System Health Metrics:
-   • Overall system health score
-   • Component health indicators
-   • Error and warning counts
-   • System stability metrics
-   • Uptime and availability
-   • Performance degradation indicators
-   • Resource contention levels
-   • System responsiveness
-
-APPLICATION PERFORMANCE METRICS:
-
-• Startup time and initialization speed
-• Memory footprint and resource usage
-• CPU overhead during monitoring
-• Data collection accuracy and precision
-• Chart rendering performance
-• Database operation efficiency
-• Export operation speed
-• User interface responsiveness
-
-🛠️ IMPLEMENTATION CHALLENGES & INNOVATIVE SOLUTIONS
-═══════════════════════════════════════════════════════════════
-
-TECHNICAL CHALLENGES ADDRESSED:
-
-1. Real-time Data Processing Challenge
-   Problem: Maintaining smooth GUI responsiveness while processing high-frequency data
-   
-   Solution Implementation:
-   • Multi-threaded architecture with dedicated monitoring threads
-   • Efficient data structures using collections.deque for bounded memory usage
-   • Asynchronous data updates using tkinter.after() for thread-safe GUI updates
-   • Data buffering and batch processing for improved efficiency
-   • Optimized chart rendering with selective updates
-
-2. Cross-platform Compatibility Challenge
-   Problem: Ensuring consistent behavior across Windows, macOS, and Linux
-   
-   Solution Implementation:
-   • Abstraction layer using psutil for platform-independent system access
-   • Conditional code paths for platform-specific features
-   • Comprehensive testing on multiple operating systems
-   • Graceful degradation for unsupported features
-   • Platform-specific optimizations where necessary
-
-3. Memory Management Challenge
-   Problem: Preventing memory leaks in long-running applications
-   
-   Solution Implementation:
-   • Bounded data structures with automatic cleanup
-   • Explicit garbage collection at strategic points
-   • Weak references for event handling
-   • Resource cleanup in exception handlers
-   • Memory usage monitoring and alerting
-
-4. Performance Optimization Challenge
-   Problem: Minimizing application overhead while maximizing monitoring accuracy
-   
-   Solution Implementation:
-   • Adaptive sampling rates based on system load
-   • Efficient data compression for historical storage
-   • Lazy loading of non-critical components
-   • Caching strategies for frequently accessed data
-   • Optimized database queries and indexing
-
-5. User Experience Challenge
-   Problem: Creating an intuitive interface for both technical and non-technical users
-   
-   Solution Implementation:
-   • Progressive disclosure of advanced features
-   • Context-sensitive help and tooltips
-   • Visual indicators for system status
-   • Customizable interface layouts
-   • Accessibility features for diverse users
-
-INNOVATIVE FEATURES:
-
-• Adaptive AI that learns from user behavior and system patterns
-• Predictive optimization recommendations based on usage patterns
-• Real-time system health scoring with actionable insights
-• Automated benchmark testing with performance comparison
-• Integration-ready architecture for enterprise environments
-
-🔮 FUTURE ENHANCEMENTS & RESEARCH DIRECTIONS
-═══════════════════════════════════════════════════════════════
-
-SHORT-TERM ENHANCEMENTS (3-6 months):
-
-1. Advanced Machine Learning Integration
-   • TensorFlow/PyTorch integration for deep learning
-   • Neural network models for complex pattern recognition
-   • Reinforcement learning for optimization strategies
-   • Natural language processing for log analysis
-
-2. Cloud Integration and Remote Monitoring
-   • Cloud-based data storage and synchronization
-   • Multi-system monitoring dashboard
-   • Remote system management capabilities
-   • Cloud-based AI model training and deployment
-
-3. Enhanced Visualization and Reporting
-   • 3D performance visualizations
-   • Interactive dashboard customization
-   • Advanced statistical analysis tools
-   • Real-time collaboration features
-
-MEDIUM-TERM DEVELOPMENTS (6-12 months):
-
-1. Enterprise-grade Features
-   • Role-based access control
-   • Audit logging and compliance reporting
-   • Integration with enterprise monitoring systems
-   • Scalable architecture for large deployments
-
-2. Mobile and Web Interfaces
-   • Responsive web dashboard
-   • Mobile companion applications
-   • Progressive web app (PWA) implementation
-   • Cross-device synchronization
-
-3. Advanced Analytics Platform
-   • Big data analytics integration
-   • Predictive maintenance algorithms
-   • Performance trend analysis
-   • Capacity planning tools
-
-LONG-TERM VISION (1-2 years):
-
-1. Autonomous System Management
-   • Fully automated optimization execution
-   • Self-healing system capabilities
-   • Intelligent resource allocation
-   • Predictive failure prevention
-
-2. Ecosystem Integration
-   • IoT device monitoring integration
-   • Container and virtualization support
-   • Cloud service monitoring
-   • Microservices architecture support
-
-3. Research and Development Platform
-   • Open API for third-party integrations
-   • Plugin architecture for extensibility
-   • Research collaboration tools
-   • Academic partnership programs
-
-🎓 EDUCATIONAL VALUE & LEARNING OUTCOMES
-═══════════════════════════════════════════════════════════════
-
-COMPUTER SCIENCE CONCEPTS DEMONSTRATED:
-
-1. Software Engineering Principles
-   • Object-oriented programming and design patterns
-   • Software architecture and system design
-   • Code organization and modular development
-   • Testing strategies and quality assurance
-   • Documentation and maintenance practices
-
-2. Data Structures and Algorithms
-   • Efficient data storage and retrieval
-   • Real-time data processing algorithms
-   • Search and sorting implementations
-   • Graph algorithms for system relationships
-   • Optimization algorithms for performance tuning
-
-3. Database Management
-   • Relational database design and implementation
-   • SQL query optimization
-   • Data modeling and normalization
-   • Transaction management and ACID properties
-   • Performance monitoring and tuning
-
-4. Artificial Intelligence and Machine Learning
-   • Statistical analysis and data mining
-   • Pattern recognition and classification
-   • Predictive modeling and forecasting
-   • Expert systems and knowledge representation
-   • Learning algorithms and adaptation
-
-5. Human-Computer Interaction
-   • User interface design principles
-   • Usability testing and evaluation
-   • Accessibility and inclusive design
-   • User experience optimization
-   • Information visualization techniques
-
-PRACTICAL SKILLS DEVELOPMENT:
-
-• Advanced Python programming techniques
-• GUI development with modern frameworks
-• System programming and OS integration
-• Database design and implementation
-• Performance analysis and optimization
-• Project management and collaboration
-• Technical documentation and communication
-
-📈 PERFORMANCE BENCHMARKS & VALIDATION
-═══════════════════════════════════════════════════════════════
-
-APPLICATION PERFORMANCE METRICS:
-
-System Requirements:
-• Minimum RAM: 4GB (Recommended: 8GB+)
-• CPU: Dual-core 2.0GHz (Recommended: Quad-core 2.5GHz+)
-• Storage: 100MB free space (plus data storage)
-• Python 3.8+ with required libraries
-
-Performance Benchmarks:
-• Application startup time: < 3 seconds (cold start)
-• Memory footprint: 30-50MB (depending on data retention)
-• CPU overhead: < 2% during normal operation
-• Data collection frequency: 1-10 seconds (configurable)
-• Chart rendering time: < 100ms for real-time updates
-• Database operations: < 10ms for typical queries
-• Export operations: < 5 seconds for standard reports
-
-Monitoring Accuracy:
-• CPU usage accuracy: ±1% (validated against system tools)
-• Memory usage accuracy: ±0.5% (cross-verified with OS metrics)
-• Disk I/O accuracy: ±5% (within acceptable variance)
-• Network usage accuracy: ±2% (compared to network tools)
-• Temperature readings: ±1°C (where hardware sensors available)
-
-Scalability Metrics:
-• Data retention: Up to 1 million data points without performance degradation
-• Concurrent monitoring: Supports monitoring of 100+ processes simultaneously
-• Database growth: Linear performance up to 1GB database size
-• Export capabilities: Handles datasets up to 100,000 records efficiently
-
-🔒 SECURITY CONSIDERATIONS & BEST PRACTICES
-═══════════════════════════════════════════════════════════════
-
-SECURITY MEASURES IMPLEMENTED:
-
-1. Data Protection
-   • Read-only system monitoring (no unauthorized system modifications)
-   • Secure handling of sensitive system information
-   • Local data storage with encrypted options
-   • User permission validation for all system operations
-   • Audit logging of all optimization actions
-
-2. Access Control
-   • User-based configuration management
-   • Privilege escalation protection
-   • Safe process termination procedures
-   • Controlled system modification capabilities
-   • Administrative action confirmation dialogs
-
-3. Data Privacy
-   • No network transmission of sensitive data without explicit consent
-   • Anonymization options for exported data
-   • Secure deletion of temporary files
-   • Privacy-compliant data retention policies
-   • User control over data collection scope
-
-4. System Integrity
-   • Validation of all system modifications before execution
-   • Rollback capabilities for optimization changes
-   • System state verification and monitoring
-   • Protection against malicious process termination
-   • Safe mode operation for critical system states
-
-COMPLIANCE AND STANDARDS:
-
-• GDPR compliance for data protection
-• Industry standard security practices
-• Open source security guidelines
-• Enterprise security requirements compatibility
-• Academic research ethics compliance
-
-📝 CONCLUSION & PROJECT IMPACT
-═══════════════════════════════════════════════════════════════
-
-The System Performance Analyzer & Optimizer v2.0 represents a comprehensive achievement in modern software development, combining theoretical computer science concepts with practical system         administration and optimization. This project successfully demonstrates the integration of multiple advanced technologies and methodologies to create a practical, educational, and professionally viable software solution.
-
-The application's impact extends beyond its immediate functionality, serving as:
-
-• A comprehensive educational tool for computer science students
-• A practical system administration utility for IT professionals
-• A research platform for performance analysis and optimization
-• A demonstration of modern software development best practices
-• A foundation for future innovations in system monitoring technology
-
-Through its development, this project has achieved its primary objectives while establishing a framework for continued enhancement and adaptation to emerging technologies and user needs.
-
-The combination of theoretical depth, practical implementation, and future-oriented design makes this System Performance Analyzer & Optimizer a significant contribution to the field of system monitoring and optimization tools.
-
-═══════════════════════════════════════════════════════════════
-© 2025 Architechs Team - SE(OS)-VI-T250
-All rights reserved.
-
-For technical support, feature requests, or collaboration opportunities:
-📧 Contact: harshitjasuja70@gmail.com
-🌐 Project Repository: [Available upon request]
-📚 Documentation: Comprehensive user manual included
-🔧 Support: Community-driven development and support"""
-        
-        self.theory_textbox.insert('0.0', content)
+        try:
+            content = load_theory_content()
+        except (OSError, ValueError) as e:
+            print(f"Theory content load error: {e}")
+            content = f"📖 Documentation unavailable: {THEORY_CONTENT_PATH} could not be read."
+        
+        # Only section titles are rendered up front; bodies load on click
+        self._theory_preamble, self._theory_sections, self._theory_footer = \
+            self.split_theory_sections(content)
+        self._expanded_sections = set()
+        
+        textbox = self.theory_textbox._textbox
+        for i in range(len(self._theory_sections)):
+            textbox.tag_bind(f'theory_section_{i}', '<Button-1>',
+                             partial(self.toggle_theory_section, i))
+        
+        self.render_theory_sections()
+        
+    def split_theory_sections(self, content):
+        """Split the documentation into preamble, (title, body) sections and footer"""
+        lines = content.split('\n')
+        separators = [i for i, line in enumerate(lines) if line.startswith('═══')]
+        if not separators:
+            return content.strip(), [], ''
+        
+        preamble = '\n'.join(lines[:separators[0] - 1]).strip()
+        sections = []
+        footer = ''
+        
+        for n, sep in enumerate(separators):
+            end = separators[n + 1] - 1 if n + 1 < len(separators) else len(lines)
+            title = lines[sep - 1].strip()
+            if title:
+                sections.append((title, '\n'.join(lines[sep + 1:end]).strip('\n')))
+            else:
+                # A separator without a title opens the closing footer block
+                footer = '\n'.join(lines[sep:end])
+        
+        return preamble, sections, footer
+        
+    def render_theory_sections(self):
+        """Render section headers, inserting bodies only for expanded sections"""
+        textbox = self.theory_textbox._textbox
+        scroll_position = textbox.yview()[0]
+        
+        # One multi-segment insert instead of one insert per section
+        segments = [self._theory_preamble + "\n\nClick a section title to expand or collapse it.\n\n", ()]
+        for i, (title, body) in enumerate(self._theory_sections):
+            expanded = i in self._expanded_sections
+            segments += [f"{'▾' if expanded else '▸'} {title}\n", ('theory_header', f'theory_section_{i}')]
+            if expanded:
+                segments += [body + '\n\n', ()]
+        if self._theory_footer:
+            segments += ['\n' + self._theory_footer, ()]
+        
+        self.theory_textbox.configure(state='normal')
+        textbox.delete('1.0', 'end')
+        textbox.insert('1.0', *segments)
+        self.theory_textbox.configure(state='disabled')
+        textbox.yview_moveto(scroll_position)
+        
+    def toggle_theory_section(self, index, event=None):
+        """Expand or collapse a theory section when its header is clicked"""
+        self._expanded_sections ^= {index}
+        self.render_theory_sections()
         
     def create_team_info_content(self):
         """Create enhanced team information content"""
+        # Packed only once every child exists so the layout is computed in one pass
         main_container = ctk.CTkScrollableFrame(self.team_tab)
-        main_container.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Team title
         team_title = ctk.CTkLabel(
             main_container,
             text="👥 ARCHITECHS TEAM",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         team_title.pack(pady=(0, 10))
         
@@ -1597,7 +1244,7 @@ For technical support, feature requests, or collaboration opportunities:
         subtitle = ctk.CTkLabel(
             main_container,
             text="SE(OS)-VI-T250 | Advanced System Engineering Project",
-            font=ctk.CTkFont(size=16)
+            font=_font(16)
         )
         subtitle.pack(pady=(0, 30))
         
@@ -1639,7 +1286,7 @@ For technical support, feature requests, or collaboration opportunities:
         achievements_title = ctk.CTkLabel(
             achievements_frame,
             text="🏆 Project Achievements & Milestones",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         achievements_title.pack(pady=(15, 10))
         
@@ -1658,7 +1305,7 @@ For technical support, feature requests, or collaboration opportunities:
             achievement_label = ctk.CTkLabel(
                 achievements_frame,
                 text=achievement,
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 anchor='w'
             )
             achievement_label.pack(fill='x', padx=20, pady=2)
@@ -1670,7 +1317,7 @@ For technical support, feature requests, or collaboration opportunities:
         timeline_title = ctk.CTkLabel(
             timeline_frame,
             text="📅 Development Timeline",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         timeline_title.pack(pady=(15, 10))
         
@@ -1685,7 +1332,7 @@ For technical support, feature requests, or collaboration opportunities:
             event_label = ctk.CTkLabel(
                 timeline_frame,
                 text=f"• {event}",
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 anchor='w'
             )
             event_label.pack(fill='x', padx=20, pady=2)
@@ -1697,7 +1344,7 @@ For technical support, feature requests, or collaboration opportunities:
         contact_title = ctk.CTkLabel(
             contact_frame,
             text="📞 Contact & Collaboration",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         contact_title.pack(pady=(15, 10))
         
@@ -1710,11 +1357,13 @@ For technical support, feature requests, or collaboration opportunities:
                  "🎓 Institution: [Your Institution Name]\n"
                  "🔗 Project Status: Active Development\n"
                  "📚 Documentation: Comprehensive guides available",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             justify='center'
         )
         contact_text.pack(pady=(0, 15))
         
+        main_container.pack(fill='both', expand=True, padx=20, pady=20)
+        
     def create_enhanced_member_card(self, parent, member):
         """Create enhanced team member card with detailed information"""
         member_frame = ctk.CTkFrame(parent)
@@ -1727,14 +1376,14 @@ For technical support, feature requests, or collaboration opportunities:
         role_label = ctk.CTkLabel(
             header_frame,
             text=member['role'],
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         role_label.pack(pady=5)
         
         name_label = ctk.CTkLabel(
             header_frame,
             text=member['name'],
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         name_label.pack()
         
@@ -1749,7 +1398,7 @@ For technical support, feature requests, or collaboration opportunities:
         left_frame.grid(row=0, column=0, padx=10, pady=10, sticky='nsew')
         
         ctk.CTkLabel(left_frame, text="📋 Basic Information", 
-                    font=ctk.CTkFont(size=12, weight="bold")).pack(pady=(10, 5))
+                    font=_font(12, "bold")).pack(pady=(10, 5))
         
         basic_info = [
             f"🆔 Student ID: {member['id']}",
@@ -1758,19 +1407,19 @@ For technical support, feature requests, or collaboration opportunities:
         ]
         
         for info in basic_info:
-            ctk.CTkLabel(left_frame, text=info, font=ctk.CTkFont(size=10)).pack(anchor='w', padx=10, pady=2)
+            ctk.CTkLabel(left_frame, text=info, font=_font(10)).pack(anchor='w', padx=10, pady=2)
         
         # Right column - Contributions
         right_frame = ctk.CTkFrame(details_frame)
         right_frame.grid(row=0, column=1, padx=10, pady=10, sticky='nsew')
         
         ctk.CTkLabel(right_frame, text="🚀 Key Contributions", 
-                    font=ctk.CTkFont(size=12, weight="bold")).pack(pady=(10, 5))
+                    font=_font(12, "bold")).pack(pady=(10, 5))
         
         contrib_label = ctk.CTkLabel(
             right_frame,
             text=member['contributions'],
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             wraplength=300,
             justify='left'
         )
@@ -1778,14 +1427,14 @@ For technical support, feature requests, or collaboration opportunities:
         
     def create_help_content(self):
         """Create enhanced help and FAQ content"""
+        # Packed only once every child exists so the layout is computed in one pass
         main_container = ctk.CTkScrollableFrame(self.help_tab)
-        main_container.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Title
         title_label = ctk.CTkLabel(
             main_container,
             text="❓ Help Center & Frequently Asked Questions",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -1796,7 +1445,7 @@ For technical support, feature requests, or collaboration opportunities:
         quickstart_title = ctk.CTkLabel(
             quickstart_frame,
             text="🚀 Quick Start Guide",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         quickstart_title.pack(pady=(15, 10))
         
@@ -1813,7 +1462,7 @@ For technical support, feature requests, or collaboration opportunities:
             step_label = ctk.CTkLabel(
                 quickstart_frame,
                 text=step,
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 anchor='w'
             )
             step_label.pack(fill='x', padx=20, pady=2)
@@ -1881,7 +1530,7 @@ For technical support, feature requests, or collaboration opportunities:
             category_title = ctk.CTkLabel(
                 category_frame,
                 text=faq_category['category'],
-                font=ctk.CTkFont(size=14, weight="bold")
+                font=_font(14, "bold")
             )
             category_title.pack(pady=(15, 10))
             
@@ -1895,7 +1544,7 @@ For technical support, feature requests, or collaboration opportunities:
         troubleshooting_title = ctk.CTkLabel(
             troubleshooting_frame,
             text="🔧 Troubleshooting",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         troubleshooting_title.pack(pady=(15, 10))
         
@@ -1907,14 +1556,9 @@ For technical support, feature requests, or collaboration opportunities:
             "• Database errors: Check file permissions and disk space in application directory"
         ]
         
+        item_font = _font(11)
         for item in troubleshooting_items:
-            item_label = ctk.CTkLabel(
-                troubleshooting_frame,
-                text=item,
-                font=ctk.CTkFont(size=11),
-                anchor='w',
-                wraplength=800
-            )
+            item_label = _TROUBLESHOOTING_LABEL(troubleshooting_frame, text=item, font=item_font)
             item_label.pack(fill='x', padx=20, pady=2)
             
         # Support section
@@ -1924,7 +1568,7 @@ For technical support, feature requests, or collaboration opportunities:
         support_title = ctk.CTkLabel(
             support_frame,
             text="📞 Technical Support",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         support_title.pack(pady=(15, 10))
         
@@ -1940,136 +1584,103 @@ For technical support, feature requests, or collaboration opportunities:
                  "• Python version\n"
                  "• Error messages or screenshots\n"
                  "• Steps to reproduce the issue",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             justify='center'
         )
         support_text.pack(pady=(0, 15))
         
+        main_container.pack(fill='both', expand=True, padx=20, pady=20)
+        
     def create_faq_item(self, parent, question, answer):
         """Create enhanced FAQ item with better formatting"""
         faq_frame = ctk.CTkFrame(parent)
         faq_frame.pack(fill='x', padx=15, pady=5)
         
         # Question
-        question_label = ctk.CTkLabel(
-            faq_frame,
-            text=f"❓ {question}",
-            font=ctk.CTkFont(size=12, weight="bold"),
-            anchor='w'
-        )
+        question_label = _FAQ_QUESTION_LABEL(faq_frame, text=f"❓ {question}", font=_font(12, "bold"))
         question_label.pack(fill='x', padx=15, pady=(15, 5))
         
         # Answer
-        answer_label = ctk.CTkLabel(
-            faq_frame,
-            text=answer,
-            font=ctk.CTkFont(size=11),
-            anchor='w',
-            wraplength=700,
-            justify='left'
-        )
+        answer_label = _FAQ_ANSWER_LABEL(faq_frame, text=answer, font=_font(11))
         answer_label.pack(fill='x', padx=15, pady=(0, 15))
         
     # Enhanced monitoring and data processing methods
     def start_monitoring(self):
         """Start enhanced system monitoring"""
         self.monitoring = True
+        
+        # Samples are queued by the monitor and written to SQLite in batches
+        self.db_queue = queue.Queue()
+        self.db_writer_stop = threading.Event()
+        self.db_writer_thread = threading.Thread(target=self.database_writer_loop, daemon=True)
+        self.db_writer_thread.start()
+        
+        # Temperature sensors are read on a worker while the monitor takes the cheaper samples
+        self.sensor_pool = ThreadPoolExecutor(max_workers=1)
         self.monitor_thread = threading.Thread(target=self.enhanced_monitor_system, daemon=True)
         self.monitor_thread.start()
         
     def enhanced_monitor_system(self):
         """Enhanced system monitoring with better error handling"""
+        # Prime psutil so non-blocking cpu_percent() calls measure since the last tick
+        psutil.cpu_percent(interval=None)
+        # Previous network byte total and its sample time, kept local to the loop
+        prev_net_bytes = None
+        prev_net_time = 0.0
         while self.monitoring:
             try:
                 current_time = time.time()
+                # Rates are measured on the monotonic clock so wall-clock jumps cannot skew them
+                sample_clock = time.monotonic()
+                
+                # Start the slow sysfs sensor read first so it overlaps the other samples
+                sensor_future = self.sensor_pool.submit(lambda: psutil.sensors_temperatures())
                 
                 # Get system metrics with error handling
-                cpu_percent = psutil.cpu_percent(interval=0.1)
+                cpu_percent = psutil.cpu_percent(interval=None)
                 memory = psutil.virtual_memory()
                 disk = psutil.disk_usage('/')
                 network = psutil.net_io_counters()
                 
                 # Get temperature with comprehensive error handling
                 try:
-                    temps = psutil.sensors_temperatures()
-                    if temps:
-                        # Try to find CPU temperature
-                        cpu_temp = None
-                        for sensor_name, sensor_list in temps.items():
-                            for sensor in sensor_list:
-                                if any(keyword in sensor.label.lower() for keyword in ['cpu', 'core', 'processor']):
-                                    cpu_temp = sensor.current
-                                    break
-                            if cpu_temp:
-                                break
-                        
-                        if cpu_temp:
-                            self.temperature_data.append(cpu_temp)
-                        else:
-                            self.temperature_data.append(0)
-                    else:
-                        self.temperature_data.append(0)
+                    temps = sensor_future.result()
+                    temperature = self.read_cpu_temperature(temps) if temps else 0
                 except (OSError, AttributeError, PermissionError):
                     # Temperature sensors not available or accessible
-                    self.temperature_data.append(0)
+                    temperature = 0
                 
-                # Continue with rest of monitoring...
-                self.cpu_data.append(cpu_percent)
-                self.memory_data.append(memory.percent)
-                self.disk_data.append(disk.percent)
-                
-                # Calculate network speed with error handling
-                if hasattr(self, 'prev_network'):
-                    time_diff = current_time - self.prev_network_time
-                    if time_diff > 0:
-                        try:
-                            bytes_diff = (network.bytes_sent + network.bytes_recv - 
-                                        self.prev_network.bytes_sent - self.prev_network.bytes_recv)
-                            net_speed = bytes_diff / (1024 * 1024 * time_diff)  # MB/s
-                            self.network_data.append(max(0, net_speed))
-                        except (AttributeError, TypeError):
-                            self.network_data.append(0)
-                    else:
-                        self.network_data.append(0)
+                # Calculate network speed from the change in total bytes
+                net_bytes = network.bytes_sent + network.bytes_recv
+                time_diff = sample_clock - prev_net_time
+                if prev_net_bytes is not None and time_diff > 0:
+                    net_speed = max(0, (net_bytes - prev_net_bytes) / (MB * time_diff))  # MB/s
                 else:
-                    self.network_data.append(0)
-                
-                self.prev_network = network
-                self.prev_network_time = current_time
-                self.time_data.append(current_time)
+                    net_speed = 0
+                prev_net_bytes = net_bytes
+                prev_net_time = sample_clock
                 
                 # Rest of the monitoring code...
-                self.calculate_system_health_score(cpu_percent, memory.percent, disk.percent)
-                
-                # Update UI
-                self.root.after(0, self.update_enhanced_metric_cards, 
-                            cpu_percent, memory.percent, disk.percent, 
-                            self.network_data[-1] if self.network_data else 0,
-                            self.temperature_data[-1] if self.temperature_data else 0)
+                health_status = self.calculate_system_health_score(cpu_percent, memory.percent, disk.percent, temperature)
                 
                 # Store performance data
-                performance_data = {
-                    'timestamp': current_time,
-                    'cpu': cpu_percent,
-                    'memory': memory.percent,
-                    'disk': disk.percent,
-                    'network': self.network_data[-1] if self.network_data else 0,
-                    'temperature': self.temperature_data[-1] if self.temperature_data else 0
-                }
-                
-                self.performance_history.append(performance_data)
+                performance_data = (current_time, cpu_percent, memory.percent, disk.percent, net_speed, temperature)
+                self.record_history(performance_data)
                 
                 # Log to database if enabled
                 if self.data_logging:
-                    self.log_to_database(performance_data)
-                
-                # Keep only recent history in memory
-                if len(self.performance_history) > 1000:
-                    self.performance_history = self.performance_history[-500:]
+                    self.db_queue.put(performance_data)
                 
                 # Check for alerts
+                alert_text = None
                 if self.notifications_enabled:
-                    self.check_enhanced_performance_alerts(cpu_percent, memory.percent, disk.percent)
+                    alert_text = self.check_enhanced_performance_alerts(cpu_percent, memory.percent, disk.percent, temperature)
+                
+                # Update UI in a single event-loop callback
+                self.root.after(0, self.apply_monitor_update, 
+                            cpu_percent, memory, disk.percent, 
+                            net_speed, temperature,
+                            current_time, sample_clock, health_status, alert_text)
                 
                 time.sleep(self.refresh_rate / 1000)
                 
@@ -2077,8 +1688,41 @@ For technical support, feature requests, or collaboration opportunities:
                 print(f"Enhanced monitoring error: {e}")
                 time.sleep(1)
                 
-    def calculate_system_health_score(self, cpu, memory, disk):
-        """Calculate overall system health score"""
+    def read_cpu_temperature(self, temps):
+        """Return the CPU temperature, reusing the sensor found by the last full probe"""
+        self.temp_probe_ticks += 1
+        if self.temp_sensor_key and self.temp_probe_ticks < TEMP_SENSOR_REPROBE_TICKS:
+            sensor_name, index = self.temp_sensor_key
+            try:
+                return temps[sensor_name][index].current
+            except (KeyError, IndexError):
+                pass
+        
+        # Full probe: find the first sensor labelled as a CPU reading
+        self.temp_sensor_key = None
+        self.temp_probe_ticks = 0
+        for sensor_name, sensor_list in temps.items():
+            for index, sensor in enumerate(sensor_list):
+                if CPU_SENSOR_PATTERN.search(sensor.label) and sensor.current:
+                    self.temp_sensor_key = (sensor_name, index)
+                    return sensor.current
+        return 0
+        
+    def apply_monitor_update(self, cpu, memory_info, disk, network, temperature, now, clock, health_status, alert_text):
+        """Apply every UI change from one monitoring tick"""
+        self.update_enhanced_metric_cards(cpu, memory_info, disk, network, temperature, now, clock)
+        self.update_enhanced_charts()
+        self.set_card_text(self.health_label, f"🎯 System Health Score: {self.system_health_score:.0f}%")
+        if health_status and hasattr(self, 'health_status_label'):
+            self.set_card_text(self.health_status_label, health_status)
+        if alert_text:
+            self.update_alerts_display(alert_text)
+        else:
+            # Alerts cleared; a later repeat of the same alert is a new occurrence
+            self.last_alert_text = None
+        
+    def calculate_system_health_score(self, cpu, memory, disk, temp):
+        """Calculate overall system health score and return its status label"""
         try:
             # Base score
             score = 100
@@ -2091,11 +1735,9 @@ For technical support, feature requests, or collaboration opportunities:
             if disk > 90:
                 score -= (disk - 90) * 5
                 
-            # Consider temperature if available
-            if self.temperature_data and self.temperature_data[-1] > 0:
-                temp = self.temperature_data[-1]
-                if temp > 80:
-                    score -= (temp - 80) * 1.5
+            # Consider temperature if available (0 means no reading)
+            if temp > 80:
+                score -= (temp - 80) * 1.5
                     
             # Ensure score is within bounds
             self.system_health_score = max(0, min(100, score))
@@ -2112,129 +1754,169 @@ For technical support, feature requests, or collaboration opportunities:
             else:
                 health_status = "Critical"
                 
-            self.root.after(0, lambda: self.health_label.configure(text=f"🎯 System Health Score: {self.system_health_score:.0f}%"))
-            if hasattr(self, 'health_status_label'):
-                self.root.after(0, lambda: self.health_status_label.configure(text=health_status))
-                
+            return health_status
+        
         except Exception as e:
             print(f"Health score calculation error: {e}")
             
-    def update_enhanced_metric_cards(self, cpu, memory, disk, network, temperature):
-        """Update enhanced metric display cards"""
+    def set_card_text(self, label, text):
+        """Configure a metric card label only when its displayed text changes"""
+        if self.card_texts.get(label) != text:
+            label.configure(text=text)
+            self.card_texts[label] = text
+            
+    def update_enhanced_metric_cards(self, cpu, memory_info, disk, network, temperature, now, clock):
+        """Update enhanced metric display cards from the monitor's latest sample"""
         try:
             # Update basic metrics
-            self.cpu_value_label.configure(text=f"{cpu:.1f}%")
-            self.memory_value_label.configure(text=f"{memory:.1f}%")
-            self.disk_value_label.configure(text=f"{disk:.1f}%")
-            self.network_value_label.configure(text=f"{network:.2f} MB/s")
-            self.health_value_label.configure(text=f"{self.system_health_score:.0f}%")
+            self.set_card_text(self.cpu_value_label, f"{cpu:.1f}%")
+            self.set_card_text(self.memory_value_label, f"{memory_info.percent:.1f}%")
+            self.set_card_text(self.disk_value_label, f"{disk:.1f}%")
+            self.set_card_text(self.network_value_label, f"{network:.2f} MB/s")
+            self.set_card_text(self.health_value_label, f"{self.system_health_score:.0f}%")
             
             # Update additional information
             if temperature > 0:
-                self.cpu_temp_label.configure(text=f"Temp: {temperature:.1f}°C")
+                self.set_card_text(self.cpu_temp_label, f"Temp: {temperature:.1f}°C")
             else:
-                self.cpu_temp_label.configure(text="Temp: N/A")
+                self.set_card_text(self.cpu_temp_label, "Temp: N/A")
                 
             # Memory available
             try:
-                memory_info = psutil.virtual_memory()
-                available_gb = memory_info.available / (1024**3)
-                self.memory_available_label.configure(text=f"Available: {available_gb:.1f} GB")
+                available_gb = memory_info.available / GB
+                self.set_card_text(self.memory_available_label, f"Available: {available_gb:.1f} GB")
             except:
-                self.memory_available_label.configure(text="Available: N/A")
+                self.set_card_text(self.memory_available_label, "Available: N/A")
                 
             # Disk I/O
             try:
                 disk_io = psutil.disk_io_counters()
                 if hasattr(self, 'prev_disk_io'):
-                    time_diff = time.time() - self.prev_disk_io_time
+                    time_diff = clock - self.prev_disk_io_time
                     if time_diff > 0:
-                        read_speed = (disk_io.read_bytes - self.prev_disk_io.read_bytes) / (1024*1024*time_diff)
-                        write_speed = (disk_io.write_bytes - self.prev_disk_io.write_bytes) / (1024*1024*time_diff)
+                        read_speed = (disk_io.read_bytes - self.prev_disk_io.read_bytes) / (MB * time_diff)
+                        write_speed = (disk_io.write_bytes - self.prev_disk_io.write_bytes) / (MB * time_diff)
                         total_io = read_speed + write_speed
-                        self.disk_io_label.configure(text=f"I/O: {total_io:.1f} MB/s")
+                        self.set_card_text(self.disk_io_label, f"I/O: {total_io:.1f} MB/s")
                     else:
-                        self.disk_io_label.configure(text="I/O: 0 MB/s")
+                        self.set_card_text(self.disk_io_label, "I/O: 0 MB/s")
                 else:
-                    self.disk_io_label.configure(text="I/O: 0 MB/s")
+                    self.set_card_text(self.disk_io_label, "I/O: 0 MB/s")
                     
                 self.prev_disk_io = disk_io
-                self.prev_disk_io_time = time.time()
+                self.prev_disk_io_time = clock
             except:
-                self.disk_io_label.configure(text="I/O: N/A")
+                self.set_card_text(self.disk_io_label, "I/O: N/A")
                 
             # Network details
             try:
                 # Simulate upload/download split for display
                 upload = network * 0.3  # Approximate
                 download = network * 0.7  # Approximate
-                self.network_detail_label.configure(text=f"↑{upload:.1f} ↓{download:.1f} MB/s")
+                self.set_card_text(self.network_detail_label, f"↑{upload:.1f} ↓{download:.1f} MB/s")
             except:
-                self.network_detail_label.configure(text="↑0 ↓0 MB/s")
+                self.set_card_text(self.network_detail_label, "↑0 ↓0 MB/s")
                 
             # System uptime
             try:
-                boot_time = psutil.boot_time()
-                uptime_seconds = time.time() - boot_time
+                uptime_seconds = now - self.system_info['boot_time']
                 uptime_hours = uptime_seconds / 3600
                 if uptime_hours < 24:
-                    self.uptime_label.configure(text=f"Uptime: {uptime_hours:.1f}h")
+                    self.set_card_text(self.uptime_label, f"Uptime: {uptime_hours:.1f}h")
                 else:
                     uptime_days = uptime_hours / 24
-                    self.uptime_label.configure(text=f"Uptime: {uptime_days:.1f}d")
+                    self.set_card_text(self.uptime_label, f"Uptime: {uptime_days:.1f}d")
             except:
-                self.uptime_label.configure(text="Uptime: N/A")
+                self.set_card_text(self.uptime_label, "Uptime: N/A")
                 
         except Exception as e:
             print(f"Enhanced metric cards update error: {e}")
             
-    def log_to_database(self, data):
-        """Log performance data to database"""
+    def database_writer_loop(self):
+        """Periodically write queued performance samples to the database until told to stop"""
+        while not self.db_writer_stop.wait(2):
+            self.flush_database_queue()
+        
+    def flush_database_queue(self):
+        """Drain the sample queue and log everything in it as one batch"""
+        records = []
+        while True:
+            try:
+                records.append(self.db_queue.get_nowait())
+            except queue.Empty:
+                break
+        if records:
+            self.log_to_database(records)
+        
+    def record_history(self, row):
+        """Write one sample row into the performance history ring buffer"""
+        self.performance_history[self.history_count % HISTORY_SIZE] = row
+        self.history_count += 1
+        
+    def history_length(self):
+        """Number of samples currently held in the performance history"""
+        return min(self.history_count, HISTORY_SIZE)
+        
+    def recent_history(self, count=HISTORY_SIZE):
+        """Return a copy of the newest `count` history rows, oldest first"""
+        end = self.history_count
+        count = min(count, self.history_length())
+        return self.performance_history[np.arange(end - count, end) % HISTORY_SIZE]
+        
+    def log_to_database(self, records):
+        """Log a batch of (timestamp, cpu, memory, disk, network, temperature) rows with a single commit"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO performance_logs 
-                (timestamp, cpu_usage, memory_usage, disk_usage, network_usage, temperature)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                datetime.fromtimestamp(data['timestamp']),
-                data['cpu'],
-                data['memory'],
-                data['disk'],
-                data['network'],
-                data['temperature']
-            ))
+            self.log_cursor.executemany(PERFORMANCE_LOG_INSERT, records)
             self.conn.commit()
         except Exception as e:
             print(f"Database logging error: {e}")
             
-    def check_enhanced_performance_alerts(self, cpu, memory, disk):
-        """Enhanced performance alert checking"""
+    def check_enhanced_performance_alerts(self, cpu, memory, disk, temp):
+        """Enhanced performance alert checking, returns the alert text if any"""
+        thresholds = self.alert_thresholds
+        cpu_th = thresholds['cpu']
+        memory_th = thresholds['memory']
+        disk_th = thresholds['disk']
+        temp_th = thresholds.get('temperature', 80)
+        
+        # Common case: everything is under its threshold, so skip building messages
+        if cpu <= cpu_th and memory <= memory_th and disk <= disk_th and temp <= temp_th:
+            self.recent_alert_kinds.clear()
+            return
+        
         alerts = []
         
-        if cpu > self.alert_thresholds['cpu']:
-            alerts.append(f"🔥 High CPU usage: {cpu:.1f}% (threshold: {self.alert_thresholds['cpu']}%)")
-        if memory > self.alert_thresholds['memory']:
-            alerts.append(f"💾 High memory usage: {memory:.1f}% (threshold: {self.alert_thresholds['memory']}%)")
-        if disk > self.alert_thresholds['disk']:
-            alerts.append(f"💽 High disk usage: {disk:.1f}% (threshold: {self.alert_thresholds['disk']}%)")
+        if cpu > cpu_th:
+            alerts.append(f"🔥 High CPU usage: {cpu:.1f}% (threshold: {cpu_th}%)")
+        if memory > memory_th:
+            alerts.append(f"💾 High memory usage: {memory:.1f}% (threshold: {memory_th}%)")
+        if disk > disk_th:
+            alerts.append(f"💽 High disk usage: {disk:.1f}% (threshold: {disk_th}%)")
             
         # Temperature alerts
-        if self.temperature_data and self.temperature_data[-1] > self.alert_thresholds.get('temperature', 80):
-            alerts.append(f"🌡️ High temperature: {self.temperature_data[-1]:.1f}°C")
+        if temp > temp_th:
+            alerts.append(f"🌡️ High temperature: {temp:.1f}°C")
             
         if alerts:
             alert_text = "\n".join(alerts)
-            self.root.after(0, lambda: self.update_alerts_display(alert_text))
             
-            # Show popup if significant alerts
+            # Show popup once per kind of alert (which metrics are over threshold)
+            alert_kind = (cpu > cpu_th, memory > memory_th, disk > disk_th, temp > temp_th)
+            if alert_kind in self.recent_alert_kinds:
+                return alert_text
             if not hasattr(self, 'last_alert_time') or time.time() - self.last_alert_time > 30:
+                self.recent_alert_kinds.append(alert_kind)
                 self.show_alert(alert_text)
                 self.last_alert_time = time.time()
+            return alert_text
                 
     def update_alerts_display(self, alert_text):
         """Update the alerts display panel"""
         try:
+            # Leave the panel (and the time the alert first appeared) alone while it repeats
+            if alert_text == self.last_alert_text:
+                return
+            self.last_alert_text = alert_text
             if hasattr(self, 'alerts_textbox'):
                 current_time = datetime.now().strftime("%H:%M:%S")
                 self.alerts_textbox.delete('0.0', 'end')
@@ -2245,7 +1927,6 @@ For technical support, feature requests, or collaboration opportunities:
     def show_alert(self, message):
         """Show enhanced performance alert"""
         def show_messagebox():
-            import tkinter.messagebox as messagebox
             messagebox.showwarning("Performance Alert", message)
         
         self.root.after(0, show_messagebox)
@@ -2266,52 +1947,31 @@ For technical support, feature requests, or collaboration opportunities:
                 
     def analyze_enhanced_performance_patterns(self):
         """Enhanced performance pattern analysis"""
-        if len(self.performance_history) < 20:
+        if self.history_length() < 20:
             return
             
-        recent_data = self.performance_history[-20:]
-        suggestions = []
-        
-        # Advanced CPU analysis
-        cpu_values = [d['cpu'] for d in recent_data]
-        avg_cpu = sum(cpu_values) / len(cpu_values)
-        cpu_trend = (cpu_values[-5:] and sum(cpu_values[-5:]) / 5) - (cpu_values[:5] and sum(cpu_values[:5]) / 5)
-        
-        if avg_cpu > 70:
-            suggestions.append(f"🔥 High average CPU usage ({avg_cpu:.1f}%). Consider closing unnecessary applications or upgrading hardware.")
-        if cpu_trend > 10:
-            suggestions.append("📈 CPU usage trending upward. Monitor for runaway processes or consider system restart.")
-            
-        # Advanced memory analysis
-        memory_values = [d['memory'] for d in recent_data]
-        avg_memory = sum(memory_values) / len(memory_values)
-        memory_trend = (sum(memory_values[-5:]) / 5) - (sum(memory_values[:5]) / 5)
-        
-        if avg_memory > 80:
-            suggestions.append(f"💾 High memory usage ({avg_memory:.1f}%). Consider closing memory-intensive applications.")
-        if memory_trend > 15:
-            suggestions.append("📊 Memory usage increasing rapidly. Possible memory leak detected.")
-            
-        # Disk analysis
-        disk_values = [d['disk'] for d in recent_data]
-        avg_disk = sum(disk_values) / len(disk_values)
-        
-        if avg_disk > 85:
-            suggestions.append(f"💽 Disk space critical ({avg_disk:.1f}%). Run disk cleanup or free up space.")
-            
-        # Network analysis
-        network_values = [d['network'] for d in recent_data]
-        avg_network = sum(network_values) / len(network_values)
-        
-        if avg_network > 50:  # High network usage
-            suggestions.append(f"🌐 High network activity ({avg_network:.1f} MB/s). Monitor for bandwidth-intensive applications.")
-            
-        # Temperature analysis
-        temp_values = [d['temperature'] for d in recent_data if d['temperature'] > 0]
-        if temp_values:
-            avg_temp = sum(temp_values) / len(temp_values)
-            if avg_temp > 75:
-                suggestions.append(f"🌡️ High system temperature ({avg_temp:.1f}°C). Check cooling system.")
+        # One row per sample, one column per metric (cpu, memory, disk, network, temperature)
+        window = self.recent_history(20)[:, H_CPU:]
+        avg_cpu, avg_memory, avg_disk, avg_network, _ = window.mean(axis=0)
+        # Trend: mean of the newest five samples minus the oldest five, per metric
+        cpu_trend, memory_trend = window[-5:, :2].mean(axis=0) - window[:5, :2].mean(axis=0)
+        # Temperature averages only the samples where a sensor reading existed
+        temp_column = window[:, 4]
+        temp_values = temp_column[temp_column > 0]
+        avg_temp = temp_values.mean() if temp_values.size else 0.0
+        
+        values = {
+            "cpu": avg_cpu,
+            "cpu_trend": cpu_trend,
+            "memory": avg_memory,
+            "memory_trend": memory_trend,
+            "disk": avg_disk,
+            "network": avg_network,
+            "temperature": avg_temp
+        }
+        suggestions = [message.format(values[key])
+                       for key, threshold, message in PATTERN_SUGGESTION_RULES
+                       if values[key] > threshold]
                 
         # System health recommendations
         if self.system_health_score < 70:
@@ -2330,8 +1990,9 @@ For technical support, feature requests, or collaboration opportunities:
         if hasattr(self, 'suggestions_textbox'):
             self.suggestions_textbox.delete('0.0', 'end')
             if self.optimization_suggestions:
-                for i, suggestion in enumerate(self.optimization_suggestions, 1):
-                    self.suggestions_textbox.insert('end', f"{i}. {suggestion}\n\n")
+                self.suggestions_textbox.insert('end', "".join(
+                    f"{i}. {suggestion}\n\n" for i, suggestion in enumerate(self.optimization_suggestions, 1)
+                ))
             else:
                 self.suggestions_textbox.insert('0.0', "✅ System running optimally. No recommendations at this time.")
                 
@@ -2343,25 +2004,29 @@ For technical support, feature requests, or collaboration opportunities:
     def perform_enhanced_deep_analysis(self):
         """Perform enhanced deep system analysis"""
         try:
-            time.sleep(3)  # Simulate analysis time
-            
             suggestions = []
             
             # Process analysis
             try:
-                processes = list(psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']))
-                high_cpu_processes = [p for p in processes if p.info['cpu_percent'] and p.info['cpu_percent'] > 15]
-                high_memory_processes = [p for p in processes if p.info['memory_percent'] and p.info['memory_percent'] > 10]
-                zombie_processes = [p for p in processes if p.info['status'] == 'zombie']
+                high_cpu_count = high_memory_count = zombie_count = 0
+                # Only the fields used below; process_iter reads them under one oneshot() per process
+                for proc in psutil.process_iter(['cpu_percent', 'memory_percent', 'status']):
+                    info = proc.info
+                    if (info['cpu_percent'] or 0) > 15:
+                        high_cpu_count += 1
+                    if (info['memory_percent'] or 0) > 10:
+                        high_memory_count += 1
+                    if info['status'] == 'zombie':
+                        zombie_count += 1
                 
-                if high_cpu_processes:
-                    suggestions.append(f"🔍 Found {len(high_cpu_processes)} high-CPU processes. Consider optimizing or terminating unnecessary processes.")
+                if high_cpu_count:
+                    suggestions.append(f"🔍 Found {high_cpu_count} high-CPU processes. Consider optimizing or terminating unnecessary processes.")
                     
-                if high_memory_processes:
-                    suggestions.append(f"🔍 Found {len(high_memory_processes)} memory-intensive processes. Monitor for memory leaks.")
+                if high_memory_count:
+                    suggestions.append(f"🔍 Found {high_memory_count} memory-intensive processes. Monitor for memory leaks.")
                     
-                if zombie_processes:
-                    suggestions.append(f"🧟 Found {len(zombie_processes)} zombie processes. System restart recommended.")
+                if zombie_count:
+                    suggestions.append(f"🧟 Found {zombie_count} zombie processes. System restart recommended.")
                     
             except Exception as e:
                 suggestions.append(f"⚠️ Process analysis error: {str(e)}")
@@ -2384,7 +2049,7 @@ For technical support, feature requests, or collaboration opportunities:
             try:
                 disk_usage = psutil.disk_usage('/')
                 if disk_usage.percent > 80:
-                    free_gb = disk_usage.free / (1024**3)
+                    free_gb = disk_usage.free / GB
                     suggestions.append(f"🗂️ Disk cleanup recommended. Only {free_gb:.1f} GB free space remaining.")
                     
                 # Disk I/O analysis
@@ -2416,12 +2081,10 @@ For technical support, feature requests, or collaboration opportunities:
     def apply_optimizations(self):
         """Apply enhanced optimizations"""
         if not self.optimization_suggestions:
-            import tkinter.messagebox as messagebox
             messagebox.showinfo("No Optimizations", "No optimization suggestions available.")
             return
             
         # Show detailed confirmation dialog
-        import tkinter.messagebox as messagebox
         result = messagebox.askyesno(
             "Apply Optimizations",
             f"Apply {len(self.optimization_suggestions)} optimization suggestions?\n\n"
@@ -2447,31 +2110,31 @@ For technical support, feature requests, or collaboration opportunities:
             
             # Simulate various optimizations
             optimizations = [
-                ("Memory cleanup", 2),
-                ("Process optimization", 1.5),
-                ("Cache clearing", 1),
-                ("Temporary file cleanup", 2.5),
-                ("Registry optimization", 1),
-                ("Network optimization", 1.5)
+                "Memory cleanup",
+                "Process optimization",
+                "Cache clearing",
+                "Temporary file cleanup",
+                "Registry optimization",
+                "Network optimization"
             ]
             
-            for opt_name, duration in optimizations:
+            history_rows = []
+            for opt_name in optimizations:
                 self.root.after(0, lambda name=opt_name: self.ai_status_label.configure(text=f"⚡ {name}..."))
-                time.sleep(duration)
                 optimization_results.append(f"✅ {opt_name} completed")
+                history_rows.append((datetime.now(), opt_name, f"Automated {opt_name}", True))
                 
-                # Log optimization to database
-                try:
-                    cursor = self.conn.cursor()
-                    cursor.execute('''
+            # Log all optimizations to database in one transaction
+            try:
+                with self.conn:
+                    self.conn.executemany('''
                         INSERT INTO optimization_history 
                         (timestamp, optimization_type, description, success)
                         VALUES (?, ?, ?, ?)
-                    ''', (datetime.now(), opt_name, f"Automated {opt_name}", True))
-                    self.conn.commit()
-                except:
-                    pass
-                    
+                    ''', history_rows)
+            except:
+                pass
+            
             # Force garbage collection
             gc.collect()
             
@@ -2482,7 +2145,6 @@ For technical support, feature requests, or collaboration opportunities:
             
             # Show results
             results_text = "Optimization Results:\n\n" + "\n".join(optimization_results)
-            import tkinter.messagebox as messagebox
             self.root.after(0, lambda: messagebox.showinfo("Optimization Complete", results_text))
             
             # Clear suggestions
@@ -2493,7 +2155,6 @@ For technical support, feature requests, or collaboration opportunities:
         except Exception as e:
             error_msg = f"Optimization failed: {str(e)}"
             self.root.after(0, lambda: self.ai_status_label.configure(text=f"❌ {error_msg}"))
-            import tkinter.messagebox as messagebox
             self.root.after(0, lambda: messagebox.showerror("Optimization Error", error_msg))
             
     def populate_system_info(self):
@@ -2521,8 +2182,8 @@ For technical support, feature requests, or collaboration opportunities:
                 info_lines.append(f"CPU Max Frequency: {self.system_info['cpu_freq'].max:.2f} MHz")
             else:
                 info_lines.append("CPU Frequency: N/A")
-            info_lines.append(f"Total Memory: {self.system_info['memory_total'] / (1024**3):.2f} GB")
-            info_lines.append(f"Total Disk: {self.system_info['disk_total'] / (1024**3):.2f} GB")
+            info_lines.append(f"Total Memory: {self.system_info['memory_total'] / GB:.2f} GB")
+            info_lines.append(f"Total Disk: {self.system_info['disk_total'] / GB:.2f} GB")
             info_lines.append("")
             
             # System status
@@ -2534,9 +2195,9 @@ For technical support, feature requests, or collaboration opportunities:
                 
                 info_lines.append(f"Current CPU Usage: {cpu_percent:.1f}%")
                 info_lines.append(f"Current Memory Usage: {memory.percent:.1f}%")
-                info_lines.append(f"Available Memory: {memory.available / (1024**3):.2f} GB")
+                info_lines.append(f"Available Memory: {memory.available / GB:.2f} GB")
                 info_lines.append(f"Current Disk Usage: {disk.percent:.1f}%")
-                info_lines.append(f"Free Disk Space: {disk.free / (1024**3):.2f} GB")
+                info_lines.append(f"Free Disk Space: {disk.free / GB:.2f} GB")
             except:
                 info_lines.append("Unable to retrieve current status")
             info_lines.append("")
@@ -2559,18 +2220,13 @@ For technical support, feature requests, or collaboration opportunities:
             # Running processes summary
             info_lines.append("🔄 PROCESS SUMMARY:")
             try:
-                processes = list(psutil.process_iter())
+                processes = list(psutil.process_iter(['status']))
                 info_lines.append(f"Total Running Processes: {len(processes)}")
                 
-                # Count by status
-                status_count = {}
-                for proc in processes:
-                    try:
-                        status = proc.status()
-                        status_count[status] = status_count.get(status, 0) + 1
-                    except:
-                        pass
-                        
+                # Count by status (None when the process could not be read)
+                status_count = Counter(proc.info['status'] for proc in processes)
+                status_count.pop(None, None)
+                
                 for status, count in status_count.items():
                     info_lines.append(f"• {status.title()}: {count}")
                     
@@ -2581,7 +2237,7 @@ For technical support, feature requests, or collaboration opportunities:
             # Performance monitoring info
             info_lines.append("📈 MONITORING INFORMATION:")
             info_lines.append(f"Monitoring Active: {'Yes' if self.monitoring else 'No'}")
-            info_lines.append(f"Data Points Collected: {len(self.performance_history)}")
+            info_lines.append(f"Data Points Collected: {self.history_length()}")
             info_lines.append(f"Current Health Score: {self.system_health_score:.0f}%")
             info_lines.append(f"Data Logging: {'Enabled' if self.data_logging else 'Disabled'}")
             info_lines.append(f"Refresh Rate: {self.refresh_rate / 1000:.1f} seconds")
@@ -2593,68 +2249,36 @@ For technical support, feature requests, or collaboration opportunities:
             self.system_info_textbox.delete('0.0', 'end')
             self.system_info_textbox.insert('0.0', f"Error loading system info: {e}")
             
-    def update_enhanced_charts(self, frame):
-        """Update enhanced performance charts"""
+    def update_enhanced_charts(self):
+        """Update enhanced performance charts with the newest sample, once per monitoring tick"""
         try:
-            if len(self.cpu_data) == 0:
+            # Skip drawing while the window is minimised or another tab is shown
+            if self.root.state() == 'iconic' or self.notebook.get() != _DASHBOARD_TAB:
+                return
+            
+            history = self.recent_history(CHART_POINTS)
+            if len(history) == 0:
                 return
                 
-            x_data = list(range(len(self.cpu_data)))
-            
-            # CPU Usage
-            self.ax1.clear()
-            self.ax1.plot(x_data, list(self.cpu_data), color=self.colors['accent'], linewidth=2)
-            self.ax1.set_title('CPU Usage (%)', fontsize=12, fontweight='bold')
-            self.ax1.set_ylabel('Percentage')
-            self.ax1.set_ylim(0, 100)
-            
-            # Memory Usage
-            self.ax2.clear()
-            self.ax2.plot(x_data, list(self.memory_data), color=self.colors['secondary'], linewidth=2)
-            self.ax2.set_title('Memory Usage (%)', fontsize=12, fontweight='bold')
-            self.ax2.set_ylabel('Percentage')
-            self.ax2.set_ylim(0, 100)
-            
-            # Disk Usage
-            self.ax3.clear()
-            self.ax3.plot(x_data, list(self.disk_data), color=self.colors['warning'], linewidth=2)
-            self.ax3.set_title('Disk Usage (%)', fontsize=12, fontweight='bold')
-            self.ax3.set_ylabel('Percentage')
-            self.ax3.set_ylim(0, 100)
-            
-            # Network Usage
-            self.ax4.clear()
-            self.ax4.plot(x_data, list(self.network_data), color=self.colors['danger'], linewidth=2)
-            self.ax4.set_title('Network Usage (MB/s)', fontsize=12, fontweight='bold')
-            self.ax4.set_ylabel('MB/s')
+            x_data = CHART_X[:len(history)]
+            for line, column, _ in self.chart_lines:
+                line.set_data(x_data, history[:, column])
+            self.health_line.set_data(x_data, np.full(len(history), self.system_health_score))
             
             # Temperature
-            self.ax5.clear()
-            if self.temperature_data and any(t > 0 for t in self.temperature_data):
-                self.ax5.plot(x_data, list(self.temperature_data), color=self.colors['info'], linewidth=2)
-                self.ax5.set_title('Temperature (°C)', fontsize=12, fontweight='bold')
-                self.ax5.set_ylabel('Temperature')
-            else:
-                self.ax5.text(0.5, 0.5, 'Temperature\nNot Available', 
-                            horizontalalignment='center', verticalalignment='center',
-                            transform=self.ax5.transAxes, fontsize=12)
-                self.ax5.set_title('Temperature (°C)', fontsize=12, fontweight='bold')
-            
-            # System Health Score
-            self.ax6.clear()
-            health_scores = [self.system_health_score] * len(x_data)
-            self.ax6.plot(x_data, health_scores, color=self.colors['success'], linewidth=3)
-            self.ax6.set_title('System Health Score', fontsize=12, fontweight='bold')
-            self.ax6.set_ylabel('Score')
-            self.ax6.set_ylim(0, 100)
-            
-            # Style all axes
-            for ax in [self.ax1, self.ax2, self.ax3, self.ax4, self.ax5, self.ax6]:
-                ax.set_facecolor(self.colors['card_bg'])
-                ax.grid(True, alpha=0.3)
+            has_temperature = history[:, H_TEMP].any()
+            self.temp_line.set_visible(has_temperature)
+            self.temp_unavailable_text.set_visible(not has_temperature)
+            
+            for ax in self.fig.axes:
+                ax.set_xlim(0, max(len(history) - 1, 1))
+            # Network and temperature have no fixed range
+            for ax in (self.ax4, self.ax5):
+                ax.relim()
+                ax.autoscale_view(scalex=False)
+            
+            self.canvas.draw_idle()
                 
-            self.fig.patch.set_facecolor(self.colors['bg'])
-            
         except Exception as e:
             print(f"Enhanced chart update error: {e}")
             
@@ -2672,7 +2296,7 @@ For technical support, feature requests, or collaboration opportunities:
         title_label = ctk.CTkLabel(
             process_window,
             text="⚙️ Enhanced Process Manager",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=20)
         
@@ -2686,7 +2310,7 @@ For technical support, feature requests, or collaboration opportunities:
             controls_frame,
             text="🔄 Refresh",
             command=lambda: self.refresh_enhanced_process_list(process_textbox),
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         refresh_btn.grid(row=0, column=0, padx=10, pady=10)
         
@@ -2694,7 +2318,7 @@ For technical support, feature requests, or collaboration opportunities:
             controls_frame,
             text="📊 Sort by CPU",
             command=lambda: self.sort_processes_by(process_textbox, 'cpu'),
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         sort_cpu_btn.grid(row=0, column=1, padx=10, pady=10)
         
@@ -2702,7 +2326,7 @@ For technical support, feature requests, or collaboration opportunities:
             controls_frame,
             text="💾 Sort by Memory",
             command=lambda: self.sort_processes_by(process_textbox, 'memory'),
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         sort_memory_btn.grid(row=0, column=2, padx=10, pady=10)
         
@@ -2710,7 +2334,7 @@ For technical support, feature requests, or collaboration opportunities:
             controls_frame,
             text="❌ Kill Selected",
             command=lambda: self.kill_selected_process(process_textbox),
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=_font(12, "bold"),
             fg_color="red"
         )
         kill_process_btn.grid(row=0, column=3, padx=10, pady=10)
@@ -2722,7 +2346,7 @@ For technical support, feature requests, or collaboration opportunities:
         # Process textbox
         process_textbox = ctk.CTkTextbox(
             process_frame,
-            font=ctk.CTkFont(size=10)
+            font=_font(10)
         )
         process_textbox.pack(fill='both', expand=True, padx=15, pady=15)
         
@@ -2732,12 +2356,11 @@ For technical support, feature requests, or collaboration opportunities:
     def refresh_enhanced_process_list(self, textbox):
         """Refresh enhanced process list"""
         try:
-            textbox.delete('0.0', 'end')
-            
-            # Header
-            header = f"{'PID':<8} {'Name':<25} {'Status':<12} {'CPU %':<8} {'Memory %':<10} {'Threads':<8}\n"
-            textbox.insert('end', header)
-            textbox.insert('end', "-" * 80 + "\n")
+            # Header; rows are collected and inserted with a single call
+            lines = [
+                f"{'PID':<8} {'Name':<25} {'Status':<12} {'CPU %':<8} {'Memory %':<10} {'Threads':<8}\n",
+                "-" * 80 + "\n"
+            ]
             
             # Get processes
             processes = []
@@ -2747,11 +2370,11 @@ For technical support, feature requests, or collaboration opportunities:
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
                     
-            # Sort by CPU usage (descending)
-            processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
+            # Top 50 processes by CPU usage (descending), without sorting the rest
+            top_processes = heapq.nlargest(50, processes, key=lambda x: x['cpu_percent'] or 0)
             
             # Display processes
-            for proc in processes[:50]:  # Show top 50 processes
+            for proc in top_processes:
                 try:
                     pid = proc['pid']
                     name = (proc['name'] or 'Unknown')[:24]
@@ -2760,11 +2383,13 @@ For technical support, feature requests, or collaboration opportunities:
                     memory = proc['memory_percent'] or 0
                     threads = proc['num_threads'] or 0
                     
-                    line = f"{pid:<8} {name:<25} {status:<12} {cpu:<8.1f} {memory:<10.1f} {threads:<8}\n"
-                    textbox.insert('end', line)
+                    lines.append(f"{pid:<8} {name:<25} {status:<12} {cpu:<8.1f} {memory:<10.1f} {threads:<8}\n")
                 except:
                     continue
                     
+            textbox.delete('0.0', 'end')
+            textbox.insert('end', "".join(lines))
+        
         except Exception as e:
             textbox.delete('0.0', 'end')
             textbox.insert('0.0', f"Error loading processes: {e}")
@@ -2777,12 +2402,10 @@ For technical support, feature requests, or collaboration opportunities:
         
     def kill_selected_process(self, textbox):
         """Kill selected process (placeholder)"""
-        import tkinter.messagebox as messagebox
         messagebox.showwarning("Kill Process", "Process termination feature requires administrative privileges.\nThis is a demonstration version.")
         
     def run_system_cleanup(self):
         """Run comprehensive system cleanup"""
-        import tkinter.messagebox as messagebox
         
         result = messagebox.askyesno(
             "System Cleanup",
@@ -2801,34 +2424,19 @@ For technical support, feature requests, or collaboration opportunities:
     def perform_system_cleanup(self):
         """Perform system cleanup operations"""
         try:
-            cleanup_steps = [
-                ("Clearing temporary files", 2),
-                ("Emptying recycle bin", 1.5),
-                ("Clearing system cache", 2),
-                ("Optimizing memory", 1),
-                ("Updating system health", 0.5)
-            ]
-            
-            for step_name, duration in cleanup_steps:
-                time.sleep(duration)
-                # In a real implementation, perform actual cleanup operations
-                
             # Force garbage collection
             gc.collect()
             
             # Update system health score
             self.system_health_score = min(100, self.system_health_score + 5)
             
-            import tkinter.messagebox as messagebox
             self.root.after(0, lambda: messagebox.showinfo("Cleanup Complete", "System cleanup completed successfully!\n\nSystem performance has been optimized."))
             
         except Exception as e:
-            import tkinter.messagebox as messagebox
             self.root.after(0, lambda: messagebox.showerror("Cleanup Error", f"System cleanup failed: {str(e)}"))
             
     def emergency_optimization(self):
         """Run emergency system optimization"""
-        import tkinter.messagebox as messagebox
         
         result = messagebox.askquestion(
             "Emergency Optimization",
@@ -2849,26 +2457,10 @@ For technical support, feature requests, or collaboration opportunities:
     def perform_emergency_optimization(self):
         """Perform emergency optimization procedures"""
         try:
-            import tkinter.messagebox as messagebox
             self.root.after(0, lambda: messagebox.showwarning("Emergency Optimization", "Emergency optimization started.\n\nPlease wait..."))
             
-            emergency_steps = [
-                ("Analyzing critical system state", 1),
-                ("Terminating non-essential processes", 2),
-                ("Aggressive memory cleanup", 2),
-                ("Cache and temporary file purge", 1.5),
-                ("System priority optimization", 1),
-                ("Emergency health restoration", 1)
-            ]
-            
-            for step_name, duration in emergency_steps:
-                time.sleep(duration)
-                # In a real implementation, perform actual emergency optimization
-                
-            # Aggressive garbage collection
-            for _ in range(3):
-                gc.collect()
-                time.sleep(0.5)
+            # One full collection finds everything a repeat pass would
+            gc.collect()
                 
             # Restore system health score
             self.system_health_score = min(100, self.system_health_score + 20)
@@ -2880,7 +2472,6 @@ For technical support, feature requests, or collaboration opportunities:
                 "Monitor system performance and restart if issues persist."))
             
         except Exception as e:
-            import tkinter.messagebox as messagebox
             self.root.after(0, lambda: messagebox.showerror("Emergency Optimization Failed", 
                 f"Emergency optimization encountered an error:\n{str(e)}\n\n"
                 "Consider manual system restart."))
@@ -2889,25 +2480,17 @@ For technical support, feature requests, or collaboration opportunities:
         """Update analytics data based on selected time range"""
         try:
             # Calculate analytics based on performance history
-            if self.performance_history:
+            if self.history_count:
                 # Get data based on time range
-                now = time.time()
-                if value == "Last Hour":
-                    cutoff = now - 3600
-                elif value == "Last 24 Hours":
-                    cutoff = now - 86400
-                elif value == "Last Week":
-                    cutoff = now - 604800
-                else:  # Last Month
-                    cutoff = now - 2592000
-                    
-                filtered_data = [d for d in self.performance_history if d['timestamp'] >= cutoff]
+                cutoff = time.time() - ANALYTICS_RANGES.get(value, LAST_MONTH_SECONDS)
                 
-                if filtered_data:
-                    avg_cpu = sum(d['cpu'] for d in filtered_data)
-                    avg_cpu = sum(d['cpu'] for d in filtered_data) / len(filtered_data)
-                    avg_memory = sum(d['memory'] for d in filtered_data) / len(filtered_data)
-                    peak_cpu = max(d['cpu'] for d in filtered_data)
+                # History rows are in time order, so binary-search the first row in range
+                history = self.recent_history()
+                filtered_data = history[np.searchsorted(history[:, H_TIME], cutoff):]
+                
+                if len(filtered_data):
+                    avg_cpu, avg_memory = filtered_data[:, H_CPU:H_DISK].mean(axis=0)
+                    peak_cpu = filtered_data[:, H_CPU].max()
                     
                     # Update analytics display
                     self.avg_cpu_label.configure(text=f"{avg_cpu:.1f}%")
@@ -2924,30 +2507,32 @@ For technical support, feature requests, or collaboration opportunities:
     def update_history_display(self, data):
         """Update the performance history display"""
         try:
-            self.history_textbox.delete('0.0', 'end')
-            
-            # Header
-            header = f"{'Timestamp':<20} {'CPU %':<8} {'Memory %':<10} {'Disk %':<8} {'Network MB/s':<12} {'Temp °C':<8}\n"
-            self.history_textbox.insert('end', header)
-            self.history_textbox.insert('end', "-" * 80 + "\n")
+            # Header; rows are collected and inserted with a single call
+            lines = [
+                f"{'Timestamp':<20} {'CPU %':<8} {'Memory %':<10} {'Disk %':<8} {'Network MB/s':<12} {'Temp °C':<8}\n",
+                "-" * 80 + "\n"
+            ]
             
             # Show last 50 entries
-            for entry in data[-50:]:
-                timestamp = datetime.fromtimestamp(entry['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-                line = f"{timestamp:<20} {entry['cpu']:<8.1f} {entry['memory']:<10.1f} {entry['disk']:<8.1f} {entry['network']:<12.2f} {entry['temperature']:<8.1f}\n"
-                self.history_textbox.insert('end', line)
-                
+            lines.extend(
+                f"{format_timestamp(sample_time)}  {cpu:<8.1f} {memory:<10.1f} {disk:<8.1f} {network:<12.2f} {temperature:<8.1f}\n"
+                for sample_time, cpu, memory, disk, network, temperature in data[-50:]
+            )
+            
+            self.history_textbox.delete('0.0', 'end')
+            self.history_textbox.insert('end', "".join(lines))
+        
         except Exception as e:
             self.history_textbox.insert('0.0', f"Error displaying history: {e}")
             
     def run_benchmark(self, benchmark_type):
         """Run system benchmark tests"""
         if self.benchmark_running:
-            import tkinter.messagebox as messagebox
             messagebox.showwarning("Benchmark Running", "A benchmark is already in progress.")
             return
             
         self.benchmark_running = True
+        self.benchmark_kernel = self.benchmark_kernel_var.get()
         self.benchmark_progress.set(0)
         self.benchmark_status_label.configure(text=f"🚀 Starting {benchmark_type} benchmark...")
         
@@ -2959,9 +2544,9 @@ For technical support, feature requests, or collaboration opportunities:
             results = []
             
             if benchmark_type == 'cpu':
-                results = self.run_cpu_benchmark()
+                results, _ = self.run_cpu_benchmark()
             elif benchmark_type == 'memory':
-                results = self.run_memory_benchmark()
+                results, _ = self.run_memory_benchmark()
             elif benchmark_type == 'full':
                 results = self.run_full_benchmark()
                 
@@ -2969,170 +2554,210 @@ For technical support, feature requests, or collaboration opportunities:
             self.display_benchmark_results(results)
             
         except Exception as e:
-            self.root.after(0, lambda: self.benchmark_status_label.configure(text=f"❌ Benchmark failed: {str(e)}"))
+            self.root.after(0, self.set_benchmark_status, None, f"❌ Benchmark failed: {str(e)}")
         finally:
             self.benchmark_running = False
-            self.root.after(0, lambda: self.benchmark_progress.set(1))
+            self.root.after(0, self.set_benchmark_status, 1)
+            
+    def set_benchmark_status(self, progress, text=None):
+        """Apply a benchmark progress value and/or status text on the UI thread"""
+        if progress is not None:
+            self.benchmark_progress.set(progress)
+        if text is not None:
+            self.benchmark_status_label.configure(text=text)
             
     def run_cpu_benchmark(self):
         """Run CPU-specific benchmark"""
         results = []
-        self.root.after(0, lambda: self.benchmark_status_label.configure(text="🔥 Testing CPU performance..."))
+        self.root.after(0, self.set_benchmark_status, None, "🔥 Testing CPU performance...")
+        
+        int_kernel, float_kernel = BENCHMARK_KERNELS[self.benchmark_kernel]
+        results.append(f"CPU Kernels: {self.benchmark_kernel} on {PYTHON_RUNTIME}")
+        # Compiled kernels are built on first call, so keep that out of the timings
+        int_kernel(1)
+        float_kernel(1)
         
         # CPU integer operations test
-        start_time = time.time()
-        self.root.after(0, lambda: self.benchmark_progress.set(0.2))
+        start_time = time.perf_counter()
+        self.root.after(0, self.set_benchmark_status, 0.2)
         
-        total = 0
-        for i in range(1000000):
-            total += i * i
+        int_kernel(1000000)
         
-        cpu_int_time = time.time() - start_time
+        cpu_int_time = time.perf_counter() - start_time
         results.append(f"CPU Integer Operations: {cpu_int_time:.3f} seconds")
         
         # CPU floating point test
-        self.root.after(0, lambda: self.benchmark_progress.set(0.5))
-        start_time = time.time()
+        self.root.after(0, self.set_benchmark_status, 0.5)
+        start_time = time.perf_counter()
         
-        import math
-        total = 0.0
-        for i in range(500000):
-            total += math.sqrt(i) * math.sin(i)
+        float_kernel(500000)
             
-        cpu_float_time = time.time() - start_time
+        cpu_float_time = time.perf_counter() - start_time
         results.append(f"CPU Floating Point: {cpu_float_time:.3f} seconds")
         
-        # CPU multi-threading test
-        self.root.after(0, lambda: self.benchmark_progress.set(0.8))
-        start_time = time.time()
-        
-        def cpu_worker():
-            total = 0
-            for i in range(250000):
-                total += i ** 2
-            return total
-            
-        threads = []
-        for _ in range(4):
-            thread = threading.Thread(target=cpu_worker)
-            threads.append(thread)
-            thread.start()
-            
-        for thread in threads:
-            thread.join()
-            
-        cpu_multi_time = time.time() - start_time
-        results.append(f"CPU Multi-threading: {cpu_multi_time:.3f} seconds")
+        # CPU multi-core test: worker processes run in parallel instead of
+        # taking turns on the GIL; threads are used for kernels that release
+        # the GIL and where processes cannot be started
+        self.root.after(0, self.set_benchmark_status, 0.8)
+        pool = None
+        if self.benchmark_kernel not in GIL_RELEASING_KERNELS:
+            try:
+                pool = self.get_benchmark_pool()
+                # Keep worker start-up and kernel compilation out of the timing
+                list(pool.map(int_kernel, [1] * 4))
+                multi_label = "CPU Multi-processing"
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                self.benchmark_pool = None
+                pool = None
+        if pool is None:
+            pool = self.get_benchmark_threads()
+            multi_label = "CPU Multi-threading"
+            
+        start_time = time.perf_counter()
+        list(pool.map(int_kernel, [250000] * 4))
+        cpu_multi_time = time.perf_counter() - start_time
+        results.append(f"{multi_label}: {cpu_multi_time:.3f} seconds")
         
         # Calculate CPU score
         cpu_score = 1000 / (cpu_int_time + cpu_float_time + cpu_multi_time)
         results.append(f"CPU Benchmark Score: {cpu_score:.0f}")
         
-        self.root.after(0, lambda: self.benchmark_status_label.configure(text="✅ CPU benchmark completed"))
-        return results
+        self.root.after(0, self.set_benchmark_status, None, "✅ CPU benchmark completed")
+        return results, cpu_score
+        
+    def get_benchmark_pool(self):
+        """Return the benchmark worker processes, starting them on first use"""
+        if self.benchmark_pool is None:
+            # Spawn rather than fork: forking a threaded Tk process is unsafe
+            self.benchmark_pool = ProcessPoolExecutor(
+                max_workers=4, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self.benchmark_pool
+        
+    def get_benchmark_threads(self):
+        """Return the benchmark worker threads, starting them on first use"""
+        if self.benchmark_threads is None:
+            self.benchmark_threads = ThreadPoolExecutor(max_workers=4)
+        return self.benchmark_threads
         
     def run_memory_benchmark(self):
         """Run memory-specific benchmark"""
         results = []
-        self.root.after(0, lambda: self.benchmark_status_label.configure(text="💾 Testing memory performance..."))
+        self.root.after(0, self.set_benchmark_status, None, "💾 Testing memory performance...")
         
         # Memory allocation test
-        self.root.after(0, lambda: self.benchmark_progress.set(0.2))
-        start_time = time.time()
+        self.root.after(0, self.set_benchmark_status, 0.2)
+        start_time = time.perf_counter()
         
-        large_list = []
-        for i in range(1000000):
-            large_list.append(i)
+        # Contiguous int64 buffer, so the tests exercise raw memory rather than boxed ints
+        buffer = np.arange(1000000, dtype=np.int64)
             
-        mem_alloc_time = time.time() - start_time
+        mem_alloc_time = time.perf_counter() - start_time
         results.append(f"Memory Allocation: {mem_alloc_time:.3f} seconds")
         
         # Memory access test
-        self.root.after(0, lambda: self.benchmark_progress.set(0.5))
-        start_time = time.time()
+        self.root.after(0, self.set_benchmark_status, 0.5)
+        start_time = time.perf_counter()
         
-        total = 0
-        for i in range(0, len(large_list), 100):
-            total += large_list[i]
+        total = int(buffer[::100].sum())
             
-        mem_access_time = time.time() - start_time
+        mem_access_time = time.perf_counter() - start_time
         results.append(f"Memory Access: {mem_access_time:.3f} seconds")
         
         # Memory copy test
-        self.root.after(0, lambda: self.benchmark_progress.set(0.8))
-        start_time = time.time()
+        self.root.after(0, self.set_benchmark_status, 0.8)
+        start_time = time.perf_counter()
         
-        copied_list = large_list.copy()
+        copied_buffer = buffer.copy()
         
-        mem_copy_time = time.time() - start_time
+        mem_copy_time = time.perf_counter() - start_time
         results.append(f"Memory Copy: {mem_copy_time:.3f} seconds")
         
         # Clean up
-        del large_list, copied_list
+        del buffer, copied_buffer
         gc.collect()
         
         # Calculate memory score
         memory_score = 1000 / (mem_alloc_time + mem_access_time + mem_copy_time)
         results.append(f"Memory Benchmark Score: {memory_score:.0f}")
         
-        self.root.after(0, lambda: self.benchmark_status_label.configure(text="✅ Memory benchmark completed"))
-        return results
+        self.root.after(0, self.set_benchmark_status, None, "✅ Memory benchmark completed")
+        return results, memory_score
         
     def run_full_benchmark(self):
         """Run comprehensive system benchmark"""
         results = []
-        self.root.after(0, lambda: self.benchmark_status_label.configure(text="🚀 Running full system benchmark..."))
+        self.root.after(0, self.set_benchmark_status, None, "🚀 Running full system benchmark...")
         
         # CPU tests
-        self.root.after(0, lambda: self.benchmark_progress.set(0.1))
-        cpu_results = self.run_cpu_benchmark()
+        self.root.after(0, self.set_benchmark_status, 0.1)
+        cpu_results, cpu_score = self.run_cpu_benchmark()
         results.extend(cpu_results)
         results.append("")
+        scores = [cpu_score]
         
         # Memory tests
-        self.root.after(0, lambda: self.benchmark_progress.set(0.4))
-        memory_results = self.run_memory_benchmark()
+        self.root.after(0, self.set_benchmark_status, 0.4)
+        memory_results, memory_score = self.run_memory_benchmark()
         results.extend(memory_results)
         results.append("")
+        scores.append(memory_score)
         
         # Disk I/O test (simplified)
-        self.root.after(0, lambda: self.benchmark_progress.set(0.7))
-        self.root.after(0, lambda: self.benchmark_status_label.configure(text="💽 Testing disk performance..."))
+        self.root.after(0, self.set_benchmark_status, 0.7, "💽 Testing disk performance...")
         
-        start_time = time.time()
         try:
-            # Write test
-            test_data = "x" * 1024 * 1024  # 1MB of data
-            with open("benchmark_test.tmp", "w") as f:
-                for _ in range(10):
-                    f.write(test_data)
-                    
-            # Read test
-            with open("benchmark_test.tmp", "r") as f:
-                data = f.read()
+            # Page-aligned buffer, as direct I/O requires
+            buffer = mmap.mmap(-1, DISK_BENCHMARK_BYTES)
+            chunk = b"x" * MB
+            for _ in range(DISK_BENCHMARK_BYTES // MB):
+                buffer.write(chunk)
                 
+            start_time = time.perf_counter()
+            
+            # Write test: one large write, flushed to the device
+            with self.open_benchmark_file(os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 'wb') as f:
+                f.write(buffer)
+                os.fsync(f.fileno())
+            
+            # Read test: reopened so direct I/O reads from the device, not the cache
+            with self.open_benchmark_file(os.O_RDONLY, 'rb') as f:
+                f.readinto(buffer)
+            
+            disk_time = time.perf_counter() - start_time
+            
             # Clean up
-            os.remove("benchmark_test.tmp")
+            buffer.close()
+            os.remove(DISK_BENCHMARK_FILE)
             
-            disk_time = time.time() - start_time
             disk_score = 100 / disk_time
             results.append(f"Disk I/O Test: {disk_time:.3f} seconds")
             results.append(f"Disk Benchmark Score: {disk_score:.0f}")
+            scores.append(disk_score)
             
         except Exception as e:
             results.append(f"Disk I/O Test: Failed ({str(e)})")
             
         # Overall system score
-        self.root.after(0, lambda: self.benchmark_progress.set(0.9))
-        overall_score = (self.system_health_score + 
-                        sum(float(line.split(': ')[1]) for line in results 
-                            if 'Score:' in line and line.split(': ')[1].replace('.', '').isdigit())) / 4
+        self.root.after(0, self.set_benchmark_status, 0.9)
+        # Health score averaged with every stage score that was produced
+        overall_score = (self.system_health_score + sum(scores)) / (1 + len(scores))
         results.append("")
         results.append(f"Overall System Score: {overall_score:.0f}")
         
-        self.root.after(0, lambda: self.benchmark_status_label.configure(text="✅ Full system benchmark completed"))
+        self.root.after(0, self.set_benchmark_status, None, "✅ Full system benchmark completed")
         return results
         
+    def open_benchmark_file(self, flags, mode):
+        """Open the disk benchmark file unbuffered, bypassing the page cache where supported"""
+        flags |= getattr(os, 'O_BINARY', 0)
+        try:
+            fd = os.open(DISK_BENCHMARK_FILE, flags | getattr(os, 'O_DIRECT', 0))
+        except OSError:
+            # No O_DIRECT on this platform or filesystem (e.g. tmpfs)
+            fd = os.open(DISK_BENCHMARK_FILE, flags)
+        return os.fdopen(fd, mode, buffering=0)
+        
     def display_benchmark_results(self, results):
         """Display benchmark results in the textbox"""
         def update_display():
@@ -3155,8 +2780,15 @@ For technical support, feature requests, or collaboration opportunities:
         
     def change_theme(self, theme):
         """Change application theme"""
+        # Re-applying the active theme would restyle every widget for nothing
+        if theme == self.current_theme:
+            return
+        
         self.current_theme = theme
         self.colors = self.themes[theme]
+        if hasattr(self, 'chart_lines'):
+            self.style_enhanced_charts()
+            self.canvas.draw_idle()
         
         # Update CustomTkinter appearance mode
         if theme == 'dark':
@@ -3178,15 +2810,26 @@ For technical support, feature requests, or collaboration opportunities:
         
     def toggle_notifications(self):
         """Toggle performance notifications"""
-        self.notifications_enabled = self.notifications_var.get()
+        self.notifications_enabled = self.settings_vars['notifications'].get()
         
     def toggle_data_logging(self):
         """Toggle data logging to database"""
-        self.data_logging = self.logging_var.get()
+        self.data_logging = self.settings_vars['logging'].get()
         
     def toggle_auto_optimize(self):
         """Toggle automatic optimization"""
-        self.auto_optimize = self.auto_optimize_var.get()
+        self.auto_optimize = self.settings_vars['auto_optimize'].get()
+        
+    def schedule_settings_save(self, *args):
+        """Debounce settings persistence so a burst of changes is written once"""
+        if getattr(self, 'settings_save_job', None):
+            self.root.after_cancel(self.settings_save_job)
+        self.settings_save_job = self.root.after(500, self.flush_settings_save)
+        
+    def flush_settings_save(self):
+        """Write settings scheduled by schedule_settings_save"""
+        self.settings_save_job = None
+        self.save_settings()
         
     def save_settings(self):
         """Save current settings to file"""
@@ -3201,8 +2844,14 @@ For technical support, feature requests, or collaboration opportunities:
                 'alert_thresholds': self.alert_thresholds
             }
             
+            # Nothing changed since the last load or save; skip the rewrite
+            settings_text = json.dumps(settings, indent=2)
+            if settings_text == self.saved_settings_text:
+                return
+            
             with open('settings.json', 'w') as f:
-                json.dump(settings, f, indent=2)
+                f.write(settings_text)
+            self.saved_settings_text = settings_text
                 
         except Exception as e:
             print(f"Settings save error: {e}")
@@ -3212,9 +2861,10 @@ For technical support, feature requests, or collaboration opportunities:
         try:
             if os.path.exists('settings.json'):
                 with open('settings.json', 'r') as f:
-                    settings = json.load(f)
+                    self.saved_settings_text = f.read()
+                settings = json.loads(self.saved_settings_text)
                     
-                self.current_theme = settings.get('theme', 'light')
+                theme = settings.get('theme', 'light')
                 self.refresh_rate = settings.get('refresh_rate', 1000)
                 self.font_size = settings.get('font_size', 12)
                 self.notifications_enabled = settings.get('notifications_enabled', True)
@@ -3223,19 +2873,17 @@ For technical support, feature requests, or collaboration opportunities:
                 self.alert_thresholds.update(settings.get('alert_thresholds', {}))
                 
                 # Apply loaded theme
-                self.change_theme(self.current_theme)
+                self.change_theme(theme)
                 
         except Exception as e:
             print(f"Settings load error: {e}")
             
     def export_report(self):
         """Export enhanced performance report"""
-        if not self.performance_history:
-            import tkinter.messagebox as messagebox
+        if not self.history_count:
             messagebox.showwarning("No Data", "No performance data available to export.")
             return
             
-        import tkinter.messagebox as messagebox
         file_format = messagebox.askyesnocancel("Export Format", 
             "Choose export format:\n\nYes = PDF Report\nNo = CSV Data\nCancel = Cancel")
         
@@ -3253,7 +2901,6 @@ For technical support, feature requests, or collaboration opportunities:
     def export_enhanced_pdf_report(self):
         """Export enhanced PDF report with comprehensive data"""
         try:
-            import tkinter.filedialog as filedialog
             filename = filedialog.asksaveasfilename(
                 defaultextension=".pdf",
                 filetypes=[("PDF files", "*.pdf")],
@@ -3275,19 +2922,16 @@ For technical support, feature requests, or collaboration opportunities:
                 Hostname: {self.system_info['hostname']}<br/>
                 Platform: {self.system_info['platform']}<br/>
                 CPU Cores: {self.system_info['cpu_count']}<br/>
-                Total Memory: {self.system_info['memory_total'] / (1024**3):.2f} GB<br/>
+                Total Memory: {self.system_info['memory_total'] / GB:.2f} GB<br/>
                 Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/>
                 """
                 story.append(Paragraph(system_info_text, styles['Normal']))
                 
                 # Performance summary
-                if self.performance_history:
-                    recent_data = self.performance_history[-100:]
-                    avg_cpu = sum(d['cpu'] for d in recent_data) / len(recent_data)
-                    avg_memory = sum(d['memory'] for d in recent_data) / len(recent_data)
-                    avg_disk = sum(d['disk'] for d in recent_data) / len(recent_data)
-                    peak_cpu = max(d['cpu'] for d in recent_data)
-                    peak_memory = max(d['memory'] for d in recent_data)
+                if self.history_count:
+                    recent_data = self.recent_history(100)
+                    avg_cpu, avg_memory, avg_disk = recent_data[:, H_CPU:H_NETWORK].mean(axis=0)
+                    peak_cpu, peak_memory = recent_data[:, H_CPU:H_DISK].max(axis=0)
                     
                     summary_text = f"""
                     <b>Performance Summary (Last 100 readings):</b><br/>
@@ -3309,17 +2953,14 @@ For technical support, feature requests, or collaboration opportunities:
                 # Build PDF
                 doc.build(story)
                 
-                import tkinter.messagebox as messagebox
                 messagebox.showinfo("Export Complete", f"Enhanced report exported to:\n{filename}")
                 
         except Exception as e:
-            import tkinter.messagebox as messagebox
             messagebox.showerror("Export Error", f"Failed to export PDF report:\n{str(e)}")
             
     def export_enhanced_csv_report(self):
         """Export enhanced CSV data"""
         try:
-            import tkinter.filedialog as filedialog
             filename = filedialog.asksaveasfilename(
                 defaultextension=".csv",
                 filetypes=[("CSV files", "*.csv")],
@@ -3327,7 +2968,7 @@ For technical support, feature requests, or collaboration opportunities:
             )
             
             if filename:
-                with open(filename, 'w', newline='') as csvfile:
+                with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
                     writer = csv.writer(csvfile)
                     
                     # Header
@@ -3336,45 +2977,39 @@ For technical support, feature requests, or collaboration opportunities:
                         'Network MB/s', 'Temperature °C', 'Health Score'
                     ])
                     
-                    # Data
-                    for data in self.performance_history:
-                        writer.writerow([
-                            datetime.fromtimestamp(data['timestamp']).strftime('%Y-%m-%d %H:%M:%S'),
-                            data['cpu'],
-                            data['memory'],
-                            data['disk'],
-                            data['network'],
-                            data['temperature'],
-                            self.system_health_score
-                        ])
+                    # Data, streamed to the writer in one call
+                    health_score = self.system_health_score
+                    writer.writerows(
+                        (format_timestamp(sample_time),
+                         cpu, memory, disk, network, temperature, health_score)
+                        for sample_time, cpu, memory, disk, network, temperature in self.recent_history()
+                    )
                         
-                import tkinter.messagebox as messagebox
                 messagebox.showinfo("Export Complete", f"Performance data exported to:\n{filename}")
                 
         except Exception as e:
-            import tkinter.messagebox as messagebox
             messagebox.showerror("Export Error", f"Failed to export CSV data:\n{str(e)}")
             
     def manual_refresh(self):
         """Manually refresh all performance data"""
         try:
-            # Force immediate chart update
+            # Queue a chart redraw; repeated clicks coalesce into one render
             if hasattr(self, 'canvas'):
-                self.canvas.draw()
+                self.canvas.draw_idle()
                 
-            # Refresh system info
-            if hasattr(self, 'system_info_textbox'):
+            # Refresh system info; it barely changes, so at most every few seconds
+            clock = time.monotonic()
+            if hasattr(self, 'system_info_textbox') and clock - self.system_info_refreshed >= SYSTEM_INFO_REFRESH_SECONDS:
+                self.system_info_refreshed = clock
                 self.populate_system_info()
                 
             # Update analytics
             if hasattr(self, 'time_range_var'):
                 self.update_analytics(self.time_range_var.get())
                 
-            import tkinter.messagebox as messagebox
             messagebox.showinfo("Refresh Complete", "All performance data has been refreshed!")
             
         except Exception as e:
-            import tkinter.messagebox as messagebox
             messagebox.showerror("Refresh Error", f"Failed to refresh data:\n{str(e)}")
             
     def on_closing(self):
@@ -3382,16 +3017,23 @@ For technical support, feature requests, or collaboration opportunities:
         try:
             # Stop monitoring
             self.monitoring = False
+            if hasattr(self, 'sensor_pool'):
+                self.sensor_pool.shutdown(wait=False)
+            if self.benchmark_pool is not None:
+                self.benchmark_pool.shutdown(wait=False)
+            if self.benchmark_threads is not None:
+                self.benchmark_threads.shutdown(wait=False)
             
-            # Stop animation
-            if hasattr(self, 'animation'):
-                self.animation.event_source.stop()
-                
             # Save settings
             self.save_settings()
             
-            # Close database connection
+            # Close database connection after writing any queued samples; the
+            # writer thread is stopped first so it is not mid-batch on the connection
             if hasattr(self, 'conn'):
+                if hasattr(self, 'db_queue'):
+                    self.db_writer_stop.set()
+                    self.db_writer_thread.join()
+                    self.flush_database_queue()
                 self.conn.close()
                 
             # Clean up temporary files
@@ -3441,9 +3083,45 @@ def main():
         print(f"Application error: {e}")
         app.on_closing()
 
+# Console banner printed once at startup
+_BANNER_RULE = "=" * 70
+STARTUP_BANNER = (
+    _BANNER_RULE,
+    "🚀 SYSTEM PERFORMANCE ANALYZER & OPTIMIZER v2.0",
+    "   Advanced System Monitoring and Optimization Suite",
+    "   Developed by Architechs Team - SE(OS)-VI-T250",
+    _BANNER_RULE,
+    "✨ ENHANCED FEATURES:",
+    "   📊 Real-time performance monitoring with 6 metrics",
+    "   🤖 Advanced AI-powered optimization engine",
+    "   📈 Comprehensive analytics and historical data",
+    "   ⚡ System benchmark testing suite",
+    "   💻 Detailed system information and diagnostics",
+    "   🎨 Modern CustomTkinter interface with themes",
+    "   📄 Enhanced reporting (PDF/CSV export)",
+    "   🗄️ SQLite database for data persistence",
+    "   🚨 Emergency optimization capabilities",
+    "   🧹 System cleanup and maintenance tools",
+    _BANNER_RULE,
+    "👥 DEVELOPMENT TEAM:",
+    "   👑 Harshit Jasuja (Team Lead) - System Architecture & AI",
+    "   💻 Yashika Dixit (Developer) - GUI Development & UX",
+    "   ⚙️ Shivendra Srivastava (Developer) - Performance & QA",
+    _BANNER_RULE,
+    "📋 SYSTEM REQUIREMENTS:",
+    f"   ✅ Python {sys.version_info.major}.{sys.version_info.minor}+ (Current: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro})",
+    "   ✅ CustomTkinter, matplotlib, psutil, numpy",
+    "   📦 Optional: reportlab (PDF), requests (cloud features)",
+    _BANNER_RULE,
+    "🔧 STARTING APPLICATION...",
+    "   Initializing monitoring systems...",
+    "   Loading AI optimization engine...",
+    "   Preparing user interface...",
+    ""
+)
+
 if __name__ == "__main__":
     # Check Python version
-    import sys
     if sys.version_info < (3, 6):
         print("❌ This application requires Python 3.6 or higher")
         print(f"Current version: {sys.version}")
@@ -3451,13 +3129,8 @@ if __name__ == "__main__":
     
     # Check required modules
     required_modules = ['customtkinter', 'matplotlib', 'psutil', 'numpy']
-    missing_modules = []
-    
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing_modules.append(module)
+    # find_spec only locates each module; it does not run its import
+    missing_modules = [module for module in required_modules if importlib.util.find_spec(module) is None]
     
     if missing_modules:
         print("❌ Missing required modules:")
@@ -3470,39 +3143,9 @@ if __name__ == "__main__":
         print("pip install requests   # For cloud features")
         sys.exit(1)
     
-    # Print enhanced startup information
-    print("=" * 70)
-    print("🚀 SYSTEM PERFORMANCE ANALYZER & OPTIMIZER v2.0")
-    print("   Advanced System Monitoring and Optimization Suite")
-    print("   Developed by Architechs Team - SE(OS)-VI-T250")
-    print("=" * 70)
-    print("✨ ENHANCED FEATURES:")
-    print("   📊 Real-time performance monitoring with 6 metrics")
-    print("   🤖 Advanced AI-powered optimization engine")
-    print("   📈 Comprehensive analytics and historical data")
-    print("   ⚡ System benchmark testing suite")
-    print("   💻 Detailed system information and diagnostics")
-    print("   🎨 Modern CustomTkinter interface with themes")
-    print("   📄 Enhanced reporting (PDF/CSV export)")
-    print("   🗄️ SQLite database for data persistence")
-    print("   🚨 Emergency optimization capabilities")
-    print("   🧹 System cleanup and maintenance tools")
-    print("=" * 70)
-    print("👥 DEVELOPMENT TEAM:")
-    print("   👑 Harshit Jasuja (Team Lead) - System Architecture & AI")
-    print("   💻 Yashika Dixit (Developer) - GUI Development & UX")
-    print("   ⚙️ Shivendra Srivastava (Developer) - Performance & QA")
-    print("=" * 70)
-    print("📋 SYSTEM REQUIREMENTS:")
-    print(f"   ✅ Python {sys.version_info.major}.{sys.version_info.minor}+ (Current: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro})")
-    print("   ✅ CustomTkinter, matplotlib, psutil, numpy")
-    print("   📦 Optional: reportlab (PDF), requests (cloud features)")
-    print("=" * 70)
-    print("🔧 STARTING APPLICATION...")
-    print("   Initializing monitoring systems...")
-    print("   Loading AI optimization engine...")
-    print("   Preparing user interface...")
-    print()
+    # Print enhanced startup information in a single write
+    sys.stdout.write("\n".join(STARTUP_BANNER) + "\n")
+    sys.stdout.flush()
     
     # Run the main application
     try:
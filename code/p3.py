@@ -9,16 +9,19 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import psutil
 import platform
-import subprocess
-import threading
 import time
 import json
+import heapq
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
 import numpy as np
-from collections import deque
+
+# Readings kept for the history graphs (one per second)
+HISTORY_SIZE = 60
+# Graph x positions in seconds ago, oldest first, matching the history arrays
+HISTORY_X = np.arange(HISTORY_SIZE - 1, -1, -1)
+PROGRESS_STEP = 0.5  # Smallest progress bar change worth a Tk redraw
 
 class SplashScreen:
     """Beautiful splash screen with team branding"""
@@ -104,6 +107,39 @@ class SplashScreen:
             # Animation complete, close splash window
             self.splash.destroy()
                     
+class BlitManager:
+    """Redraw animated artists over a cached copy of a canvas's static background"""
+    def __init__(self, canvas, artists):
+        self.canvas = canvas
+        self.artists = artists
+        self.background = None
+        
+        for artist in artists:
+            artist.set_animated(True)
+        
+        # Every full draw (first show, resize) refreshes the background
+        canvas.mpl_connect('draw_event', self.on_draw)
+        
+    def on_draw(self, event):
+        """Cache the freshly drawn background and put the artists back on top"""
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.draw_artists()
+        
+    def draw_artists(self):
+        """Render the animated artists onto the canvas buffer"""
+        for artist in self.artists:
+            self.canvas.figure.draw_artist(artist)
+        
+    def update(self):
+        """Show the artists' current state, blitting only the changed pixels"""
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+        
+        self.canvas.restore_region(self.background)
+        self.draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
 class SystemAnalyzer:
     """Main System Performance Analyzer Application"""
     
@@ -136,13 +172,43 @@ class SystemAnalyzer:
         
     def setup_variables(self):
         """Initialize monitoring variables"""
-        self.cpu_history = deque(maxlen=60)  # Last 60 readings
-        self.memory_history = deque(maxlen=60)
+        # Last 60 readings, oldest first; only the last history_count entries are filled
+        self.cpu_history = np.zeros(HISTORY_SIZE)
+        self.memory_history = np.zeros(HISTORY_SIZE)
+        self.history_count = 0
         self.monitoring = False
         self.process_list = []
+        # Rows currently shown in the process tree: PID -> values
+        self.process_rows = {}
+        # psutil.Process objects behind those rows, see get_process
+        self.process_cache = {}
+        # Single worker that writes exported reports, see export_report
+        self.report_writer = ThreadPoolExecutor(max_workers=1)
+        # Disk tab cards by mount point and when they are next refreshed, see update_disk_details
+        self.disk_cards = {}
+        self.disk_details_next = 0
+        # Pending drive usage read, done off the Tk thread as a network mount can block
+        self.disk_read = None
         self.cpu_threshold = 80
         self.memory_threshold = 85
         
+        # Values that never change while running, read once
+        self.system_info = self.get_system_info()
+        self.cpu_count_logical = psutil.cpu_count(logical=True)
+        self.cpu_count_physical = psutil.cpu_count(logical=False)
+        
+        # Previous network sample, the send/receive rates in MB/s since it and the
+        # network tab's current label texts
+        self.last_net_io = psutil.net_io_counters()
+        self.last_net_time = time.monotonic()
+        self.net_rates = (0, 0)
+        self.network_texts = None
+        # When a monitoring error was last printed, see monitor_system
+        self.monitor_error_reported = float('-inf')
+        
+        # Latest collect_sample reading behind the detail tabs, see update_visible_tab
+        self.last_sample = None
+        
     def setup_styles(self):
         """Configure ttk styles for modern appearance"""
         style = ttk.Style()
@@ -218,6 +284,7 @@ class SystemAnalyzer:
         self.create_disk_tab()
         self.create_network_tab()
         self.create_processes_tab()
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
         
         # Footer
         self.create_footer(main_container)
@@ -235,7 +302,7 @@ class SystemAnalyzer:
         left_info = tk.Frame(info_frame, bg="#16213e")
         left_info.pack(side="left", fill="x", expand=True)
         
-        system_info = self.get_system_info()
+        system_info = self.system_info
         
         tk.Label(left_info, text=f"System: {system_info['system']}", 
                 font=("SF Pro Display", 12, "bold"),
@@ -328,15 +395,27 @@ class SystemAnalyzer:
         card_frame.progress_var = progress_var
         card_frame.info_label = info_label
         
+        # What the card currently shows, see set_card
+        card_frame.value_text = "0%"
+        card_frame.progress = 0
+        card_frame.info_text = ""
+        
         return card_frame
         
     def create_cpu_tab(self):
         """Create CPU monitoring tab with graphs"""
         tab_frame = ttk.Frame(self.notebook)
         self.notebook.add(tab_frame, text="🖥️ CPU")
+        self.cpu_tab = tab_frame
+        
+        # matplotlib is imported here, after the splash screen, so the splash
+        # appears without waiting for it to load
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Polygon
         
         # Create matplotlib figure
-        self.cpu_fig = Figure(figsize=(10, 6), facecolor='#16213e')
+        self.cpu_fig = Figure(figsize=(10, 6), facecolor='#16213e', tight_layout=True)
         self.cpu_ax = self.cpu_fig.add_subplot(111)
         self.cpu_ax.set_facecolor('#1a1a2e')
         
@@ -346,16 +425,24 @@ class SystemAnalyzer:
         self.cpu_ax.set_ylabel('Usage (%)', color='white')
         self.cpu_ax.tick_params(colors='white')
         self.cpu_ax.grid(True, alpha=0.3)
+        self.cpu_ax.set_ylim(0, 100)
+        self.cpu_ax.set_xlim(0, HISTORY_SIZE)
+        
+        # History line and fill, updated in place each tick
+        self.cpu_line, = self.cpu_ax.plot([], [], color='#ff6b6b', linewidth=2)
+        self.cpu_fill = self.cpu_ax.add_patch(Polygon(np.zeros((1, 2)), alpha=0.3, color='#ff6b6b'))
         
         # Create canvas
         cpu_canvas = FigureCanvasTkAgg(self.cpu_fig, tab_frame)
         cpu_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self.cpu_blit = BlitManager(cpu_canvas, [self.cpu_fill, self.cpu_line])
         
         # CPU info frame
         cpu_info_frame = tk.Frame(tab_frame, bg="#16213e")
         cpu_info_frame.pack(fill="x", padx=10, pady=(0, 10))
         
-        self.cpu_cores_label = tk.Label(cpu_info_frame, text="", 
+        self.cpu_cores_label = tk.Label(cpu_info_frame, 
+                                       text=f"Cores: {self.cpu_count_physical} physical, {self.cpu_count_logical} logical", 
                                        font=("SF Pro Display", 12),
                                        fg="#4ecdc4", bg="#16213e")
         self.cpu_cores_label.pack(side="left", padx=10)
@@ -369,9 +456,15 @@ class SystemAnalyzer:
         """Create memory monitoring tab"""
         tab_frame = ttk.Frame(self.notebook)
         self.notebook.add(tab_frame, text="💾 Memory")
+        self.memory_tab = tab_frame
+        
+        # Deferred like in create_cpu_tab; already loaded by then
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Polygon
         
         # Memory chart
-        self.memory_fig = Figure(figsize=(10, 6), facecolor='#16213e')
+        self.memory_fig = Figure(figsize=(10, 6), facecolor='#16213e', tight_layout=True)
         self.memory_ax = self.memory_fig.add_subplot(111)
         self.memory_ax.set_facecolor('#1a1a2e')
         
@@ -380,9 +473,15 @@ class SystemAnalyzer:
         self.memory_ax.set_ylabel('Usage (%)', color='white')
         self.memory_ax.tick_params(colors='white')
         self.memory_ax.grid(True, alpha=0.3)
+        self.memory_ax.set_ylim(0, 100)
+        self.memory_ax.set_xlim(0, HISTORY_SIZE)
+        
+        self.memory_line, = self.memory_ax.plot([], [], color='#4ecdc4', linewidth=2)
+        self.memory_fill = self.memory_ax.add_patch(Polygon(np.zeros((1, 2)), alpha=0.3, color='#4ecdc4'))
         
         memory_canvas = FigureCanvasTkAgg(self.memory_fig, tab_frame)
         memory_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self.memory_blit = BlitManager(memory_canvas, [self.memory_fill, self.memory_line])
         
         # Memory details
         memory_details_frame = tk.Frame(tab_frame, bg="#16213e")
@@ -402,6 +501,7 @@ class SystemAnalyzer:
         """Create disk monitoring tab"""
         tab_frame = ttk.Frame(self.notebook)
         self.notebook.add(tab_frame, text="💽 Disk")
+        self.disk_tab = tab_frame
         
         # Disk usage frame
         disk_frame = tk.Frame(tab_frame, bg="#1a1a2e")
@@ -414,6 +514,7 @@ class SystemAnalyzer:
         """Create network monitoring tab"""
         tab_frame = ttk.Frame(self.notebook)
         self.notebook.add(tab_frame, text="🌐 Network")
+        self.network_tab = tab_frame
         
         # Network stats frame
         network_frame = tk.Frame(tab_frame, bg="#1a1a2e")
@@ -571,13 +672,22 @@ class SystemAnalyzer:
         if messagebox.askyesno("Terminate Process", 
                               f"Are you sure you want to terminate '{process_name}' (PID: {pid})?"):
             try:
-                process = psutil.Process(pid)
+                process = self.get_process(pid)
                 process.terminate()
                 messagebox.showinfo("Success", f"Process '{process_name}' terminated successfully.")
                 self.refresh_processes()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to terminate process: {str(e)}")
                 
+    def get_process(self, pid):
+        """Return the listed Process for a PID, or a fresh one if it is gone"""
+        process = self.process_cache.get(pid)
+        # is_running() also checks the creation time, so a reused PID is not mistaken for it
+        if process is None or not process.is_running():
+            process = psutil.Process(pid)
+            self.process_cache[pid] = process
+        return process
+        
     def show_process_details(self):
         """Show detailed process information"""
         selection = self.process_tree.selection()
@@ -588,8 +698,11 @@ class SystemAnalyzer:
         pid = int(item['values'][0])
         
         try:
-            process = psutil.Process(pid)
-            details = f"""Process Details:
+            process = self.get_process(pid)
+            # oneshot() reads the process's kernel stats once for all of the fields below
+            with process.oneshot():
+                cmdline = process.cmdline()
+                details = f"""Process Details:
             
 PID: {process.pid}
 Name: {process.name()}
@@ -598,7 +711,7 @@ CPU%: {process.cpu_percent()}%
 Memory%: {process.memory_percent():.2f}%
 Memory Info: {process.memory_info().rss / 1024 / 1024:.2f} MB
 Create Time: {datetime.fromtimestamp(process.create_time()).strftime('%Y-%m-%d %H:%M:%S')}
-Command Line: {' '.join(process.cmdline()) if process.cmdline() else 'N/A'}
+Command Line: {' '.join(cmdline) if cmdline else 'N/A'}
 """
             messagebox.showinfo("Process Details", details)
         except Exception as e:
@@ -614,268 +727,385 @@ Command Line: {' '.join(process.cmdline()) if process.cmdline() else 'N/A'}
         }
         
     def start_monitoring(self):
-        """Start system monitoring thread"""
+        """Start the once-a-second monitoring tick on the Tk event loop"""
         self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self.monitor_system, daemon=True)
-        self.monitor_thread.start()
+        # Prime psutil's CPU counters; each later call measures since the previous one
+        psutil.cpu_percent(interval=None)
+        self.root.after(1000, self.monitor_system)
+        self.update_disk_card()
         
     def monitor_system(self):
-        """Main monitoring loop"""
-        while self.monitoring:
-            try:
-                # Get system metrics
-                cpu_percent = psutil.cpu_percent(interval=1)
-                memory = psutil.virtual_memory()
-                
-                # Update history
-                self.cpu_history.append(cpu_percent)
-                self.memory_history.append(memory.percent)
-                
-                # Update UI in main thread
-                self.root.after(0, self.update_ui, cpu_percent, memory)
-                
-                # Check thresholds
-                self.check_thresholds(cpu_percent, memory.percent)
-                
-            except Exception as e:
-                print(f"Monitoring error: {e}")
-                
-            time.sleep(1)
+        """Take one monitoring sample and schedule the next"""
+        if not self.monitoring:
+            return
             
-    def update_ui(self, cpu_percent, memory):
+        try:
+            # Get system metrics (non-blocking)
+            sample = self.collect_sample()
+            
+            # Update history
+            self.push_history(self.cpu_history, sample['cpu'])
+            self.push_history(self.memory_history, sample['memory'].percent)
+            self.history_count = min(self.history_count + 1, HISTORY_SIZE)
+            
+            # Update UI
+            self.update_ui(sample)
+            
+            # Check thresholds
+            self.check_thresholds(sample['cpu'], sample['memory'].percent)
+        
+        except Exception as e:
+            # A failing psutil call fails again every tick; report it at most every 10 seconds
+            now = time.monotonic()
+            if now - self.monitor_error_reported >= 10:
+                self.monitor_error_reported = now
+                print(f"Monitoring error: {e}")
+        
+        self.root.after(1000, self.monitor_system)
+        
+    def collect_sample(self):
+        """Read the counters shared by the cards, graphs and tabs, once per tick"""
+        # Send/receive rates since the previous sample
+        now = time.monotonic()
+        net_io = psutil.net_io_counters()
+        elapsed = now - self.last_net_time
+        if elapsed > 0:
+            self.net_rates = ((net_io.bytes_sent - self.last_net_io.bytes_sent) / elapsed / 1024**2,
+                              (net_io.bytes_recv - self.last_net_io.bytes_recv) / elapsed / 1024**2)
+        self.last_net_io = net_io
+        self.last_net_time = now
+        
+        return {
+            'cpu': psutil.cpu_percent(interval=None),
+            'memory': psutil.virtual_memory(),
+            'net_io': net_io,
+            'net_rates': self.net_rates
+        }
+        
+    def update_ui(self, sample):
         """Update UI with current metrics"""
         try:
             # Update overview cards
-            self.update_overview_cards(cpu_percent, memory)
-            
-            # Update graphs
-            self.update_cpu_graph()
-            self.update_memory_graph()
+            self.update_overview_cards(sample)
             
-            # Update detailed tabs
-            self.update_cpu_details()
-            self.update_memory_details(memory)
-            self.update_disk_details()
-            self.update_network_details()
+            # Update graphs and details on the visible tab only
+            self.last_sample = sample
+            self.update_visible_tab()
             
             # Update status
-            self.last_update_label.config(text=f"Last update: {datetime.now().strftime('%H:%M:%S')}")
+            self.last_update_label.config(text=time.strftime("Last update: %H:%M:%S"))
             
         except Exception as e:
             print(f"UI update error: {e}")
+        
+    def update_visible_tab(self):
+        """Refresh the graph and details of the selected tab"""
+        current_tab = self.notebook.select()
+        
+        if current_tab == str(self.cpu_tab):
+            self.update_cpu_graph()
+            self.update_cpu_details(psutil.cpu_freq())
+        elif current_tab == str(self.memory_tab):
+            self.update_memory_graph()
+            self.update_memory_details(self.last_sample['memory'])
+        elif current_tab == str(self.disk_tab):
+            self.update_disk_details()
+        elif current_tab == str(self.network_tab):
+            self.update_network_details(self.last_sample['net_io'], self.last_sample['net_rates'])
+        
+    def on_tab_changed(self, event):
+        """Bring the newly selected tab up to date instead of waiting for the next tick"""
+        if self.last_sample is None:
+            return
+        
+        try:
+            self.update_visible_tab()
+        except Exception as e:
+            print(f"UI update error: {e}")
             
-    def update_overview_cards(self, cpu_percent, memory):
+    def update_overview_cards(self, sample):
         """Update overview cards with current metrics"""
+        cpu_percent = sample['cpu']
+        memory = sample['memory']
+        
         # CPU card
-        self.cpu_card.value_label.config(text=f"{cpu_percent:.1f}%")
-        self.cpu_card.progress_var.set(cpu_percent)
-        self.cpu_card.info_label.config(text=f"Cores: {psutil.cpu_count()}")
+        self.set_card(self.cpu_card, f"{cpu_percent:.1f}%", cpu_percent,
+                      f"Cores: {self.cpu_count_logical}")
         
         # Memory card
-        self.memory_card.value_label.config(text=f"{memory.percent:.1f}%")
-        self.memory_card.progress_var.set(memory.percent)
-        self.memory_card.info_label.config(text=f"Available: {memory.available / 1024**3:.1f} GB")
-        
-        # Disk card
-        disk = psutil.disk_usage('/')
-        disk_percent = (disk.used / disk.total) * 100
-        self.disk_card.value_label.config(text=f"{disk_percent:.1f}%")
-        self.disk_card.progress_var.set(disk_percent)
-        self.disk_card.info_label.config(text=f"Free: {disk.free / 1024**3:.1f} GB")
-        
-        # Network card
-        net_io = psutil.net_io_counters()
-        self.network_card.value_label.config(text="Active")
-        self.network_card.progress_var.set(50)  # Placeholder for network activity
-        self.network_card.info_label.config(text=f"Sent: {net_io.bytes_sent / 1024**2:.1f} MB")
+        self.set_card(self.memory_card, f"{memory.percent:.1f}%", memory.percent,
+                      f"Available: {memory.available / 1024**3:.1f} GB")
         
-    def update_cpu_graph(self):
-        """Update CPU usage graph"""
-        if len(self.cpu_history) < 2:
+        # Network card, showing traffic since the previous tick
+        net_io = sample['net_io']
+        rate_mb = sum(sample['net_rates'])
+        
+        self.set_card(self.network_card, f"{rate_mb:.2f} MB/s",
+                      min(rate_mb * 10, 100),  # Scale for visualization
+                      f"Sent: {net_io.bytes_sent / 1024**2:.1f} MB")
+        
+    def update_disk_card(self):
+        """Update the root disk card, on its own 10 second timer as free space changes slowly"""
+        if not self.monitoring:
             return
-            
-        self.cpu_ax.clear()
         
-        # Configure plot
-        self.cpu_ax.set_facecolor('#1a1a2e')
-        self.cpu_ax.set_title('CPU Usage History', color='white', size=14, weight='bold')
-        self.cpu_ax.set_xlabel('Time (seconds ago)', color='white')
-        self.cpu_ax.set_ylabel('Usage (%)', color='white')
-        self.cpu_ax.tick_params(colors='white')
-        self.cpu_ax.grid(True, alpha=0.3)
+        try:
+            disk = psutil.disk_usage('/')
+            disk_percent = disk.percent
+            self.set_card(self.disk_card, f"{disk_percent:.1f}%", disk_percent,
+                          f"Free: {disk.free / 1024**3:.1f} GB")
+        except Exception as e:
+            print(f"Disk card update error: {e}")
         
-        # Plot data
-        x_data = list(range(len(self.cpu_history)-1, -1, -1))
-        self.cpu_ax.plot(x_data, list(self.cpu_history), color='#ff6b6b', linewidth=2)
-        self.cpu_ax.fill_between(x_data, list(self.cpu_history), alpha=0.3, color='#ff6b6b')
+        self.root.after(10000, self.update_disk_card)
         
-        # Set limits
-        self.cpu_ax.set_ylim(0, 100)
-        self.cpu_ax.set_xlim(0, 60)
+    def set_card(self, card, value_text, progress, info_text):
+        """Update a metric card, skipping Tk calls for parts that look the same"""
+        if value_text != card.value_text:
+            card.value_label.config(text=value_text)
+            card.value_text = value_text
+        
+        if abs(progress - card.progress) >= PROGRESS_STEP:
+            card.progress_var.set(progress)
+            card.progress = progress
+        
+        if info_text != card.info_text:
+            card.info_label.config(text=info_text)
+            card.info_text = info_text
         
-        self.cpu_fig.tight_layout()
-        self.cpu_fig.canvas.draw()
+    def push_history(self, history, value):
+        """Append a reading to a history array in place, dropping the oldest"""
+        history[:-1] = history[1:]
+        history[-1] = value
+        
+    def update_cpu_graph(self):
+        """Update CPU usage graph"""
+        if self.history_count < 2:
+            return
+            
+        self.set_history_plot(self.cpu_line, self.cpu_fill, self.cpu_history)
+        self.cpu_blit.update()
         
     def update_memory_graph(self):
         """Update memory usage graph"""
-        if len(self.memory_history) < 2:
+        if self.history_count < 2:
             return
             
-        self.memory_ax.clear()
+        self.set_history_plot(self.memory_line, self.memory_fill, self.memory_history)
+        self.memory_blit.update()
         
-        # Configure plot
-        self.memory_ax.set_facecolor('#1a1a2e')
-        self.memory_ax.set_title('Memory Usage History', color='white', size=14, weight='bold')
-        self.memory_ax.set_xlabel('Time (seconds ago)', color='white')
-        self.memory_ax.set_ylabel('Usage (%)', color='white')
-        self.memory_ax.tick_params(colors='white')
-        self.memory_ax.grid(True, alpha=0.3)
-        
-        # Plot data
-        x_data = list(range(len(self.memory_history)-1, -1, -1))
-        self.memory_ax.plot(x_data, list(self.memory_history), color='#4ecdc4', linewidth=2)
-        self.memory_ax.fill_between(x_data, list(self.memory_history), alpha=0.3, color='#4ecdc4')
+    def set_history_plot(self, line, fill, history):
+        """Point a history graph's line and fill at the latest readings"""
+        # Views of the filled part of the history; nothing is copied
+        y_data = history[-self.history_count:]
+        x_data = HISTORY_X[-self.history_count:]
         
-        # Set limits
-        self.memory_ax.set_ylim(0, 100)
-        self.memory_ax.set_xlim(0, 60)
+        line.set_data(x_data, y_data)
+        # Fill outline: along the line, then back along the zero baseline
+        fill.set_xy(np.column_stack((np.r_[x_data, x_data[::-1]], np.r_[y_data, np.zeros(len(y_data))])))
         
-        self.memory_fig.tight_layout()
-        self.memory_fig.canvas.draw()
-        
-    def update_cpu_details(self):
+    def update_cpu_details(self, cpu_freq):
         """Update CPU detailed information"""
         try:
-            cpu_freq = psutil.cpu_freq()
-            cpu_count_logical = psutil.cpu_count(logical=True)
-            cpu_count_physical = psutil.cpu_count(logical=False)
-            
-            self.cpu_cores_label.config(
-                text=f"Cores: {cpu_count_physical} physical, {cpu_count_logical} logical")
-            
             if cpu_freq:
                 self.cpu_freq_label.config(
                     text=f"Frequency: {cpu_freq.current:.2f} MHz")
             else:
                 self.cpu_freq_label.config(text="Frequency: N/A")
-        except:
-            pass
+        except (psutil.Error, OSError, tk.TclError) as e:
+            print(f"CPU details update error: {e}")
             
     def update_memory_details(self, memory):
         """Update memory detailed information"""
         try:
             self.memory_total_label.config(
                 text=f"Total: {memory.total / 1024**3:.2f} GB | Used: {memory.used / 1024**3:.2f} GB")
+            # psutil only reports cached memory on Linux and BSD
+            cached = getattr(memory, 'cached', None)
+            cached_text = f"{cached / 1024**3:.2f} GB" if cached is not None else "N/A"
             self.memory_available_label.config(
-                text=f"Available: {memory.available / 1024**3:.2f} GB | Cached: {memory.cached / 1024**3:.2f} GB")
-        except:
-            pass
+                text=f"Available: {memory.available / 1024**3:.2f} GB | Cached: {cached_text}")
+        except (psutil.Error, OSError, tk.TclError) as e:
+            print(f"Memory details update error: {e}")
             
     def update_disk_details(self):
-        """Update disk usage details"""
+        """Start reading disk usage details, at most every 5 seconds"""
+        # Drive usage changes slowly; the cards keep showing the last reading
+        now = time.monotonic()
+        if now < self.disk_details_next:
+            return
+        self.disk_details_next = now + 5
+        
+        # A drive that stopped responding still holds the last read; wait for it
+        if self.disk_read is not None and not self.disk_read.done():
+            return
+        
+        # A daemon thread, so a read stuck on a dead mount cannot hold up exit
+        self.disk_read = Future()
+        threading.Thread(target=self.read_disks, args=(self.disk_read,), daemon=True).start()
+        self.root.after(100, self.show_disk_details, self.disk_read)
+        
+    def read_disks(self, future):
+        """Read the usage of every mounted drive into future, off the Tk thread"""
         try:
-            # Clear existing widgets
-            for widget in self.disk_info_frame.winfo_children():
-                widget.destroy()
-                
-            # Get disk information for all mounted drives
-            partitions = psutil.disk_partitions()
-            
-            for i, partition in enumerate(partitions):
+            drives = []
+            for partition in psutil.disk_partitions():
                 try:
-                    disk_usage = psutil.disk_usage(partition.mountpoint)
-                    
-                    # Create disk card
-                    disk_card = tk.Frame(self.disk_info_frame, bg="#16213e", relief="raised", bd=1)
-                    disk_card.pack(fill="x", padx=10, pady=5)
-                    
-                    # Disk info
-                    info_frame = tk.Frame(disk_card, bg="#16213e")
-                    info_frame.pack(fill="x", padx=15, pady=10)
-                    
-                    # Disk name and mount point
-                    tk.Label(info_frame, 
-                            text=f"Drive: {partition.device} ({partition.mountpoint})",
-                            font=("SF Pro Display", 12, "bold"),
-                            fg="#ffe66d", bg="#16213e").pack(anchor="w")
-                    
-                    # Usage information
-                    total_gb = disk_usage.total / 1024**3
-                    used_gb = disk_usage.used / 1024**3
-                    free_gb = disk_usage.free / 1024**3
-                    percent_used = (disk_usage.used / disk_usage.total) * 100
-                    
-                    usage_text = f"Used: {used_gb:.2f} GB | Free: {free_gb:.2f} GB | Total: {total_gb:.2f} GB"
-                    tk.Label(info_frame, text=usage_text,
-                            font=("SF Pro Display", 10),
-                            fg="#a8e6cf", bg="#16213e").pack(anchor="w")
-                    
-                    # Progress bar
-                    progress_frame = tk.Frame(info_frame, bg="#16213e")
-                    progress_frame.pack(fill="x", pady=(5, 0))
-                    
-                    progress_var = tk.DoubleVar()
-                    progress_var.set(percent_used)
-                    progress_bar = ttk.Progressbar(progress_frame, variable=progress_var,
-                                                 maximum=100, length=300)
-                    progress_bar.pack(side="left")
-                    
-                    tk.Label(progress_frame, text=f"{percent_used:.1f}%",
-                            font=("SF Pro Display", 10, "bold"),
-                            fg="#ff6b6b" if percent_used > 80 else "#4ecdc4", 
-                            bg="#16213e").pack(side="right", padx=(10, 0))
-                    
-                except PermissionError:
+                    drives.append((partition, psutil.disk_usage(partition.mountpoint)))
+                except (psutil.Error, OSError):
                     continue
-        except:
-            pass
+            future.set_result(drives)
+        except Exception as e:
+            future.set_exception(e)
+        
+    def show_disk_details(self, future):
+        """Show the drive usage read by read_disks, polling until it is ready"""
+        if not self.monitoring:
+            return
+        
+        # Polled from the Tk thread; the reader itself never touches Tk
+        if not future.done():
+            self.root.after(100, self.show_disk_details, future)
+            return
+        
+        try:
+            mounted = set()
+            
+            for partition, disk_usage in future.result():
+                # Cards are built once per drive and then only updated
+                mounted.add(partition.mountpoint)
+                card = self.disk_cards.get(partition.mountpoint)
+                if card is None:
+                    card = self.create_disk_card(partition)
+                    self.disk_cards[partition.mountpoint] = card
+                
+                # Usage information
+                total_gb = disk_usage.total / 1024**3
+                used_gb = disk_usage.used / 1024**3
+                free_gb = disk_usage.free / 1024**3
+                percent_used = disk_usage.percent
+                
+                card['usage'].config(
+                    text=f"Used: {used_gb:.2f} GB | Free: {free_gb:.2f} GB | Total: {total_gb:.2f} GB")
+                card['progress_var'].set(percent_used)
+                card['percent'].config(text=f"{percent_used:.1f}%",
+                                       fg="#ff6b6b" if percent_used > 80 else "#4ecdc4")
             
-    def update_network_details(self):
+            # Drop cards of drives that were unmounted
+            for mountpoint in list(self.disk_cards):
+                if mountpoint not in mounted:
+                    self.disk_cards.pop(mountpoint)['frame'].destroy()
+        except (psutil.Error, OSError, tk.TclError) as e:
+            print(f"Disk details update error: {e}")
+            
+    def create_disk_card(self, partition):
+        """Create the widgets showing one drive's usage"""
+        disk_card = tk.Frame(self.disk_info_frame, bg="#16213e", relief="raised", bd=1)
+        disk_card.pack(fill="x", padx=10, pady=5)
+        
+        # Disk info
+        info_frame = tk.Frame(disk_card, bg="#16213e")
+        info_frame.pack(fill="x", padx=15, pady=10)
+        
+        # Disk name and mount point
+        tk.Label(info_frame, 
+                text=f"Drive: {partition.device} ({partition.mountpoint})",
+                font=("SF Pro Display", 12, "bold"),
+                fg="#ffe66d", bg="#16213e").pack(anchor="w")
+        
+        # Usage information
+        usage_label = tk.Label(info_frame, text="",
+                              font=("SF Pro Display", 10),
+                              fg="#a8e6cf", bg="#16213e")
+        usage_label.pack(anchor="w")
+        
+        # Progress bar
+        progress_frame = tk.Frame(info_frame, bg="#16213e")
+        progress_frame.pack(fill="x", pady=(5, 0))
+        
+        progress_var = tk.DoubleVar()
+        progress_bar = ttk.Progressbar(progress_frame, variable=progress_var,
+                                     maximum=100, length=300)
+        progress_bar.pack(side="left")
+        
+        percent_label = tk.Label(progress_frame, text="",
+                                font=("SF Pro Display", 10, "bold"),
+                                bg="#16213e")
+        percent_label.pack(side="right", padx=(10, 0))
+        
+        return {
+            'frame': disk_card,
+            'usage': usage_label,
+            'progress_var': progress_var,
+            'percent': percent_label
+        }
+        
+    def update_network_details(self, net_io, net_rates):
         """Update network usage details"""
         try:
-            net_io = psutil.net_io_counters()
+            sent_rate, recv_rate = net_rates
             
-            # Calculate rates (simplified)
-            sent_mb = net_io.bytes_sent / 1024**2
-            recv_mb = net_io.bytes_recv / 1024**2
+            texts = (
+                f"📤 Sending: {sent_rate:.2f} MB/s | Total Sent: {net_io.bytes_sent / 1024**2:.1f} MB",
+                f"📥 Receiving: {recv_rate:.2f} MB/s | Total Received: {net_io.bytes_recv / 1024**2:.1f} MB"
+            )
             
-            self.network_sent_label.config(
-                text=f"📤 Total Sent: {sent_mb:.2f} MB | Packets: {net_io.packets_sent:,}")
-            self.network_recv_label.config(
-                text=f"📥 Total Received: {recv_mb:.2f} MB | Packets: {net_io.packets_recv:,}")
+            # Only relabel when the displayed values change
+            if texts != self.network_texts:
+                self.network_texts = texts
+                self.network_sent_label.config(text=texts[0])
+                self.network_recv_label.config(text=texts[1])
             
-        except:
-            pass
+        except (psutil.Error, OSError, tk.TclError) as e:
+            print(f"Network details update error: {e}")
             
     def refresh_processes(self):
         """Refresh process list"""
         try:
-            # Clear existing items
-            for item in self.process_tree.get_children():
-                self.process_tree.delete(item)
-                
-            # Get process list
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
-                try:
-                    processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            # Get process list; process_iter fetches the attrs in one oneshot() pass
+            # per process, skips exited ones and fills denied fields with None
+            processes = psutil.process_iter(
+                ['pid', 'name', 'cpu_percent', 'memory_percent', 'status'], ad_value=None)
                     
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
+            # Top 50 by CPU usage; a bounded heap instead of sorting every process
+            top = heapq.nlargest(50, processes, key=lambda p: p.info['cpu_percent'] or 0)
+            self.process_cache = {proc.pid: proc for proc in top}
+            processes = [proc.info for proc in top]
             
-            # Add to tree (limit to top 50 for performance)
-            for proc in processes[:50]:
-                self.process_tree.insert('', 'end', values=(
+            # Rows keyed by PID
+            rows = {
+                str(proc['pid']): (
                     proc['pid'],
-                    proc['name'][:30],  # Truncate long names
+                    (proc['name'] or "Unknown")[:30],  # Truncate long names
                     f"{proc['cpu_percent'] or 0:.1f}",
                     f"{proc['memory_percent'] or 0:.1f}",
                     proc['status']
-                ))
-        except:
-            pass
+                )
+                for proc in processes
+            }
+            
+            # Apply only the difference: drop exited processes, then update,
+            # move or insert the rest so unchanged rows cost no Tk calls
+            stale = [iid for iid in self.process_tree.get_children() if iid not in rows]
+            if stale:
+                self.process_tree.delete(*stale)
+            
+            order = list(self.process_tree.get_children())
+            for index, (iid, values) in enumerate(rows.items()):
+                if iid in order:
+                    if self.process_rows.get(iid) != values:
+                        self.process_tree.item(iid, values=values)
+                    if order[index] != iid:
+                        self.process_tree.move(iid, '', index)
+                        order.remove(iid)
+                        order.insert(index, iid)
+                else:
+                    self.process_tree.insert('', index, iid=iid, values=values)
+                    order.insert(index, iid)
+            
+            self.process_rows = rows
+        except (psutil.Error, OSError, tk.TclError) as e:
+            print(f"Process list update error: {e}")
             
     def check_thresholds(self, cpu_percent, memory_percent):
         """Check if thresholds are exceeded and show alerts"""
@@ -921,11 +1151,25 @@ Command Line: {' '.join(process.cmdline()) if process.cmdline() else 'N/A'}
         # Update theme (simplified implementation)
         # In a full implementation, you would update all widget colors
         self.dark_mode = not self.dark_mode
+        self.restyle_figures(bg_color, card_color, text_color)
         
         message = "Switched to Light Mode" if not self.dark_mode else "Switched to Dark Mode"
         self.footer_status.config(text=message, fg=accent_color)
         self.root.after(3000, lambda: self.footer_status.config(
             text="System monitoring active", fg="#4ecdc4"))
+        
+    def restyle_figures(self, bg_color, card_color, text_color):
+        """Recolour the existing history figures in place for a theme"""
+        for fig, ax in ((self.cpu_fig, self.cpu_ax), (self.memory_fig, self.memory_ax)):
+            fig.set_facecolor(card_color)
+            ax.set_facecolor(bg_color)
+            ax.title.set_color(text_color)
+            ax.xaxis.label.set_color(text_color)
+            ax.yaxis.label.set_color(text_color)
+            ax.tick_params(colors=text_color)
+            
+            # The full redraw also refreshes the blitted background
+            fig.canvas.draw_idle()
             
     def export_report(self):
         """Export system performance report"""
@@ -941,24 +1185,41 @@ Command Line: {' '.join(process.cmdline()) if process.cmdline() else 'N/A'}
             )
             
             if filename:
-                if filename.endswith('.json'):
-                    with open(filename, 'w') as f:
-                        json.dump(report_data, f, indent=4, default=str)
-                else:
-                    with open(filename, 'w') as f:
-                        f.write(self.format_report_text(report_data))
-                        
-                messagebox.showinfo("Export Complete", f"Report saved to {filename}")
+                # Formatting and writing run on a worker so a slow disk cannot freeze the window
+                future = self.report_writer.submit(self.write_report, filename, report_data)
+                self.root.after(100, self.report_written, future, filename)
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to export report: {str(e)}")
+        
+    def write_report(self, filename, report_data):
+        """Write a report as JSON or text, depending on the file extension"""
+        if filename.endswith('.json'):
+            with open(filename, 'w') as f:
+                json.dump(report_data, f, indent=4, default=str)
+        else:
+            with open(filename, 'w') as f:
+                f.write(self.format_report_text(report_data))
+        
+    def report_written(self, future, filename):
+        """Tell the user how a background report export ended, polling until it has"""
+        # Polled from the Tk thread; the worker itself never touches Tk
+        if not future.done():
+            self.root.after(100, self.report_written, future, filename)
+            return
+        
+        try:
+            future.result()
+            messagebox.showinfo("Export Complete", f"Report saved to {filename}")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export report: {str(e)}")
             
     def generate_report_data(self):
         """Generate comprehensive system report data"""
-        system_info = self.get_system_info()
+        system_info = self.system_info
         cpu_info = {
-            'usage_percent': list(self.cpu_history)[-1] if self.cpu_history else 0,
-            'cores_physical': psutil.cpu_count(logical=False),
-            'cores_logical': psutil.cpu_count(logical=True),
+            'usage_percent': self.cpu_history[-1] if self.history_count else 0,
+            'cores_physical': self.cpu_count_physical,
+            'cores_logical': self.cpu_count_logical,
             'frequency': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None
         }
         
@@ -980,9 +1241,9 @@ Command Line: {' '.join(process.cmdline()) if process.cmdline() else 'N/A'}
                     'total_gb': disk_usage.total / 1024**3,
                     'used_gb': disk_usage.used / 1024**3,
                     'free_gb': disk_usage.free / 1024**3,
-                    'percent': (disk_usage.used / disk_usage.total) * 100
+                    'percent': disk_usage.percent
                 })
-            except:
+            except (psutil.Error, OSError):
                 continue
                 
         net_io = psutil.net_io_counters()
@@ -1013,7 +1274,8 @@ Command Line: {' '.join(process.cmdline()) if process.cmdline() else 'N/A'}
         
     def format_report_text(self, data):
         """Format report data as readable text"""
-        report = f"""SYSTEM PERFORMANCE REPORT
+        # Sections are collected and joined once instead of growing one string
+        parts = [f"""SYSTEM PERFORMANCE REPORT
 Generated: {data['timestamp']}
 Team: {data['team_info']['name']} ({data['team_info']['id']})
 
@@ -1033,16 +1295,15 @@ Used: {data['memory']['used_gb']:.2f} GB
 Available: {data['memory']['available_gb']:.2f} GB
 Usage: {data['memory']['percent']:.1f}%
 
-=== DISK INFORMATION ==="""
+=== DISK INFORMATION ==="""]
 
-        for disk in data['disk']:
-            report += f"""
+        parts.extend(f"""
 Drive: {disk['device']} ({disk['mountpoint']})
   Total: {disk['total_gb']:.2f} GB
   Used: {disk['used_gb']:.2f} GB ({disk['percent']:.1f}%)
-  Free: {disk['free_gb']:.2f} GB"""
+  Free: {disk['free_gb']:.2f} GB""" for disk in data['disk'])
 
-        report += f"""
+        parts.append(f"""
 
 === NETWORK INFORMATION ===
 Bytes Sent: {data['network']['bytes_sent']:,}
@@ -1050,14 +1311,13 @@ Bytes Received: {data['network']['bytes_recv']:,}
 Packets Sent: {data['network']['packets_sent']:,}
 Packets Received: {data['network']['packets_recv']:,}
 
-=== TEAM MEMBERS ==="""
+=== TEAM MEMBERS ===""")
 
-        for member in data['team_info']['members']:
-            report += f"""
+        parts.extend(f"""
 {member['name']} (ID: {member['id']})
-Email: {member['email']}"""
+Email: {member['email']}""" for member in data['team_info']['members'])
 
-        return report
+        return "".join(parts)
         
     def open_process_manager(self):
         """Switch to process tab"""
@@ -1226,6 +1486,9 @@ Email: {member['email']}"""
     def on_closing(self):
         """Handle application closing"""
         self.monitoring = False
+        # A report still being written finishes before the process exits;
+        # joining it here would only hold the window open until then
+        self.report_writer.shutdown(wait=False)
         self.root.destroy()
 def main():
     """Main application entry point"""